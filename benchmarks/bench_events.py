@@ -0,0 +1,127 @@
+"""Benchmark emit of events with many registered callbacks.
+
+Measures cost of 'EventSystem.emit' with 10, 100 and 1000 registered
+callbacks using exact topics and topics with wildcard. Only one of the
+callbacks matches the emitted topic.
+
+Modules are loaded from files so the benchmark does not require
+dependencies of 'ayon_core.lib'. Use '--compare-rev' to run the same
+benchmark against 'events.py' from other git revision, e.g. revision
+before callbacks were indexed by topic.
+
+Example:
+    python benchmarks/bench_events.py --compare-rev 0efea94^
+"""
+import os
+import sys
+import types
+import argparse
+import subprocess
+import tempfile
+import timeit
+import importlib
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_RELPATH = "client/ayon_core/lib"
+MODULE_FILENAMES = ("events.py", "python_module_tools.py")
+CALLBACK_COUNTS = (10, 100, 1000)
+
+
+def load_events_module(dirpath, package_name):
+    """Load 'events.py' from directory without 'ayon_core.lib' package.
+
+    Args:
+        dirpath (str): Directory with 'events.py' and its dependencies.
+        package_name (str): Unique name of package created for directory.
+
+    Returns:
+        types.ModuleType: Loaded events module.
+    """
+    package = types.ModuleType(package_name)
+    package.__path__ = [dirpath]
+    sys.modules[package_name] = package
+    return importlib.import_module("{}.events".format(package_name))
+
+
+def load_events_module_from_rev(rev):
+    tmp_dir = tempfile.mkdtemp(prefix="ayon_bench_")
+    for filename in MODULE_FILENAMES:
+        content = subprocess.check_output(
+            ["git", "show", "{}:{}/{}".format(rev, LIB_RELPATH, filename)],
+            cwd=REPO_ROOT
+        )
+        with open(os.path.join(tmp_dir, filename), "wb") as stream:
+            stream.write(content)
+    return load_events_module(tmp_dir, "ayon_bench_events_rev")
+
+
+def _callback(event):
+    pass
+
+
+def _create_event_system(module, count, wildcard):
+    event_system = module.EventSystem()
+    for idx in range(count):
+        if wildcard:
+            topic = "group{}.*".format(idx)
+        else:
+            topic = "group{}.changed".format(idx)
+        event_system.add_callback(topic, _callback)
+    return event_system
+
+
+def bench_module(module, number, repeat):
+    results = {}
+    for wildcard in (False, True):
+        label = "wildcard" if wildcard else "exact"
+        for count in CALLBACK_COUNTS:
+            event_system = _create_event_system(module, count, wildcard)
+            duration = min(timeit.repeat(
+                lambda: event_system.emit("group0.changed", {}, "bench"),
+                number=number,
+                repeat=repeat
+            ))
+            key = "{} {} callbacks".format(label, count)
+            results[key] = duration / number
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--compare-rev",
+        help="Git revision of 'events.py' to compare with."
+    )
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    current = load_events_module(
+        os.path.join(REPO_ROOT, LIB_RELPATH), "ayon_bench_events_current"
+    )
+    columns = [("current", bench_module(current, args.number, args.repeat))]
+    if args.compare_rev:
+        previous = load_events_module_from_rev(args.compare_rev)
+        columns.insert(
+            0,
+            (args.compare_rev, bench_module(
+                previous, args.number, args.repeat
+            ))
+        )
+
+    name_width = max(len(key) for key in columns[-1][1])
+    header = "{:<{}}".format("emit", name_width) + "".join(
+        "{:>16}".format(label) for label, _ in columns
+    )
+    print(header)
+    print("-" * len(header))
+    for key in columns[-1][1]:
+        line = "{:<{}}".format(key, name_width)
+        for _, results in columns:
+            line += "{:>13.2f} us".format(results[key] * 1000000)
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
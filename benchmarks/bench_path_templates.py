@@ -0,0 +1,184 @@
+"""Benchmark formatting of typical anatomy templates.
+
+Measures per-format cost of 'StringTemplate.format_strict',
+'StringTemplate.format_strict_template' and formatting of frame paths
+using 'StringTemplate.compile_frame_formatter'.
+
+Module is loaded from file so the benchmark does not require
+dependencies of 'ayon_core.lib'. Use '--compare-rev' to run the same
+benchmark against 'path_templates.py' from other git revision.
+
+Example:
+    python benchmarks/bench_path_templates.py --compare-rev HEAD~1
+"""
+import os
+import sys
+import argparse
+import subprocess
+import tempfile
+import timeit
+import importlib.util
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_RELPATH = "client/ayon_core/lib/path_templates.py"
+
+TEMPLATES = {
+    # Default publish directory and file template of AYON anatomy
+    "publish_default": (
+        "{root[work]}/{project[name]}/{hierarchy}/{folder[name]}"
+        "/publish/{product[type]}/{product[name]}/v{version:0>3}"
+        "/{project[code]}_{folder[name]}_{product[name]}_v{version:0>3}"
+        "<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+    ),
+    "work": (
+        "{root[work]}/{project[name]}/{hierarchy}/{folder[name]}"
+        "/work/{task[name]}"
+        "/{project[code]}_{folder[name]}_{task[name]}"
+        "_v{version:0>3}<_{comment}>.{ext}"
+    ),
+    "hero": (
+        "{root[work]}/{project[name]}/{hierarchy}/{folder[name]}"
+        "/publish/{product[type]}/{product[name]}/hero"
+        "/{project[code]}_{folder[name]}_{product[name]}_hero"
+        "<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+    ),
+    "sequence": (
+        "{root[work]}/{project[name]}/{hierarchy}/{folder[name]}"
+        "/publish/{product[type]}/{product[name]}/v{version:0>3}"
+        "/{project[code]}_{folder[name]}_{product[name]}_v{version:0>3}"
+        ".{frame:0>4}.{ext}"
+    ),
+}
+
+DATA = {
+    "root": {"work": "/mnt/projects"},
+    "project": {"name": "demo_project", "code": "demo"},
+    "hierarchy": "shots/sq010",
+    "folder": {"name": "sh010"},
+    "task": {"name": "compositing"},
+    "product": {"type": "render", "name": "renderCompositingMain"},
+    "version": 12,
+    "output": "exr",
+    "frame": 1001,
+    "ext": "exr",
+}
+
+
+def load_module(filepath, module_name):
+    spec = importlib.util.spec_from_file_location(module_name, filepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_module_from_rev(rev):
+    content = subprocess.check_output(
+        ["git", "show", "{}:{}".format(rev, MODULE_RELPATH)],
+        cwd=REPO_ROOT
+    )
+    tmp_dir = tempfile.mkdtemp(prefix="ayon_bench_")
+    filepath = os.path.join(tmp_dir, "path_templates_rev.py")
+    with open(filepath, "wb") as stream:
+        stream.write(content)
+    return load_module(filepath, "path_templates_rev")
+
+
+def _best_per_call(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def bench_module(module, number, repeat, frames):
+    string_template_cls = module.StringTemplate
+    results = {}
+    for name, template in TEMPLATES.items():
+        template_obj = string_template_cls(template)
+        results["{} format_strict".format(name)] = _best_per_call(
+            lambda: template_obj.format_strict(DATA), number, repeat
+        )
+        results["{} format_strict_template".format(name)] = _best_per_call(
+            lambda: string_template_cls.format_strict_template(
+                template, DATA
+            ),
+            number,
+            repeat
+        )
+
+        if "{frame" not in template:
+            continue
+
+        frame_values = list(range(1001, 1001 + frames))
+
+        def _format_frames_strict():
+            data = dict(DATA)
+            for frame in frame_values:
+                data["frame"] = frame
+                str(template_obj.format_strict(data))
+
+        frames_number = max(1, number // frames)
+        key = "{} {} frames format_strict (per frame)".format(name, frames)
+        results[key] = _best_per_call(
+            _format_frames_strict, frames_number, repeat
+        ) / frames
+
+        # Not available in older revisions
+        if not hasattr(template_obj, "compile_frame_formatter"):
+            continue
+
+        def _format_frames_compiled():
+            formatter = template_obj.compile_frame_formatter(DATA)
+            formatter.format_many(frame_values)
+
+        key = "{} {} frames compile_frame_formatter (per frame)".format(
+            name, frames
+        )
+        results[key] = _best_per_call(
+            _format_frames_compiled, frames_number, repeat
+        ) / frames
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--compare-rev",
+        help="Git revision of 'path_templates.py' to compare with."
+    )
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=100)
+    args = parser.parse_args()
+
+    current = load_module(
+        os.path.join(REPO_ROOT, MODULE_RELPATH), "path_templates_current"
+    )
+    columns = [
+        ("current", bench_module(
+            current, args.number, args.repeat, args.frames
+        ))
+    ]
+    if args.compare_rev:
+        previous = load_module_from_rev(args.compare_rev)
+        columns.insert(0, (args.compare_rev, bench_module(
+            previous, args.number, args.repeat, args.frames
+        )))
+
+    name_width = max(len(key) for key in columns[-1][1])
+    header = "{:<{}}".format("benchmark", name_width) + "".join(
+        "{:>16}".format(label) for label, _ in columns
+    )
+    print(header)
+    print("-" * len(header))
+    for key in columns[-1][1]:
+        line = "{:<{}}".format(key, name_width)
+        for _, results in columns:
+            value = results.get(key)
+            if value is None:
+                line += "{:>16}".format("-")
+            else:
+                line += "{:>13.2f} us".format(value * 1000000)
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""Benchmark import of plugin files with and without parallel pre-read.
+
+Creates synthetic directory of plugin files and imports them using
+'import_filepath' the same way as plugins discovery does. Files are
+read during import, pre-read in parallel by 'preread_python_files' and
+pre-read only if default checks of 'preread_python_files' allow it.
+
+Latency of network filesystem can be simulated with '--latency-ms',
+which delays each open of a file.
+
+Module is loaded from file so the benchmark does not require
+dependencies of 'ayon_core.lib'.
+
+Example:
+    python benchmarks/bench_plugins_preread.py --files 500 --latency-ms 1
+"""
+import os
+import sys
+import io
+import _io
+import time
+import shutil
+import argparse
+import builtins
+import tempfile
+import importlib.util
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_RELPATH = "client/ayon_core/lib/python_module_tools.py"
+
+PLUGIN_TEMPLATE = '''import os
+import collections
+
+
+class CollectPlugin{idx}:
+    label = "Collect plugin {idx}"
+    order = {idx}
+    families = ["render", "review"]
+
+    def process(self, instance):
+        data = collections.OrderedDict()
+        data["path"] = os.path.join("root", "{idx}")
+        return data
+'''
+
+
+def load_module(filepath, module_name):
+    spec = importlib.util.spec_from_file_location(module_name, filepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_plugins_dir(root, count):
+    for idx in range(count):
+        filepath = os.path.join(root, "plugin_{}.py".format(idx))
+        with open(filepath, "w") as stream:
+            stream.write(PLUGIN_TEMPLATE.format(idx=idx))
+
+
+def patch_latency(latency):
+    """Delay each open of a file to simulate network filesystem."""
+    orig_open = builtins.open
+    orig_open_code = io.open_code
+
+    def _open(*args, **kwargs):
+        time.sleep(latency)
+        return orig_open(*args, **kwargs)
+
+    def _open_code(*args, **kwargs):
+        time.sleep(latency)
+        return orig_open_code(*args, **kwargs)
+
+    # Import system uses 'open_code' from '_io' module
+    builtins.open = _open
+    io.open_code = _io.open_code = _open_code
+
+    def _restore():
+        builtins.open = orig_open
+        io.open_code = _io.open_code = orig_open_code
+    return _restore
+
+
+def import_files(module_tools, filepaths, preread):
+    """Import files.
+
+    Args:
+        module_tools (types.ModuleType): Loaded 'python_module_tools'.
+        filepaths (list[str]): Paths to import.
+        preread (Union[bool, None]): Pre-read files in parallel, 'None'
+            uses default behavior of 'preread_python_files'.
+    """
+    preread_files = {}
+    if preread is not False:
+        preread_files = module_tools.preread_python_files(
+            filepaths, enabled=preread
+        )
+    for filepath in filepaths:
+        module_tools.import_filepath(
+            filepath, preread=preread_files.get(filepath)
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated latency of each file open in milliseconds."
+    )
+    args = parser.parse_args()
+
+    module_tools = load_module(
+        os.path.join(REPO_ROOT, MODULE_RELPATH), "python_module_tools"
+    )
+
+    root = tempfile.mkdtemp(prefix="ayon_bench_plugins_")
+    try:
+        create_plugins_dir(root, args.files)
+        filepaths = sorted(
+            os.path.join(root, filename)
+            for filename in os.listdir(root)
+        )
+        # Warm up filesystem cache and create bytecode if allowed
+        import_files(module_tools, filepaths, False)
+
+        restore = None
+        if args.latency_ms:
+            restore = patch_latency(args.latency_ms / 1000.0)
+
+        try:
+            results = {}
+            for label, preread in (
+                ("sequential read", False),
+                ("parallel pre-read", True),
+                ("default", None),
+            ):
+                durations = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    import_files(module_tools, filepaths, preread)
+                    durations.append(time.perf_counter() - start)
+                results[label] = min(durations)
+        finally:
+            if restore is not None:
+                restore()
+
+    finally:
+        shutil.rmtree(root)
+
+    print("{} files, {} ms latency per open".format(
+        args.files, args.latency_ms
+    ))
+    for label, duration in results.items():
+        print("{:<20}{:>10.1f} ms".format(label, duration * 1000))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Benchmark remapping of many paths to other platform.
+
+Measures remapping of paths from windows roots to linux roots with
+'AnatomyRoots.path_remapper' called for each path and with
+'AnatomyRoots.remap_paths' called once for all paths.
+
+Modules are loaded from files so the benchmark does not require
+dependencies of 'ayon_core'. Only 'Logger' of 'ayon_core.lib' is
+replaced with standard python logging.
+
+Example:
+    python benchmarks/bench_remap_paths.py --paths 100000
+"""
+import os
+import sys
+import time
+import types
+import logging
+import argparse
+import importlib.util
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLIENT_ROOT = os.path.join(REPO_ROOT, "client", "ayon_core")
+ROOTS_COUNTS = (3, 20)
+
+
+def load_module(filepath, module_name):
+    spec = importlib.util.spec_from_file_location(module_name, filepath)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_roots_module():
+    """Load 'roots.py' with minimal 'ayon_core.lib' package."""
+    ayon_core = types.ModuleType("ayon_core")
+    ayon_core.__path__ = []
+    lib = types.ModuleType("ayon_core.lib")
+    lib.__path__ = []
+    lib.Logger = types.SimpleNamespace(get_logger=logging.getLogger)
+    sys.modules["ayon_core"] = ayon_core
+    sys.modules["ayon_core.lib"] = lib
+    lib.path_templates = load_module(
+        os.path.join(CLIENT_ROOT, "lib", "path_templates.py"),
+        "ayon_core.lib.path_templates"
+    )
+    return load_module(
+        os.path.join(CLIENT_ROOT, "pipeline", "anatomy", "roots.py"),
+        "ayon_bench_roots"
+    )
+
+
+def create_roots(module, count):
+    roots = {}
+    for idx in range(count):
+        name = "root{}".format(idx)
+        roots[name] = module.RootItem(
+            None,
+            {
+                "windows": "P:/projects_{}".format(idx),
+                "linux": "/mnt/projects_{}".format(idx),
+                "darwin": "/Volumes/projects_{}".format(idx),
+            },
+            name
+        )
+    return roots
+
+
+def create_paths(roots_count, paths_count):
+    return [
+        (
+            "P:/projects_{}/demo/shots/sq010/sh{:0>4}"
+            "/publish/render/renderMain/v001/sh{:0>4}.{:0>4}.exr"
+        ).format(idx % roots_count, idx % 1000, idx % 1000, idx)
+        for idx in range(paths_count)
+    ]
+
+
+def _best_duration(func, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--paths", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    module = load_roots_module()
+    anatomy_roots = module.AnatomyRoots(None)
+
+    print("{} paths remapped from windows to linux".format(args.paths))
+    print("{:<10}{:>18}{:>18}".format(
+        "roots", "path_remapper", "remap_paths"
+    ))
+    print("-" * 46)
+    for roots_count in ROOTS_COUNTS:
+        roots = create_roots(module, roots_count)
+        paths = create_paths(roots_count, args.paths)
+        expected = [
+            anatomy_roots.path_remapper(path, "linux", roots=roots)
+            for path in paths
+        ]
+        result = list(anatomy_roots.remap_paths(paths, "linux", roots=roots))
+        if result != expected:
+            raise AssertionError("Results of remapping are different.")
+
+        loop_duration = _best_duration(
+            lambda: [
+                anatomy_roots.path_remapper(path, "linux", roots=roots)
+                for path in paths
+            ],
+            args.repeat
+        )
+        batch_duration = _best_duration(
+            lambda: list(
+                anatomy_roots.remap_paths(paths, "linux", roots=roots)
+            ),
+            args.repeat
+        )
+        print("{:<10}{:>15.1f} ms{:>15.1f} ms".format(
+            roots_count, loop_duration * 1000, batch_duration * 1000
+        ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
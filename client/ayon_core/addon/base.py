@@ -6,6 +6,7 @@ import sys
 import time
 import inspect
 import logging
+import functools
 import threading
 import collections
 from uuid import uuid4
@@ -21,6 +22,8 @@ from ayon_core.lib import (
     is_dev_mode_enabled,
     get_launcher_storage_dir,
     is_headless_mode_enabled,
+    profile_section,
+    add_startup_profile_report,
 )
 from ayon_core.settings import get_studio_settings
 
@@ -28,6 +31,11 @@ from .interfaces import (
     IPluginPaths,
     IHostAddon,
 )
+from .manifest import (
+    load_manifest,
+    save_manifest,
+    remove_manifest,
+)
 
 # Files that will be always ignored on addons import
 IGNORED_FILENAMES = {
@@ -41,6 +49,17 @@ IGNORED_DEFAULT_FILENAMES = {
     "click_wrap.py",
 }
 
+# Enable lazy initialization of addons in 'AddonsManager'
+ADDONS_LAZY_INIT_ENV_KEY = "AYON_ADDONS_LAZY_INIT"
+# Manifest type with addon classes used by lazy initialization
+ADDON_CLASSES_MANIFEST = "addon_classes"
+# Manifest type with python module of addon in addon directory
+ADDON_DISCOVERY_MANIFEST = "addon_discovery"
+# Interfaces and methods of addon classes stored to addon classes manifest
+#   - used to initialize only addons which are needed for an action
+LAZY_INIT_INTERFACES = (IPluginPaths, IHostAddon)
+LAZY_INIT_METHODS = ("cli", "get_global_environments")
+
 # When addon was moved from ayon-core codebase
 # - this is used to log the missing addon
 MOVED_ADDON_MILESTONE_VERSIONS = {
@@ -140,11 +159,21 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Loaders of modules which are imported on first access
+        super(_ModuleClass, self).__setattr__("__lazy_loaders__", dict())
+        super(_ModuleClass, self).__setattr__(
+            "__lazy_lock__", threading.RLock()
+        )
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
+            if attr_name in self.__lazy_loaders__:
+                self._load_lazy_module(attr_name)
+                if attr_name in self.__attributes__:
+                    return self.__attributes__[attr_name]
+
             if attr_name in ("__path__", "__file__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
@@ -156,6 +185,33 @@ class _ModuleClass(object):
         for module in self.values():
             yield module
 
+    def set_lazy_loader(self, attr_name, loader):
+        """Set function which imports module on first access.
+
+        Args:
+            attr_name (str): Attribute name under which is module stored.
+            loader (Callable[[], Union[ModuleType, None]]): Function which
+                imports and returns the module.
+        """
+        self.__lazy_loaders__[attr_name] = loader
+
+    def has_lazy_modules(self):
+        return bool(self.__lazy_loaders__)
+
+    def load_lazy_modules(self):
+        """Import all modules which were not imported yet."""
+        for attr_name in tuple(self.__lazy_loaders__.keys()):
+            self._load_lazy_module(attr_name)
+
+    def _load_lazy_module(self, attr_name):
+        with self.__lazy_lock__:
+            loader = self.__lazy_loaders__.pop(attr_name, None)
+            if loader is None:
+                return
+            module = loader()
+            if module is not None:
+                self.__setattr__(attr_name, module)
+
     def __setattr__(self, attr_name, value):
         if attr_name in self.__attributes__:
             self.log.warning(
@@ -180,24 +236,31 @@ class _ModuleClass(object):
         return self._log
 
     def get(self, key, default=None):
+        if key in self.__lazy_loaders__:
+            self._load_lazy_module(key)
         return self.__attributes__.get(key, default)
 
     def keys(self):
+        self.load_lazy_modules()
         return self.__attributes__.keys()
 
     def values(self):
+        self.load_lazy_modules()
         return self.__attributes__.values()
 
     def items(self):
+        self.load_lazy_modules()
         return self.__attributes__.items()
 
 
 class _LoadCache:
     addons_lock = threading.Lock()
     addons_loaded = False
+    # Information about loaded addon directories used as key for manifests
+    addons_signature = []
 
 
-def load_addons(force=False):
+def load_addons(force=False, lazy=False):
     """Load AYON addons as python modules.
 
     Modules does not load only classes (like in Interfaces) because there must
@@ -209,19 +272,24 @@ def load_addons(force=False):
     Args:
         force (bool): Force to load addons even if are already loaded.
             This won't update already loaded and used (cached) modules.
+        lazy (bool): Addon directories are added to 'sys.path' but addon
+            modules are imported on first access.
     """
 
-    if _LoadCache.addons_loaded and not force:
-        return
+    if force or not _LoadCache.addons_loaded:
+        if not _LoadCache.addons_lock.locked():
+            with _LoadCache.addons_lock:
+                _load_addons()
+                _LoadCache.addons_loaded = True
+        else:
+            # If lock is locked wait until is finished
+            while _LoadCache.addons_lock.locked():
+                time.sleep(0.1)
 
-    if not _LoadCache.addons_lock.locked():
-        with _LoadCache.addons_lock:
-            _load_addons()
-            _LoadCache.addons_loaded = True
-    else:
-        # If lock is locked wait until is finished
-        while _LoadCache.addons_lock.locked():
-            time.sleep(0.1)
+    if not lazy:
+        openpype_modules = sys.modules.get("openpype_modules")
+        if openpype_modules is not None:
+            openpype_modules.load_lazy_modules()
 
 
 def _get_ayon_bundle_data():
@@ -315,6 +383,9 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
     what is already available on the machine (at least in first stages of
     development).
 
+    Addon directories are added to 'sys.path' and addon modules are imported
+    on first access to them in 'openpype_modules'.
+
     Args:
         openpype_modules (_ModuleClass): Module object where modules are
             stored.
@@ -394,70 +465,216 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
             continue
 
         sys.path.insert(0, addon_dir)
-        imported_modules = []
-        for name in os.listdir(addon_dir):
-            # Ignore of files is implemented to be able to run code from code
-            #   where usually is more files than just the addon
-            # Ignore start and setup scripts
-            if name in ("setup.py", "start.py", "__pycache__"):
-                continue
+        _LoadCache.addons_signature.append(
+            [addon_name, addon_version, addon_dir]
+        )
+        addons_to_skip_in_core.append(addon_name)
+        openpype_modules.set_lazy_loader(
+            addon_name,
+            functools.partial(
+                _import_addon_module,
+                addon_name,
+                addon_version,
+                addon_dir,
+                openpype_modules,
+                modules_key,
+                log,
+            )
+        )
 
-            path = os.path.join(addon_dir, name)
-            basename, ext = os.path.splitext(name)
-            # Ignore folders/files with dot in name
-            #   - dot names cannot be imported in Python
-            if "." in basename:
-                continue
-            is_dir = os.path.isdir(path)
-            is_py_file = ext.lower() == ".py"
-            if not is_py_file and not is_dir:
-                continue
+    return addons_to_skip_in_core
 
-            try:
-                mod = __import__(basename, fromlist=("",))
-                for attr_name in dir(mod):
-                    attr = getattr(mod, attr_name)
-                    if (
-                        inspect.isclass(attr)
-                        and issubclass(attr, AYONAddon)
-                    ):
-                        imported_modules.append(mod)
-                        break
-
-            except BaseException:
-                log.warning(
-                    "Failed to import \"{}\"".format(basename),
-                    exc_info=True
-                )
 
-        if not imported_modules:
-            log.warning("Addon {} {} has no content to import".format(
-                addon_name, addon_version
-            ))
+def _import_module_with_addon(module_name, log):
+    """Import module and check that it contains addon class.
+
+    Args:
+        module_name (str): Name of module.
+        log (logging.Logger): Logger object.
+
+    Returns:
+        Union[ModuleType, None]: Imported module or None.
+    """
+    try:
+        mod = __import__(module_name, fromlist=("",))
+    except BaseException:
+        log.warning(
+            "Failed to import \"{}\"".format(module_name),
+            exc_info=True
+        )
+        return None
+
+    for attr_name in dir(mod):
+        attr = getattr(mod, attr_name)
+        if (
+            inspect.isclass(attr)
+            and issubclass(attr, AYONAddon)
+        ):
+            return mod
+    return None
+
+
+def _get_addon_dir_module_paths(addon_dir):
+    """Python modules in addon directory which can contain addon class.
+
+    Args:
+        addon_dir (str): Directory with addon client code.
+
+    Returns:
+        list[tuple[str, str]]: Module name and path of python file or
+            directory.
+    """
+    output = []
+    for name in os.listdir(addon_dir):
+        # Ignore of files is implemented to be able to run code from code
+        #   where usually is more files than just the addon
+        # Ignore start and setup scripts
+        if name in ("setup.py", "start.py", "__pycache__"):
             continue
 
-        if len(imported_modules) > 1:
-            log.warning((
-                "Skipping addon '{}'."
-                " Multiple modules were found ({}) in dir {}."
-            ).format(
-                addon_name,
-                ", ".join([m.__name__ for m in imported_modules]),
-                addon_dir,
-            ))
+        path = os.path.join(addon_dir, name)
+        basename, ext = os.path.splitext(name)
+        # Ignore folders/files with dot in name
+        #   - dot names cannot be imported in Python
+        if "." in basename:
             continue
+        is_dir = os.path.isdir(path)
+        is_py_file = ext.lower() == ".py"
+        if is_py_file or is_dir:
+            output.append((basename, path))
+    return output
 
-        mod = imported_modules[0]
-        addon_alias = getattr(mod, "V3_ALIAS", None)
-        if not addon_alias:
-            addon_alias = addon_name
-        addons_to_skip_in_core.append(addon_alias)
-        new_import_str = "{}.{}".format(modules_key, addon_alias)
 
-        sys.modules[new_import_str] = mod
-        setattr(openpype_modules, addon_alias, mod)
+def _get_addon_modules_signature(module_paths):
+    """Modification times of addon modules used in discovery manifest key.
 
-    return addons_to_skip_in_core
+    Modification time of directory does not change when content of
+    existing file changes, so modification times of module files and
+    python files directly in package directories are used.
+
+    Args:
+        module_paths (list[tuple[str, str]]): Module names and paths from
+            '_get_addon_dir_module_paths'.
+
+    Returns:
+        list[list[Any]]: Json serializable signature of modules.
+    """
+    signature = []
+    for basename, path in sorted(module_paths):
+        if not os.path.isdir(path):
+            signature.append([basename, os.stat(path).st_mtime_ns])
+            continue
+
+        mtimes = sorted(
+            [entry.name, entry.stat().st_mtime_ns]
+            for entry in os.scandir(path)
+            if entry.name.endswith(".py")
+        )
+        signature.append([basename, mtimes])
+    return signature
+
+
+def _discover_addon_module(
+    addon_name, addon_version, addon_dir, log, module_paths=None
+):
+    """Find python module with addon class in addon directory.
+
+    All python modules in the directory are imported.
+
+    Args:
+        addon_name (str): Addon name.
+        addon_version (str): Addon version.
+        addon_dir (str): Directory with addon client code.
+        log (logging.Logger): Logger object.
+        module_paths (Optional[list[tuple[str, str]]]): Modules in addon
+            directory from '_get_addon_dir_module_paths'.
+
+    Returns:
+        Union[ModuleType, None]: Module with addon or None.
+    """
+    if module_paths is None:
+        module_paths = _get_addon_dir_module_paths(addon_dir)
+
+    imported_modules = []
+    for basename, _ in module_paths:
+        mod = _import_module_with_addon(basename, log)
+        if mod is not None:
+            imported_modules.append(mod)
+
+    if not imported_modules:
+        log.warning("Addon {} {} has no content to import".format(
+            addon_name, addon_version
+        ))
+        return None
+
+    if len(imported_modules) > 1:
+        log.warning((
+            "Skipping addon '{}'."
+            " Multiple modules were found ({}) in dir {}."
+        ).format(
+            addon_name,
+            ", ".join([m.__name__ for m in imported_modules]),
+            addon_dir,
+        ))
+        return None
+
+    return imported_modules[0]
+
+
+def _import_addon_module(
+    addon_name, addon_version, addon_dir, openpype_modules, modules_key, log
+):
+    """Import python module of addon from addon directory.
+
+    Args:
+        addon_name (str): Addon name.
+        addon_version (str): Addon version.
+        addon_dir (str): Directory with addon client code.
+        openpype_modules (_ModuleClass): Module object where modules are
+            stored.
+        modules_key (str): Key under which will be modules imported in
+            `sys.modules`.
+        log (logging.Logger): Logger object.
+
+    Returns:
+        Union[ModuleType, None]: Imported module or None.
+    """
+    # Use module stored in discovery manifest
+    #   - key contains all modules in the directory with modification
+    #       times of their files, any change of them runs discovery
+    #       again, including check for multiple addon modules
+    module_paths = _get_addon_dir_module_paths(addon_dir)
+    manifest_key = [
+        addon_name,
+        addon_version,
+        addon_dir,
+        _get_addon_modules_signature(module_paths),
+    ]
+    manifest = load_manifest(ADDON_DISCOVERY_MANIFEST, manifest_key)
+    mod = None
+    if manifest:
+        mod = _import_module_with_addon(manifest["module"], log)
+        if mod is None:
+            remove_manifest(ADDON_DISCOVERY_MANIFEST, manifest_key)
+
+    if mod is None:
+        mod = _discover_addon_module(
+            addon_name, addon_version, addon_dir, log, module_paths
+        )
+        if mod is None:
+            return None
+        save_manifest(
+            ADDON_DISCOVERY_MANIFEST,
+            manifest_key,
+            {"module": mod.__name__}
+        )
+
+    sys.modules["{}.{}".format(modules_key, addon_name)] = mod
+    addon_alias = getattr(mod, "V3_ALIAS", None)
+    if addon_alias and addon_alias != addon_name:
+        sys.modules["{}.{}".format(modules_key, addon_alias)] = mod
+        setattr(openpype_modules, addon_alias, mod)
+    return mod
 
 
 def _load_addons_in_core(
@@ -501,20 +718,31 @@ def _load_addons_in_core(
 
         # TODO add more logic how to define if folder is addon or not
         # - check manifest and content of manifest
-        try:
-            # Don't import dynamically current directory modules
-            new_import_str = f"{modules_key}.{basename}"
+        _LoadCache.addons_signature.append([basename, fullpath])
+        openpype_modules.set_lazy_loader(
+            basename,
+            functools.partial(
+                _import_core_addon_module, basename, modules_key, log
+            )
+        )
 
-            import_str = f"ayon_core.modules.{basename}"
-            default_module = __import__(import_str, fromlist=("", ))
-            sys.modules[new_import_str] = default_module
-            setattr(openpype_modules, basename, default_module)
 
-        except Exception:
-            log.error(
-                f"Failed to import in-core addon '{basename}'.",
-                exc_info=True
-            )
+def _import_core_addon_module(basename, modules_key, log):
+    try:
+        # Don't import dynamically current directory modules
+        new_import_str = f"{modules_key}.{basename}"
+
+        import_str = f"ayon_core.modules.{basename}"
+        default_module = __import__(import_str, fromlist=("", ))
+        sys.modules[new_import_str] = default_module
+        return default_module
+
+    except Exception:
+        log.error(
+            f"Failed to import in-core addon '{basename}'.",
+            exc_info=True
+        )
+    return None
 
 
 def _load_addons():
@@ -526,6 +754,7 @@ def _load_addons():
 
     log = Logger.get_logger("AddonsLoader")
 
+    _LoadCache.addons_signature = []
     ignore_addon_names = _load_ayon_addons(
         openpype_modules, modules_key, log
     )
@@ -759,6 +988,34 @@ class OpenPypeAddOn(OpenPypeModule):
     enabled = True
 
 
+def _get_addon_class_features(addon_cls):
+    """Interfaces and methods implemented by addon class.
+
+    Args:
+        addon_cls (type[AYONAddon]): Addon class.
+
+    Returns:
+        list[str]: Names of implemented interfaces and overridden methods.
+    """
+    features = [
+        interface.__name__
+        for interface in LAZY_INIT_INTERFACES
+        if issubclass(addon_cls, interface)
+    ]
+    for method_name in LAZY_INIT_METHODS:
+        if getattr(addon_cls, method_name) is not getattr(
+            AYONAddon, method_name
+        ):
+            features.append(method_name)
+    return features
+
+
+def _get_addon_classes_manifest_key():
+    from ayon_core import __version__
+
+    return [__version__, _LoadCache.addons_signature]
+
+
 class _AddonReportInfo:
     def __init__(
         self, class_name, name, version, report_value_by_label
@@ -786,31 +1043,63 @@ class _AddonReportInfo:
 class AddonsManager:
     """Manager of addons that helps to load and prepare them to work.
 
+    In lazy mode are addons imported and initialized when they are needed.
+    Addon classes are stored to a manifest on first run, following runs
+    only read the manifest and initialize addon when it is requested
+    by name, or only addons that implement what is requested, e.g.
+    'IPluginPaths' on 'collect_plugin_paths'. Connection of addons is
+    postponed until all addons are initialized. Addons implementing
+    'connect_with_addons' need all enabled addons, so all remaining addons
+    are initialized and connected before such addon is returned.
+
+    Note:
+        In lazy mode 'connect_with_addons' of all addons is called when
+        the last deferred addon is initialized. Addons which don't
+        implement it may be already returned and used before the
+        connection happens.
+
     Args:
         settings (Optional[dict[str, Any]]): AYON studio settings.
         initialize (Optional[bool]): Initialize addons on init.
             True by default.
+        lazy (Optional[bool]): Initialize addons on demand. Value of
+            'AYON_ADDONS_LAZY_INIT' environment variable is used if
+            not passed.
     """
 
     # Helper attributes for report
     _report_total_key = "Total"
     _log = None
 
-    def __init__(self, settings=None, initialize=True):
+    def __init__(self, settings=None, initialize=True, lazy=None):
         self._settings = settings
+        if lazy is None:
+            lazy = os.getenv(ADDONS_LAZY_INIT_ENV_KEY) == "1"
+        self._lazy = lazy
 
         self._addons = []
         self._addons_by_id = {}
         self._addons_by_name = {}
+        # Lazy initialization
+        #   - manifest items of addons which were not initialized yet
+        self._deferred_items = []
+        self._deferred_lock = threading.RLock()
+        self._addons_order = {}
+        self._connect_deferred = False
+        self._init_settings = None
         # For report of time consumption
         self._report = {}
+        add_startup_profile_report("AddonsManager", self._report)
 
         if initialize:
             self.initialize_addons()
             self.connect_addons()
 
     def __getitem__(self, addon_name):
-        return self._addons_by_name[addon_name]
+        addon = self.get(addon_name)
+        if addon is None:
+            raise KeyError(addon_name)
+        return addon
 
     @property
     def log(self):
@@ -829,20 +1118,35 @@ class AddonsManager:
             Union[AYONAddon, Any]: Addon found by name or `default`.
         """
 
+        if addon_name not in self._addons_by_name:
+            self._initialize_deferred_addons(addon_name=addon_name)
         return self._addons_by_name.get(addon_name, default)
 
     @property
     def addons(self):
+        self._initialize_deferred_addons()
         return list(self._addons)
 
     @property
     def addons_by_id(self):
+        self._initialize_deferred_addons()
         return dict(self._addons_by_id)
 
     @property
     def addons_by_name(self):
+        self._initialize_deferred_addons()
         return dict(self._addons_by_name)
 
+    @property
+    def is_lazy(self):
+        """Addons are initialized on demand.
+
+        Returns:
+            bool: Lazy initialization is enabled.
+        """
+
+        return self._lazy
+
     def get_enabled_addon(self, addon_name, default=None):
         """Fast access to enabled addon.
 
@@ -869,34 +1173,53 @@ class AddonsManager:
             list[AYONAddon]: Initialized and enabled addons.
         """
 
+        self._initialize_deferred_addons()
         return [
             addon
             for addon in self._addons
             if addon.enabled
         ]
 
+    def get_cli_addons(self):
+        """Addons which add commands to CLI.
+
+        Returns:
+            list[AYONAddon]: Addons implementing 'cli' method.
+        """
+
+        self._initialize_deferred_addons(feature="cli")
+        return [
+            addon
+            for addon in self._addons
+            if "cli" in _get_addon_class_features(addon.__class__)
+        ]
+
     def initialize_addons(self):
-        """Import and initialize addons."""
+        """Import and initialize addons.
+
+        In lazy mode are addons only registered from manifest if
+        is available.
+        """
         # Make sure modules are loaded
-        load_addons()
+        with profile_section("load_addons", "addons"):
+            load_addons(lazy=self._lazy)
 
         import openpype_modules
 
         self.log.debug("*** AYON addons initialization.")
 
-        # Prepare settings for addons
-        settings = self._settings
-        if settings is None:
-            settings = get_studio_settings()
+        if self._lazy and self._initialize_from_manifest():
+            return
 
-        modules_settings = {}
+        # Prepare settings for addons
+        settings = self._get_init_settings()
 
         report = {}
         time_start = time.time()
         prev_start_time = time_start
 
         addon_classes = []
-        for module in openpype_modules:
+        for module_key, module in openpype_modules.items():
             # Go through globals in `ayon_core.modules`
             for name in dir(module):
                 modules_item = getattr(module, name, None)
@@ -930,45 +1253,35 @@ class AddonsManager:
                     ).format(name, ", ".join(not_implemented)))
                     continue
 
-                addon_classes.append(modules_item)
+                addon_classes.append((module_key, modules_item))
 
         aliased_names = []
-        for addon_cls in addon_classes:
-            name = addon_cls.__name__
-            if issubclass(addon_cls, OpenPypeModule):
-                # TODO change to warning
-                self.log.debug((
-                    "Addon '{}' is inherited from 'OpenPypeModule'."
-                    " Please use 'AYONAddon'."
-                ).format(name))
-
-            try:
-                # Try initialize module
-                if issubclass(addon_cls, OpenPypeModule):
-                    addon = addon_cls(self, modules_settings)
-                else:
-                    addon = addon_cls(self, settings)
-                # Store initialized object
-                self._addons.append(addon)
-                self._addons_by_id[addon.id] = addon
-                self._addons_by_name[addon.name] = addon
-                # NOTE This will be removed with release 1.0.0 of ayon-core
-                #   please use carefully.
-                # Gives option to use alias name for addon for cases when
-                #   name in OpenPype was not the same as in AYON.
-                name_alias = getattr(addon, "openpype_alias", None)
-                if name_alias:
-                    aliased_names.append((name_alias, addon))
+        manifest_items = []
+        for module_key, addon_cls in addon_classes:
+            addon = self._create_addon(addon_cls, settings)
+            if addon is None:
+                continue
 
-                now = time.time()
-                report[addon.__class__.__name__] = now - prev_start_time
-                prev_start_time = now
+            self._add_addon(addon)
+            # NOTE This will be removed with release 1.0.0 of ayon-core
+            #   please use carefully.
+            # Gives option to use alias name for addon for cases when
+            #   name in OpenPype was not the same as in AYON.
+            name_alias = getattr(addon, "openpype_alias", None)
+            if name_alias:
+                aliased_names.append((name_alias, addon))
+
+            manifest_items.append({
+                "module": module_key,
+                "class": addon_cls.__name__,
+                "name": addon.name,
+                "alias": name_alias,
+                "features": _get_addon_class_features(addon_cls),
+            })
 
-            except Exception:
-                self.log.warning(
-                    "Initialization of addon '{}' failed.".format(name),
-                    exc_info=True
-                )
+            now = time.time()
+            report[addon.__class__.__name__] = now - prev_start_time
+            prev_start_time = now
 
         for addon_name in sorted(self._addons_by_name.keys()):
             addon = self._addons_by_name[addon_name]
@@ -979,24 +1292,208 @@ class AddonsManager:
 
         for item in aliased_names:
             name_alias, addon = item
-            if name_alias not in self._addons_by_name:
-                self._addons_by_name[name_alias] = addon
-                continue
-            self.log.warning(
-                "Alias name '{}' of addon '{}' is already assigned.".format(
-                    name_alias, addon.name
-                )
+            self._add_addon_alias(name_alias, addon)
+
+        if self._lazy:
+            save_manifest(
+                ADDON_CLASSES_MANIFEST,
+                _get_addon_classes_manifest_key(),
+                {"addons": manifest_items}
             )
 
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
+    def _get_init_settings(self):
+        if self._init_settings is None:
+            settings = self._settings
+            if settings is None:
+                settings = get_studio_settings()
+            self._init_settings = settings
+        return self._init_settings
+
+    def _create_addon(self, addon_cls, settings):
+        """Create and initialize addon object.
+
+        Args:
+            addon_cls (type[AYONAddon]): Addon class.
+            settings (dict[str, Any]): AYON studio settings.
+
+        Returns:
+            Union[AYONAddon, None]: Addon object or None if initialization
+                failed.
+        """
+        name = addon_cls.__name__
+        if issubclass(addon_cls, OpenPypeModule):
+            # TODO change to warning
+            self.log.debug((
+                "Addon '{}' is inherited from 'OpenPypeModule'."
+                " Please use 'AYONAddon'."
+            ).format(name))
+
+        try:
+            # Try initialize module
+            with profile_section(name, "addons initialize"):
+                if issubclass(addon_cls, OpenPypeModule):
+                    return addon_cls(self, {})
+                return addon_cls(self, settings)
+
+        except Exception:
+            self.log.warning(
+                "Initialization of addon '{}' failed.".format(name),
+                exc_info=True
+            )
+        return None
+
+    def _add_addon(self, addon):
+        # Store initialized object
+        self._addons.append(addon)
+        self._addons_by_id[addon.id] = addon
+        self._addons_by_name[addon.name] = addon
+
+    def _add_addon_alias(self, name_alias, addon):
+        if name_alias not in self._addons_by_name:
+            self._addons_by_name[name_alias] = addon
+            return
+        self.log.warning(
+            "Alias name '{}' of addon '{}' is already assigned.".format(
+                name_alias, addon.name
+            )
+        )
+
+    def _initialize_from_manifest(self):
+        """Register addons from manifest without initialization.
+
+        Returns:
+            bool: Manifest was available and addons were registered.
+        """
+        time_start = time.time()
+        manifest = load_manifest(
+            ADDON_CLASSES_MANIFEST, _get_addon_classes_manifest_key()
+        )
+        if not manifest:
+            return False
+
+        items = manifest["addons"]
+        self._deferred_items = list(items)
+        self._addons_order = {
+            item["class"]: idx
+            for idx, item in enumerate(items)
+        }
+        self.log.debug(
+            "Deferred initialization of {} addons.".format(len(items))
+        )
+        if self._report is not None:
+            self._report["Initialization"] = {
+                self._report_total_key: time.time() - time_start
+            }
+        return True
+
+    def _initialize_deferred_addons(self, addon_name=None, feature=None):
+        """Initialize addons which were registered from manifest.
+
+        All remaining addons are initialized if 'addon_name' and 'feature'
+        are not passed.
+
+        Args:
+            addon_name (Optional[str]): Initialize addon by name or alias.
+            feature (Optional[str]): Initialize addons implementing
+                interface or method.
+        """
+        # Addons can be requested from multiple threads, selection and
+        #   initialization of deferred items must not interleave
+        with self._deferred_lock:
+            if not self._deferred_items:
+                return
+
+            items = []
+            for item in self._deferred_items:
+                if addon_name is not None:
+                    if addon_name not in (item["name"], item["alias"]):
+                        continue
+                elif feature is not None and feature not in item["features"]:
+                    continue
+                items.append(item)
+
+            if not items:
+                return
+
+            for item in items:
+                self._deferred_items.remove(item)
+
+            import openpype_modules
+
+            settings = self._get_init_settings()
+            report = {}
+            if self._report is not None:
+                report = self._report.setdefault("Deferred initialization", {})
+            time_start = time.time()
+            prev_start_time = time_start
+            needs_connect = False
+            for item in items:
+                module = openpype_modules.get(item["module"])
+                addon_cls = getattr(module, item["class"], None)
+                if addon_cls is None:
+                    self.log.warning((
+                        "Addon class '{}' was not found in '{}'."
+                        " Removing outdated addons manifest."
+                    ).format(item["class"], item["module"]))
+                    remove_manifest(
+                        ADDON_CLASSES_MANIFEST,
+                        _get_addon_classes_manifest_key()
+                    )
+                    continue
+
+                addon = self._create_addon(addon_cls, settings)
+                if addon is None:
+                    continue
+
+                if self._addon_needs_connect(addon):
+                    needs_connect = True
+                self._add_addon(addon)
+                if item["alias"]:
+                    self._add_addon_alias(item["alias"], addon)
+
+                now = time.time()
+                report[addon.__class__.__name__] = now - prev_start_time
+                prev_start_time = now
+
+            # Keep order of addons same as with eager initialization
+            self._addons.sort(
+                key=lambda addon: self._addons_order.get(
+                    addon.__class__.__name__, len(self._addons_order)
+                )
+            )
+            report[self._report_total_key] = (
+                report.get(self._report_total_key, 0)
+                + time.time() - time_start
+            )
+
+            # Addon must not be returned without connection, connection
+            #   requires all enabled addons to be initialized
+            if needs_connect and self._connect_deferred:
+                self._initialize_deferred_addons()
+
+            if not self._deferred_items and self._connect_deferred:
+                self._connect_deferred = False
+                self.connect_addons()
+
     def connect_addons(self):
         """Trigger connection with other enabled addons.
 
         Addons should handle their interfaces in `connect_with_addons`.
+
+        In lazy mode is connection postponed until all addons
+        are initialized. Initialization of an addon implementing
+        'connect_with_addons' initializes all remaining addons, so
+        the addon is connected before it is returned.
         """
+        with self._deferred_lock:
+            if self._deferred_items:
+                self._connect_deferred = True
+                return
+
         report = {}
         time_start = time.time()
         prev_start_time = time_start
@@ -1004,16 +1501,10 @@ class AddonsManager:
         self.log.debug("Has {} enabled addons.".format(len(enabled_addons)))
         for addon in enabled_addons:
             try:
-                if not is_func_marked(addon.connect_with_addons):
-                    addon.connect_with_addons(enabled_addons)
-
-                elif hasattr(addon, "connect_with_modules"):
-                    self.log.warning((
-                        "DEPRECATION WARNING: Addon '{}' still uses"
-                        " 'connect_with_modules' method. Please switch to use"
-                        " 'connect_with_addons' method."
-                    ).format(addon.name))
-                    addon.connect_with_modules(enabled_addons)
+                with profile_section(
+                    addon.__class__.__name__, "addons connect"
+                ):
+                    self._connect_addon(addon, enabled_addons)
 
             except Exception:
                 self.log.error(
@@ -1029,6 +1520,24 @@ class AddonsManager:
             report[self._report_total_key] = time.time() - time_start
             self._report["Connect modules"] = report
 
+    def _addon_needs_connect(self, addon):
+        return (
+            not is_func_marked(addon.connect_with_addons)
+            or hasattr(addon, "connect_with_modules")
+        )
+
+    def _connect_addon(self, addon, enabled_addons):
+        if not is_func_marked(addon.connect_with_addons):
+            addon.connect_with_addons(enabled_addons)
+
+        elif hasattr(addon, "connect_with_modules"):
+            self.log.warning((
+                "DEPRECATION WARNING: Addon '{}' still uses"
+                " 'connect_with_modules' method. Please switch to use"
+                " 'connect_with_addons' method."
+            ).format(addon.name))
+            addon.connect_with_modules(enabled_addons)
+
     def collect_global_environments(self):
         """Helper to collect global environment variabled from modules.
 
@@ -1040,7 +1549,9 @@ class AddonsManager:
                 all modules.
         """
         module_envs = {}
-        for module in self.get_enabled_addons():
+        for module in self._get_enabled_addons_with_feature(
+            "get_global_environments"
+        ):
             # Collect global module's global environments
             _envs = module.get_global_environments()
             for key, value in _envs.items():
@@ -1070,7 +1581,7 @@ class AddonsManager:
             "inventory": []
         }
         unknown_keys_by_addon = {}
-        for addon in self.get_enabled_addons():
+        for addon in self._get_enabled_addons_with_feature("IPluginPaths"):
             # Skip module that do not inherit from `IPluginPaths`
             if not isinstance(addon, IPluginPaths):
                 continue
@@ -1109,9 +1620,26 @@ class AddonsManager:
             ).format(expected_keys, " | ".join(msg_items)))
         return output
 
+    def _get_enabled_addons_with_feature(self, feature):
+        """Enabled addons with initialized addons implementing a feature.
+
+        Args:
+            feature (str): Name of interface or method.
+
+        Returns:
+            list[AYONAddon]: Enabled addons. Can contain addons not
+                implementing the feature.
+        """
+        self._initialize_deferred_addons(feature=feature)
+        return [
+            addon
+            for addon in self._addons
+            if addon.enabled
+        ]
+
     def _collect_plugin_paths(self, method_name, *args, **kwargs):
         output = []
-        for addon in self.get_enabled_addons():
+        for addon in self._get_enabled_addons_with_feature("IPluginPaths"):
             # Skip addon that do not inherit from `IPluginPaths`
             if not isinstance(addon, IPluginPaths):
                 continue
@@ -1208,7 +1736,7 @@ class AddonsManager:
             Union[AYONAddon, None]: Found host addon by name or `None`.
         """
 
-        for addon in self.get_enabled_addons():
+        for addon in self._get_enabled_addons_with_feature("IHostAddon"):
             if (
                 isinstance(addon, IHostAddon)
                 and addon.host_name == host_name
@@ -1226,7 +1754,7 @@ class AddonsManager:
 
         return {
             addon.host_name
-            for addon in self.get_enabled_addons()
+            for addon in self._get_enabled_addons_with_feature("IHostAddon")
             if isinstance(addon, IHostAddon)
         }
 
@@ -1265,9 +1793,10 @@ class AddonsManager:
             available_col_names |= set(addon_names.keys())
 
         # Prepare ordered dictionary for columns
+        # Use only initialized addons to not trigger lazy initialization
         addons_info = [
             _AddonReportInfo.from_addon(addon, self._report)
-            for addon in self.addons
+            for addon in self._addons
             if addon.__class__.__name__ in available_col_names
         ]
         addons_info.sort(key=lambda x: x.name)
@@ -0,0 +1,153 @@
+"""Cached information about addons used to speed up process start.
+
+Manifests are json files stored in launcher local directory. Each manifest
+has a type and a key, manifest is used only if stored key is the same as
+requested key.
+"""
+import os
+import json
+import hashlib
+import logging
+
+from ayon_core.lib import get_launcher_local_dir
+
+log = logging.getLogger(__name__)
+
+MANIFESTS_DIRNAME = "addons_manifest"
+
+
+def get_manifests_dir():
+    """Directory where addon manifests are stored.
+
+    Returns:
+        str: Path to directory.
+    """
+    return get_launcher_local_dir(MANIFESTS_DIRNAME)
+
+
+def _get_manifest_path(manifest_type, key):
+    key_hash = hashlib.sha256(
+        json.dumps(key, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(
+        get_manifests_dir(),
+        "{}_{}.json".format(manifest_type, key_hash[:32])
+    )
+
+
+def load_manifest(manifest_type, key):
+    """Load manifest data.
+
+    Args:
+        manifest_type (str): Type of manifest.
+        key (Any): Json serializable key of manifest.
+
+    Returns:
+        Union[dict[str, Any], None]: Manifest data or None if manifest
+            is not available.
+    """
+    path = _get_manifest_path(manifest_type, key)
+    try:
+        with open(path, "r") as stream:
+            content = json.load(stream)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        log.debug("Failed to read manifest {}".format(path), exc_info=True)
+        return None
+
+    if content.get("key") != json.loads(json.dumps(key)):
+        return None
+    return content.get("data")
+
+
+def save_manifest(manifest_type, key, data):
+    """Store manifest data.
+
+    Args:
+        manifest_type (str): Type of manifest.
+        key (Any): Json serializable key of manifest.
+        data (dict[str, Any]): Json serializable manifest data.
+    """
+    path = _get_manifest_path(manifest_type, key)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w") as stream:
+            json.dump(
+                {"type": manifest_type, "key": key, "data": data},
+                stream,
+                indent=4
+            )
+        os.replace(tmp_path, path)
+
+    except Exception:
+        log.debug("Failed to store manifest {}".format(path), exc_info=True)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def remove_manifest(manifest_type, key):
+    """Remove manifest.
+
+    Args:
+        manifest_type (str): Type of manifest.
+        key (Any): Json serializable key of manifest.
+    """
+    path = _get_manifest_path(manifest_type, key)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def get_manifests():
+    """All stored manifests.
+
+    Returns:
+        list[dict[str, Any]]: Manifests with "type", "key", "data" and
+            "path" keys.
+    """
+    manifests_dir = get_manifests_dir()
+    if not os.path.isdir(manifests_dir):
+        return []
+
+    output = []
+    for filename in sorted(os.listdir(manifests_dir)):
+        if not filename.endswith(".json"):
+            continue
+        path = os.path.join(manifests_dir, filename)
+        try:
+            with open(path, "r") as stream:
+                content = json.load(stream)
+        except Exception:
+            log.debug(
+                "Failed to read manifest {}".format(path), exc_info=True
+            )
+            continue
+        content["path"] = path
+        output.append(content)
+    return output
+
+
+def clear_manifests():
+    """Remove all stored manifests.
+
+    Returns:
+        int: Number of removed manifests.
+    """
+    manifests_dir = get_manifests_dir()
+    if not os.path.isdir(manifests_dir):
+        return 0
+
+    count = 0
+    for filename in os.listdir(manifests_dir):
+        if not filename.endswith((".json", ".tmp")):
+            continue
+        try:
+            os.remove(os.path.join(manifests_dir, filename))
+            count += 1
+        except OSError:
+            log.warning(
+                "Failed to remove manifest {}".format(filename),
+                exc_info=True
+            )
+    return count
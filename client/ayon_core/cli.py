@@ -2,6 +2,7 @@
 """Package for handling AYON command line arguments."""
 import os
 import sys
+import json
 import code
 import traceback
 from pathlib import Path
@@ -12,11 +13,17 @@ import acre
 
 from ayon_core import AYON_CORE_ROOT
 from ayon_core.addon import AddonsManager
-from ayon_core.settings import get_general_environments
+from ayon_core.settings import (
+    get_general_environments,
+    invalidate_settings_cache,
+)
 from ayon_core.lib import (
     initialize_ayon_connection,
     is_running_from_build,
     Logger,
+    STARTUP_PROFILE_ENV_KEY,
+    start_startup_profiling,
+    profile_section,
 )
 
 
@@ -43,6 +50,8 @@ class AliasedGroup(click.Group):
               help="Enable debug")
 @click.option("--verbose", expose_value=False,
               help=("Change AYON log level (debug - critical or 0-50)"))
+@click.option("--profile-startup", is_flag=True, expose_value=False,
+              help=("Store startup profile to launcher local directory"))
 @click.option("--force", is_flag=True, hidden=True)
 def main_cli(ctx, force):
     """AYON is main command serving as entry point to pipeline system.
@@ -250,6 +259,35 @@ def version(build):
     print(os.environ["AYON_VERSION"])
 
 
+@main_cli.command("invalidate-settings-cache")
+def invalidate_settings_cache_cmd():
+    """Remove settings cached on disk.
+
+    Next request of settings in any process will query them from server.
+    """
+    count = invalidate_settings_cache()
+    print("Removed {} cached settings files.".format(count))
+
+
+@main_cli.command("addons-manifest")
+@click.option(
+    "--clear", is_flag=True, default=False,
+    help="Remove all stored manifests.")
+def addons_manifest(clear):
+    """Show cached addons discovery and classes manifests.
+
+    Manifests are created automatically and are invalidated when addon
+    version or content of addon directory changes.
+    """
+    from ayon_core.addon.manifest import get_manifests, clear_manifests
+
+    if clear:
+        count = clear_manifests()
+        print("Removed {} addons manifests.".format(count))
+        return
+    print(json.dumps(get_manifests(), indent=4))
+
+
 def _set_global_environments() -> None:
     """Set global AYON environments."""
     general_env = get_general_environments()
@@ -289,7 +327,7 @@ def _set_addons_environments(addons_manager):
 def _add_addons(addons_manager):
     """Modules/Addons can add their cli commands dynamically."""
     log = Logger.get_logger("CLI-AddAddons")
-    for addon_obj in addons_manager.addons:
+    for addon_obj in addons_manager.get_cli_addons():
         try:
             addon_obj.cli(addon)
 
@@ -302,7 +340,15 @@ def _add_addons(addons_manager):
 
 
 def main(*args, **kwargs):
-    initialize_ayon_connection()
+    if (
+        os.getenv(STARTUP_PROFILE_ENV_KEY)
+        or "--profile-startup" in sys.argv
+    ):
+        output_path = start_startup_profiling()
+        print(">>> startup profile will be stored to {}".format(output_path))
+
+    with profile_section("initialize_ayon_connection", "cli"):
+        initialize_ayon_connection()
     python_path = os.getenv("PYTHONPATH", "")
     split_paths = python_path.split(os.pathsep)
 
@@ -322,11 +368,15 @@ def main(*args, **kwargs):
 
     print(">>> loading environments ...")
     print("  - global AYON ...")
-    _set_global_environments()
+    with profile_section("global_environments", "cli"):
+        _set_global_environments()
     print("  - for addons ...")
-    addons_manager = AddonsManager()
-    _set_addons_environments(addons_manager)
-    _add_addons(addons_manager)
+    with profile_section("addons_manager", "cli"):
+        addons_manager = AddonsManager()
+    with profile_section("addons_environments", "cli"):
+        _set_addons_environments(addons_manager)
+    with profile_section("addons_cli", "cli"):
+        _add_addons(addons_manager)
     try:
         main_cli(
             prog_name="ayon",
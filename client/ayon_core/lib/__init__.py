@@ -87,6 +87,7 @@ from .dateutils import (
 
 from .python_module_tools import (
     import_filepath,
+    preread_python_files,
     modules_from_path,
     recursive_bases_from_class,
     classes_from_module,
@@ -96,11 +97,29 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    ProfilesMatcher,
+    clear_profiles_matchers_cache,
 )
 
+from .profiling import (
+    STARTUP_PROFILE_ENV_KEY,
+    is_startup_profiling_enabled,
+    start_startup_profiling,
+    stop_startup_profiling,
+    add_startup_profile_event,
+    add_startup_profile_report,
+    profile_section,
+    profile_function,
+    write_startup_profile,
+)
+
+from .thread_pool import run_in_thread_pool
+
 from .transcoding import (
     get_transcode_temp_directory,
+    clear_media_info_cache,
+    get_exr_header_info,
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
     convert_input_paths_for_ffmpeg,
@@ -123,6 +142,8 @@ from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    create_reflink,
+    copy_file_with_reflink,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
@@ -198,13 +219,18 @@ __all__ = [
     "FileDefItem",
 
     "import_filepath",
+    "preread_python_files",
     "modules_from_path",
     "recursive_bases_from_class",
     "classes_from_module",
     "import_module_from_dirpath",
     "is_func_signature_supported",
 
+    "run_in_thread_pool",
+
     "get_transcode_temp_directory",
+    "clear_media_info_cache",
+    "get_exr_header_info",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
     "convert_input_paths_for_ffmpeg",
@@ -220,6 +246,18 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "ProfilesMatcher",
+    "clear_profiles_matchers_cache",
+
+    "STARTUP_PROFILE_ENV_KEY",
+    "is_startup_profiling_enabled",
+    "start_startup_profiling",
+    "stop_startup_profiling",
+    "add_startup_profile_event",
+    "add_startup_profile_report",
+    "profile_section",
+    "profile_function",
+    "write_startup_profile",
 
     "prepare_template_data",
     "source_hash",
@@ -227,6 +265,8 @@ __all__ = [
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "create_reflink",
+    "copy_file_with_reflink",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
@@ -2,7 +2,11 @@
 import os
 import re
 import copy
+import json
+import time
 import inspect
+import itertools
+import threading
 import collections
 import logging
 import weakref
@@ -42,6 +46,25 @@ def _get_func_info(func):
     return name, path
 
 
+def _get_topic_regex(topic):
+    """Compile regex for topic where '*' matches any characters.
+
+    Args:
+        topic (str): Topic with possible '*' wildcards.
+
+    Returns:
+        re.Pattern: Compiled regex matching the topic.
+    """
+
+    topic_regex_str = "^{}$".format(
+        ".+".join(
+            re.escape(part)
+            for part in topic.split("*")
+        )
+    )
+    return re.compile(topic_regex_str)
+
+
 class weakref_partial:
     """Partial function with weak reference to the wrapped function.
 
@@ -159,6 +182,10 @@ class EventCallback:
         TypeError: When passed function is not a callable object.
     """
 
+    # Changed when order of any callback changes
+    #   - used by event systems to invalidate sorted callbacks
+    _order_version = 0
+
     def __init__(self, topic, func, order):
         if not callable(func):
             raise TypeError((
@@ -177,14 +204,7 @@ class EventCallback:
         #   - it is possible to register to a partial topis 'my.event.*'
         #       - it will receive all matching event topics
         #           e.g. 'my.event.start' and 'my.event.end'
-        topic_regex_str = "^{}$".format(
-            ".+".join(
-                re.escape(part)
-                for part in topic.split("*")
-            )
-        )
-        topic_regex = re.compile(topic_regex_str)
-        self._topic_regex = topic_regex
+        self._topic_regex = _get_topic_regex(topic)
 
         # Callback function prep
         if isinstance(func, weakref_partial):
@@ -226,6 +246,16 @@ class EventCallback:
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
+    @property
+    def topic(self):
+        """Topic to which is callback registered.
+
+        Returns:
+            str: Topic with possible '*' wildcards.
+        """
+
+        return self._topic
+
     @property
     def is_ref_valid(self):
         """
@@ -291,7 +321,9 @@ class EventCallback:
         """
 
         self._validate_order(order)
-        self._order = order
+        if order != self._order:
+            self._order = order
+            EventCallback._order_version += 1
 
     order = property(get_order, set_order)
 
@@ -314,6 +346,16 @@ class EventCallback:
             event(Event): Event that was triggered.
         """
 
+        if self.topic_matches(event.topic):
+            self._process_matching_event(event)
+
+    def _process_matching_event(self, event):
+        """Process event of which topic was already matched.
+
+        Args:
+            event(Event): Event that was triggered.
+        """
+
         # Skip if callback is not enabled
         if not self._enabled:
             return
@@ -323,9 +365,6 @@ class EventCallback:
         if callback is None:
             return
 
-        if not self.topic_matches(event.topic):
-            return
-
         # Try to execute callback
         try:
             if self._expect_args:
@@ -486,6 +525,69 @@ class Event:
         return obj
 
 
+class _TopicPrefixTrie:
+    """Callbacks with wildcard topic stored by prefix before first '*'.
+
+    Only callbacks of which prefix is prefix of a topic are candidates for
+    the topic. Candidates still have to be matched against the full topic.
+    """
+
+    def __init__(self):
+        self._root = self._create_node()
+
+    @staticmethod
+    def _create_node():
+        return {"children": {}, "callbacks": []}
+
+    def add(self, prefix, callback):
+        node = self._root
+        for char in prefix:
+            children = node["children"]
+            child = children.get(char)
+            if child is None:
+                child = children[char] = self._create_node()
+            node = child
+        node["callbacks"].append(callback)
+
+    def remove(self, prefix, callback):
+        path = []
+        node = self._root
+        for char in prefix:
+            path.append((node, char))
+            node = node["children"].get(char)
+            if node is None:
+                return
+
+        if callback in node["callbacks"]:
+            node["callbacks"].remove(callback)
+
+        # Remove empty nodes
+        for parent, char in reversed(path):
+            if node["callbacks"] or node["children"]:
+                break
+            parent["children"].pop(char)
+            node = parent
+
+    def get_candidates(self, topic):
+        """Callbacks with prefix matching beginning of the topic.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            list[EventCallback]: Candidate callbacks.
+        """
+
+        node = self._root
+        output = list(node["callbacks"])
+        for char in topic:
+            node = node["children"].get(char)
+            if node is None:
+                break
+            output.extend(node["callbacks"])
+        return output
+
+
 class EventSystem:
     """Encapsulate event handling into an object.
 
@@ -499,9 +601,25 @@ class EventSystem:
     """
 
     default_order = 100
+    # Maximum number of topics with cached callbacks
+    topic_cache_size = 1024
 
     def __init__(self):
         self._registered_callbacks = []
+        # Dispatch index
+        #   - callbacks with exact topic by topic
+        #   - callbacks with wildcard in prefix trie
+        #   - registration index to keep registration order of callbacks
+        #       with same order
+        self._exact_callbacks = collections.defaultdict(list)
+        self._wildcard_callbacks = _TopicPrefixTrie()
+        self._callback_indexes = {}
+        self._callback_counter = itertools.count()
+        # Sorted callbacks by topic
+        self._callbacks_by_topic = {}
+        self._order_version = EventCallback._order_version
+        # Number of callbacks when invalid callbacks are pruned
+        self._prune_threshold = 64
 
     def add_callback(self, topic, callback, order=None):
         """Register callback in event system.
@@ -522,7 +640,9 @@ class EventSystem:
             order = self.default_order
 
         callback = EventCallback(topic, callback, order)
-        self._registered_callbacks.append(callback)
+        if len(self._registered_callbacks) >= self._prune_threshold:
+            self._prune_callbacks()
+        self._add_callback(callback)
         return callback
 
     def create_event(self, topic, data, source):
@@ -573,13 +693,86 @@ class EventSystem:
             event (Event): Prepared event with topic and data.
         """
 
-        callbacks = tuple(sorted(
-            self._registered_callbacks, key=lambda x: x.order
-        ))
-        for callback in callbacks:
-            callback.process_event(event)
+        invalid_callbacks = []
+        for callback in self._get_topic_callbacks(event.topic):
+            callback._process_matching_event(event)
             if not callback.is_ref_valid:
-                self._registered_callbacks.remove(callback)
+                invalid_callbacks.append(callback)
+
+        for callback in invalid_callbacks:
+            self._remove_callback(callback)
+
+    def _add_callback(self, callback):
+        self._registered_callbacks.append(callback)
+        self._callback_indexes[callback] = next(self._callback_counter)
+        topic = callback.topic
+        if "*" in topic:
+            prefix = topic.split("*", 1)[0]
+            self._wildcard_callbacks.add(prefix, callback)
+        else:
+            self._exact_callbacks[topic].append(callback)
+        self._callbacks_by_topic.clear()
+
+    def _remove_callback(self, callback):
+        if callback not in self._callback_indexes:
+            return
+        self._callback_indexes.pop(callback)
+        self._registered_callbacks.remove(callback)
+        topic = callback.topic
+        if "*" in topic:
+            prefix = topic.split("*", 1)[0]
+            self._wildcard_callbacks.remove(prefix, callback)
+        else:
+            callbacks = self._exact_callbacks[topic]
+            callbacks.remove(callback)
+            if not callbacks:
+                self._exact_callbacks.pop(topic)
+        self._callbacks_by_topic.clear()
+
+    def _prune_callbacks(self):
+        """Remove callbacks with invalid references.
+
+        Invalid callbacks are removed when an event they listen to is
+        processed. Callbacks of topics that are never emitted are pruned
+        when number of callbacks grows.
+        """
+
+        for callback in tuple(self._registered_callbacks):
+            if not callback.is_ref_valid:
+                self._remove_callback(callback)
+        self._prune_threshold = max(64, len(self._registered_callbacks) * 2)
+
+    def _get_topic_callbacks(self, topic):
+        """Callbacks matching topic sorted by order.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            tuple[EventCallback, ...]: Callbacks for the topic.
+        """
+
+        if self._order_version != EventCallback._order_version:
+            self._order_version = EventCallback._order_version
+            self._callbacks_by_topic.clear()
+
+        callbacks = self._callbacks_by_topic.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        callbacks = list(self._exact_callbacks.get(topic, []))
+        for callback in self._wildcard_callbacks.get_candidates(topic):
+            if callback.topic_matches(topic):
+                callbacks.append(callback)
+
+        callback_indexes = self._callback_indexes
+        callbacks.sort(key=lambda c: (c.order, callback_indexes[c]))
+        callbacks = tuple(callbacks)
+
+        if len(self._callbacks_by_topic) >= self.topic_cache_size:
+            self._callbacks_by_topic.clear()
+        self._callbacks_by_topic[topic] = callbacks
+        return callbacks
 
 
 class QueuedEventSystem(EventSystem):
@@ -658,6 +851,229 @@ class QueuedEventSystem(EventSystem):
         self._current_event = None
 
 
+class ThreadSafeEventSystem(QueuedEventSystem):
+    """Queued event system which accepts events from any thread.
+
+    Callbacks are always executed on consumer thread, which is by default
+    the thread where the event system was created. Events emitted from
+    other threads are queued and the consumer thread is woken up using
+    'dispatcher'.
+
+    Dispatcher is a function which schedules passed callable to be called
+    on the consumer thread, e.g. 'call_soon_threadsafe' of asyncio loop or
+    'QtMainThreadDispatcher' from 'ayon_core.tools.utils'. Without
+    dispatcher are events from other threads processed on next emit on
+    consumer thread or by calling 'process_pending_events'.
+
+    Events with topics matching 'coalesce_topics' are coalesced. Event
+    which is equal to an event that is still waiting in queue and was
+    emitted less than 'coalesce_interval' seconds ago is dropped.
+
+    Args:
+        auto_execute (Optional[bool]): If 'True', events are processed
+            automatically.
+        dispatcher (Optional[Callable[[Callable[[], None]], Any]]): Schedule
+            function call on consumer thread.
+        coalesce_topics (Optional[Iterable[str]]): Topics of events which
+            are coalesced. Can contain '*' wildcards.
+        coalesce_interval (Optional[float]): Time window in seconds in which
+            are duplicated events coalesced.
+    """
+
+    def __init__(
+        self,
+        auto_execute=True,
+        dispatcher=None,
+        coalesce_topics=None,
+        coalesce_interval=0.1,
+    ):
+        super(ThreadSafeEventSystem, self).__init__(auto_execute)
+        self._lock = threading.RLock()
+        self._consumer_thread_id = threading.get_ident()
+        self._dispatcher = dispatcher
+        self._dispatch_scheduled = False
+        self._coalesce_regexes = [
+            _get_topic_regex(topic)
+            for topic in (coalesce_topics or [])
+        ]
+        self._coalesce_interval = coalesce_interval
+        self._pending_by_key = {}
+        self._coalesce_key_by_event_id = {}
+
+    def set_consumer_thread(self, thread_id=None):
+        """Change thread on which are callbacks executed.
+
+        Args:
+            thread_id (Optional[int]): Thread identifier. Current thread
+                is used if not passed.
+        """
+
+        if thread_id is None:
+            thread_id = threading.get_ident()
+        self._consumer_thread_id = thread_id
+
+    def is_consumer_thread(self):
+        """Check if current thread is consumer thread.
+
+        Returns:
+            bool: Current thread is consumer thread.
+        """
+
+        return threading.get_ident() == self._consumer_thread_id
+
+    def add_callback(self, topic, callback, order=None):
+        with self._lock:
+            return super(ThreadSafeEventSystem, self).add_callback(
+                topic, callback, order
+            )
+
+    def count(self):
+        with self._lock:
+            return super(ThreadSafeEventSystem, self).count()
+
+    def emit_event(self, event):
+        """Emit event object.
+
+        Can be called from any thread.
+
+        Args:
+           event (Event): Prepared event with topic and data.
+        """
+
+        with self._lock:
+            if self._coalesce_event(event):
+                return
+            self._event_queue.append(event)
+
+        if not self.is_consumer_thread():
+            self._schedule_dispatch()
+            return
+
+        if self._auto_execute and self._current_event is None:
+            self.process_pending_events()
+
+    def process_next_event(self):
+        """Process next event in queue.
+
+        Must be called from consumer thread.
+
+        Returns:
+            Union[Event, None]: Processed event.
+        """
+
+        if not self.is_consumer_thread():
+            raise RuntimeError(
+                "Events can be processed only on consumer thread."
+            )
+
+        if self._current_event is not None:
+            raise ValueError("An event is already in progress.")
+
+        with self._lock:
+            if not self._event_queue:
+                return None
+            event = self._event_queue.popleft()
+            self._release_coalesced_event(event)
+
+        self._current_event = event
+        try:
+            self._process_event(event)
+        finally:
+            self._current_event = None
+        return event
+
+    def process_pending_events(self):
+        """Process all events in queue.
+
+        Must be called from consumer thread.
+
+        Returns:
+            int: Number of processed events.
+        """
+
+        count = 0
+        while self.process_next_event() is not None:
+            count += 1
+        return count
+
+    def _get_topic_callbacks(self, topic):
+        with self._lock:
+            return super(
+                ThreadSafeEventSystem, self
+            )._get_topic_callbacks(topic)
+
+    def _remove_callback(self, callback):
+        with self._lock:
+            super(ThreadSafeEventSystem, self)._remove_callback(callback)
+
+    def _schedule_dispatch(self):
+        if self._dispatcher is None or not self._auto_execute:
+            return
+
+        with self._lock:
+            if self._dispatch_scheduled:
+                return
+            self._dispatch_scheduled = True
+        self._dispatcher(self._on_dispatch)
+
+    def _on_dispatch(self):
+        with self._lock:
+            self._dispatch_scheduled = False
+
+        if self._current_event is None:
+            self.process_pending_events()
+
+    def _get_coalesce_key(self, event):
+        if not any(
+            regex.match(event.topic)
+            for regex in self._coalesce_regexes
+        ):
+            return None
+
+        try:
+            data = json.dumps(event.data, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return event.topic, str(event.source), data
+
+    def _coalesce_event(self, event):
+        """Check if event should be dropped as duplicate.
+
+        Event is stored as pending if is not a duplicate. Must be called
+        under lock.
+
+        Args:
+            event (Event): Emitted event.
+
+        Returns:
+            bool: Event is a duplicate of pending event.
+        """
+
+        key = self._get_coalesce_key(event)
+        if key is None:
+            return False
+
+        now = time.monotonic()
+        pending = self._pending_by_key.get(key)
+        if (
+            pending is not None
+            and now - pending[0] <= self._coalesce_interval
+        ):
+            return True
+
+        self._pending_by_key[key] = (now, event.id)
+        self._coalesce_key_by_event_id[event.id] = key
+        return False
+
+    def _release_coalesced_event(self, event):
+        key = self._coalesce_key_by_event_id.pop(event.id, None)
+        if key is None:
+            return
+        pending = self._pending_by_key.get(key)
+        if pending is not None and pending[1] == event.id:
+            self._pending_by_key.pop(key)
+
+
 class GlobalEventSystem:
     """Event system living in global scope of process.
 
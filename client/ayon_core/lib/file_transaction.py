@@ -2,8 +2,14 @@ import os
 import logging
 import sys
 import errno
+import hashlib
+import collections
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import (
+    create_hard_link,
+    copy_file_with_reflink,
+    run_in_thread_pool,
+)
 
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
@@ -46,19 +52,64 @@ class FileTransaction:
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Transfers can be processed by a pool of worker threads when
+    `max_workers` is higher than 1. Transfers are grouped by destination
+    directory so each directory is created only once. Backup, rollback and
+    finalize behave the same way in both modes.
+
+    Information about each transferred file (size, modification time and
+    optionally content hash) is collected during `process()` and can be
+    received with `get_file_info()` without querying the filesystem again.
+    Content hash is calculated while the bytes are copied when
+    `hash_algorithm` is set.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for messages.
+        allow_queue_replacements (Optional[bool]): Allow to replace source
+            of already queued destination.
+        max_workers (Optional[int]): Maximum number of concurrent transfers.
+            Transfers are processed one by one when set to 1 or lower.
+        hash_algorithm (Optional[str]): Name of 'hashlib' algorithm used
+            to calculate content hash of transferred files.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    # Copy-on-write clone with fallback to copy
+    MODE_REFLINK = 2
+
+    # Size of chunk used to copy files when content hash is calculated
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=1,
+        hash_algorithm=None,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if not max_workers or max_workers < 1:
+            max_workers = 1
+        self._max_workers = max_workers
+
+        if hash_algorithm:
+            # Validate the algorithm is available
+            hashlib.new(hash_algorithm)
+        else:
+            hash_algorithm = None
+        self._hash_algorithm = hash_algorithm
+
+        # Information about transferred files by destination path
+        self._file_infos = {}
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -77,7 +128,7 @@ class FileTransaction:
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_REFLINK): Transfer mode.
         """
 
         opts = {"mode": mode}
@@ -125,6 +176,7 @@ class FileTransaction:
             os.rename(dst, backup)
 
         # Copy the files to transfer
+        transfers_by_dirname = collections.defaultdict(list)
         for dst, (src, opts) in self._transfers.items():
             path_same = self._same_paths(src, dst)
             if path_same:
@@ -132,17 +184,23 @@ class FileTransaction:
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
-
-            self._create_folder_for_file(dst)
-
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
-
+            dirname = os.path.dirname(dst)
+            transfers_by_dirname[dirname].append((src, dst, opts))
+
+        for dirname in transfers_by_dirname.keys():
+            self._create_folder(dirname)
+
+        transfers = [
+            transfer
+            for dir_transfers in transfers_by_dirname.values()
+            for transfer in dir_transfers
+        ]
+        if self._max_workers > 1 and len(transfers) > 1:
+            self._process_transfers_parallel(transfers)
+            return
+
+        for src, dst, opts in transfers:
+            self._file_infos[dst] = self._transfer_file(src, dst, opts)
             self._transferred.append(dst)
 
     def finalize(self):
@@ -160,6 +218,7 @@ class FileTransaction:
         last_exc = None
         # Rollback any transferred files
         for path in self._transferred:
+            self._file_infos.pop(path, None)
             try:
                 os.remove(path)
             except OSError as exc:
@@ -197,8 +256,118 @@ class FileTransaction:
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    @property
+    def max_workers(self):
+        """Maximum number of concurrent transfers"""
+        return self._max_workers
+
+    def get_file_info(self, path):
+        """Information about transferred file.
+
+        Args:
+            path (str): Destination path of transferred file.
+
+        Returns:
+            Union[dict[str, Any], None]: File information with 'size',
+                'mtime', 'stat', 'hash' and 'hash_type' keys. 'hash' and
+                'hash_type' are None if content hash is not calculated.
+                None is returned if the file was not transferred.
+        """
+        path = os.path.normpath(os.path.abspath(path))
+        return self._file_infos.get(path)
+
+    def _transfer_file(self, src, dst, opts):
+        content_hash = None
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            if self._hash_algorithm:
+                content_hash = self._copy_file_with_hash(src, dst)
+            else:
+                copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+            if self._hash_algorithm:
+                content_hash = self._hash_file(dst)
+        elif opts["mode"] == self.MODE_REFLINK:
+            self.log.debug("Reflinking file ... {} -> {}".format(src, dst))
+            method = copy_file_with_reflink(src, dst, copyfile)
+            if method == "copy":
+                self.log.debug(
+                    "Reflink is not supported, file was copied {}".format(
+                        dst))
+            if self._hash_algorithm:
+                content_hash = self._hash_file(dst)
+
+        return self._create_file_info(dst, content_hash)
+
+    def _create_file_info(self, path, content_hash):
+        file_stat = os.stat(path)
+        hash_type = None
+        if content_hash is not None:
+            hash_type = self._hash_algorithm
+        return {
+            "size": file_stat.st_size,
+            "mtime": file_stat.st_mtime,
+            "stat": file_stat,
+            "hash": content_hash,
+            "hash_type": hash_type,
+        }
+
+    def _copy_file_with_hash(self, src, dst):
+        hash_obj = hashlib.new(self._hash_algorithm)
+        with open(src, "rb") as src_stream, open(dst, "wb") as dst_stream:
+            while True:
+                chunk = src_stream.read(self.HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hash_obj.update(chunk)
+                dst_stream.write(chunk)
+        return hash_obj.hexdigest()
+
+    def _hash_file(self, path):
+        hash_obj = hashlib.new(self._hash_algorithm)
+        with open(path, "rb") as stream:
+            while True:
+                chunk = stream.read(self.HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hash_obj.update(chunk)
+        return hash_obj.hexdigest()
+
+    def _process_transfers_parallel(self, transfers):
+        """Process transfers using a pool of worker threads.
+
+        First failed transfer cancels all transfers that did not start yet.
+        Transfers that were already running are awaited so all successfully
+        transferred files are known for rollback, then the first error
+        is re-raised.
+
+        Args:
+            transfers (list[tuple[str, str, dict[str, Any]]]): Source path,
+                destination path and transfer options.
+        """
+        self.log.debug("Transferring {} files using {} workers".format(
+            len(transfers), self._max_workers))
+
+        run_in_thread_pool(
+            lambda transfer: self._transfer_file(*transfer),
+            transfers,
+            self._max_workers,
+            self.log,
+            self._on_transfer_finished
+        )
+
+    def _on_transfer_finished(self, transfer, file_info):
+        dst = transfer[1]
+        self._file_infos[dst] = file_info
+        self._transferred.append(dst)
+
     def _create_folder_for_file(self, path):
-        dirname = os.path.dirname(path)
+        self._create_folder(os.path.dirname(path))
+
+    def _create_folder(self, dirname):
         try:
             os.makedirs(dirname)
         except OSError as e:
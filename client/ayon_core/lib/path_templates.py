@@ -1,11 +1,14 @@
 import os
 import re
 import numbers
+import functools
 
 KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+# Maximum number of parsed templates kept in memory
+TEMPLATE_CACHE_SIZE = 1024
 
 
 class TemplateUnsolved(Exception):
@@ -16,6 +19,10 @@ class TemplateUnsolved(Exception):
     missing_keys_msg = " Missing keys: \"{0}\"."
 
     def __init__(self, template, missing_keys, invalid_types):
+        self.template = template
+        self.missing_keys = missing_keys
+        self.invalid_types = invalid_types
+
         invalid_type_items = []
         for _key, _type in invalid_types.items():
             invalid_type_items.append(
@@ -47,37 +54,9 @@ class StringTemplate:
             ))
 
         self._template = template
-        parts = []
-        last_end_idx = 0
-        for item in KEY_PATTERN.finditer(template):
-            start, end = item.span()
-            if start > last_end_idx:
-                parts.append(template[last_end_idx:start])
-            parts.append(FormattingPart(template[start:end]))
-            last_end_idx = end
-
-        if last_end_idx < len(template):
-            parts.append(template[last_end_idx:len(template)])
-
-        new_parts = []
-        for part in parts:
-            if not isinstance(part, str):
-                new_parts.append(part)
-                continue
-
-            substr = ""
-            for char in part:
-                if char not in ("<", ">"):
-                    substr += char
-                else:
-                    if substr:
-                        new_parts.append(substr)
-                    new_parts.append(char)
-                    substr = ""
-            if substr:
-                new_parts.append(substr)
-
-        self._parts = self.find_optional_parts(new_parts)
+        # Parsed parts are cached by template string and shared between
+        #   objects
+        self._parts, self._compiled_parts = _parse_template(template)
 
     def __str__(self):
         return self.template
@@ -96,6 +75,10 @@ class StringTemplate:
     def template(self):
         return self._template
 
+    @property
+    def parts(self):
+        return self._parts
+
     def format(self, data):
         """ Figure out with whole formatting.
 
@@ -110,11 +93,8 @@ class StringTemplate:
                 data needed or missing for filling template.
         """
         result = TemplatePartResult()
-        for part in self._parts:
-            if isinstance(part, str):
-                result.add_output(part)
-            else:
-                part.format(data, result)
+        for part in self._compiled_parts:
+            part.format(data, result)
 
         invalid_types = result.invalid_types
         invalid_types.update(result.invalid_optional_types)
@@ -140,6 +120,31 @@ class StringTemplate:
         result.validate()
         return result
 
+    def compile_frame_formatter(self, data, frame_key="frame", strict=True):
+        """Prepare formatter for paths where only single key changes.
+
+        Template is solved once with all keys from data except 'frame_key'.
+        Returned formatter can then fill only the changing key, which is
+        much faster than formatting whole template for each frame of
+        a sequence.
+
+        Args:
+            data (dict[str, Any]): Formatting data. Value of 'frame_key'
+                is ignored.
+            frame_key (Optional[str]): Key which changes for each path.
+            strict (Optional[bool]): Raise 'TemplateUnsolved' if template
+                can't be solved with the data.
+
+        Returns:
+            TemplateFrameFormatter: Formatter filling the frame key.
+        """
+        data = {
+            key: value
+            for key, value in data.items()
+            if key != frame_key
+        }
+        return TemplateFrameFormatter(self, data, frame_key, strict)
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -199,6 +204,266 @@ class StringTemplate:
         return new_parts
 
 
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse_template(template):
+    """Parse template string to parts.
+
+    Result is cached by template string so the same template is parsed
+    only once.
+
+    Args:
+        template (str): Template string.
+
+    Returns:
+        tuple[tuple[Any, ...], tuple[Any, ...]]: Parts of template where
+            text is kept as 'str' and compiled parts where text is
+            converted to 'TextPart' so all parts can be formatted
+            the same way.
+    """
+    parts = []
+    last_end_idx = 0
+    for item in KEY_PATTERN.finditer(template):
+        start, end = item.span()
+        if start > last_end_idx:
+            parts.append(template[last_end_idx:start])
+        parts.append(FormattingPart(template[start:end]))
+        last_end_idx = end
+
+    if last_end_idx < len(template):
+        parts.append(template[last_end_idx:len(template)])
+
+    new_parts = []
+    for part in parts:
+        if not isinstance(part, str):
+            new_parts.append(part)
+            continue
+
+        substr = ""
+        for char in part:
+            if char not in ("<", ">"):
+                substr += char
+            else:
+                if substr:
+                    new_parts.append(substr)
+                new_parts.append(char)
+                substr = ""
+        if substr:
+            new_parts.append(substr)
+
+    parts = tuple(StringTemplate.find_optional_parts(new_parts))
+    return parts, _compile_parts(parts)
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _split_key(key):
+    """Split formatting key to sub-keys without padding or modifiers.
+
+    Args:
+        key (str): Formatting key e.g. 'project[name]' or 'version:0>3'.
+
+    Returns:
+        tuple[str, ...]: Sub-keys e.g. ('project', 'name').
+    """
+    key_padding = KEY_PADDING_PATTERN.findall(key)
+    if key_padding:
+        key = key_padding[0]
+    return tuple(SUB_DICT_PATTERN.findall(key))
+
+
+def _compile_parts(parts):
+    """Convert text parts to 'TextPart' objects."""
+    return tuple(
+        TextPart(part) if isinstance(part, str) else part
+        for part in parts
+    )
+
+
+class TemplateFrameFormatter:
+    """Format paths of a template where only single key changes.
+
+    Parts of template which don't use the frame key are formatted once
+    on initialization and the result is compiled into a format string
+    which contains only the frame key. Optional parts using the frame key
+    are compiled too. If the frame key is used with sub-keys, formatter
+    falls back to formatting of whole template for each value.
+
+    Args:
+        template_obj (StringTemplate): Template object.
+        data (dict[str, Any]): Formatting data without the frame key.
+        frame_key (str): Key which changes for each path.
+        strict (bool): Raise 'TemplateUnsolved' if template can't be
+            solved with the data.
+    """
+
+    def __init__(self, template_obj, data, frame_key, strict):
+        self._template_obj = template_obj
+        self._data = data
+        self._frame_key = frame_key
+        self._strict = strict
+        self._format_string = self._compile()
+
+    @property
+    def template(self):
+        return self._template_obj.template
+
+    @property
+    def frame_key(self):
+        return self._frame_key
+
+    @property
+    def is_compiled(self):
+        """Frame values are filled without formatting of whole template."""
+        return self._format_string is not None
+
+    def format_result(self, value):
+        """Format whole template with the frame value.
+
+        Slower than 'format' but result contains all information about
+        formatting e.g. used values.
+
+        Args:
+            value (Union[int, str]): Value of frame key.
+
+        Returns:
+            TemplateResult: Formatting result.
+        """
+        data = dict(self._data)
+        data[self._frame_key] = value
+        if self._strict:
+            return self._template_obj.format_strict(data)
+        return self._template_obj.format(data)
+
+    def format(self, value):
+        """Fill the frame value.
+
+        Args:
+            value (Union[int, str]): Value of frame key.
+
+        Returns:
+            str: Filled template.
+        """
+        if (
+            self._format_string is None
+            or not FormattingPart.validate_value_type(value)
+        ):
+            return str(self.format_result(value))
+        return self._format_string.format_map({self._frame_key: value})
+
+    def format_many(self, values):
+        """Fill the frame values.
+
+        Args:
+            values (Iterable[Union[int, str]]): Values of frame key.
+
+        Returns:
+            list[str]: Filled templates in order of values.
+        """
+        if self._format_string is None:
+            return [self.format(value) for value in values]
+
+        format_string = self._format_string
+        frame_key = self._frame_key
+        output = []
+        for value in values:
+            if not FormattingPart.validate_value_type(value):
+                output.append(self.format(value))
+                continue
+            output.append(format_string.format_map({frame_key: value}))
+        return output
+
+    def _compile(self):
+        result = TemplatePartResult()
+        segments = self._compile_parts(self._template_obj.parts, result)
+        if segments is None:
+            return self._validate(None)
+        return self._validate("".join(segments), result)
+
+    def _compile_parts(self, parts, result):
+        """Compile parts to format string segments.
+
+        Optional parts which use the frame key are compiled too. Frame
+        value is always available, so whether optional part is filled
+        depends only on other keys which are already known.
+
+        Args:
+            parts (Iterable[Any]): Template parts.
+            result (TemplatePartResult): Result where formatting of parts
+                without the frame key is stored.
+
+        Returns:
+            Union[list[str], None]: Format string segments or None if
+                parts can't be compiled.
+        """
+        frame_key = self._frame_key
+        segments = []
+        for part in parts:
+            if isinstance(part, str):
+                segments.append(part.replace("{", "{{").replace("}", "}}"))
+                continue
+
+            if isinstance(part, OptionalPart):
+                if not self._part_uses_key(part, frame_key):
+                    is_static = True
+                else:
+                    optional_result = TemplatePartResult(True)
+                    optional_segments = self._compile_parts(
+                        part.parts, optional_result
+                    )
+                    if optional_segments is None:
+                        return None
+                    # Same logic as 'OptionalPart.format'
+                    if optional_result.solved:
+                        result.add_output(optional_result)
+                        segments.extend(optional_segments)
+                    continue
+            else:
+                key_subdict = part.get_key_subdict()
+                is_static = not key_subdict or key_subdict[0] != frame_key
+
+            if is_static:
+                output_len = len(result.output)
+                part.format(self._data, result)
+                segments.append(
+                    result.output[output_len:]
+                    .replace("{", "{{")
+                    .replace("}", "}}")
+                )
+                continue
+
+            # Frame key with sub-keys e.g. '{frame[value]}'
+            if len(key_subdict) != 1:
+                return None
+            segments.append(part.template)
+        return segments
+
+    def _validate(self, format_string, result=None):
+        # Fallback formatting is validated on each call
+        if not self._strict or result is None:
+            return format_string
+
+        if not result.solved:
+            invalid_types = dict(result.invalid_types)
+            invalid_types.update(result.invalid_optional_types)
+            raise TemplateUnsolved(
+                self.template,
+                result.missing_keys | result.missing_optional_keys,
+                result.split_keys_to_subdicts(invalid_types)
+            )
+        return format_string
+
+    @classmethod
+    def _part_uses_key(cls, part, key):
+        for sub_part in part.parts:
+            if isinstance(sub_part, str):
+                continue
+            if isinstance(sub_part, OptionalPart):
+                if cls._part_uses_key(sub_part, key):
+                    return True
+            elif sub_part.get_key_subdict()[:1] == [key]:
+                return True
+        return False
+
+
 class TemplateResult(str):
     """Result of template format with most of the information in.
 
@@ -297,6 +562,9 @@ class TemplatePartResult:
         # Is this result from optional part
         self._optional = True
 
+    def add_text(self, text):
+        self._output += text
+
     def add_output(self, other):
         if isinstance(other, str):
             self._output += other
@@ -369,10 +637,7 @@ class TemplatePartResult:
     def split_keys_to_subdicts(values):
         output = {}
         for key, value in values.items():
-            key_padding = list(KEY_PADDING_PATTERN.findall(key))
-            if key_padding:
-                key = key_padding[0]
-            key_subdict = list(SUB_DICT_PATTERN.findall(key))
+            key_subdict = list(_split_key(key))
             data = output
             last_key = key_subdict.pop(-1)
             for subkey in key_subdict:
@@ -428,6 +693,33 @@ class FormatObject:
         return self.__str__()
 
 
+class TextPart:
+    """Static text of template.
+
+    Args:
+        text (str): Text which is added to output as is.
+    """
+
+    __slots__ = ("_text",)
+
+    def __init__(self, text):
+        self._text = text
+
+    @property
+    def text(self):
+        return self._text
+
+    def __repr__(self):
+        return "<Text:{}>".format(self._text)
+
+    def __str__(self):
+        return self._text
+
+    def format(self, data, result):
+        result.add_text(self._text)
+        return result
+
+
 class FormattingPart:
     """String with formatting template.
 
@@ -439,6 +731,17 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Pre-parse the key so it is not parsed on each format
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._key_is_matched = self.validate_key_is_matched(key)
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
@@ -446,6 +749,18 @@ class FormattingPart:
     def __repr__(self):
         return "<Format:{}>".format(self._template)
 
+    def get_key_subdict(self):
+        """Keys to get value from formatting data.
+
+        Example:
+            >>> FormattingPart("{project[name]}").get_key_subdict()
+            ['project', 'name']
+
+        Returns:
+            list[str]: Keys path without padding or other modifiers.
+        """
+        return list(self._key_subdict)
+
     def __str__(self):
         return self._template
 
@@ -495,23 +810,21 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
-        if key in result.realy_used_values:
-            result.add_output(result.realy_used_values[key])
+        key = self._key
+        realy_used_values = result.realy_used_values
+        if key in realy_used_values:
+            result.add_text(realy_used_values[key])
             return result
 
         # ensure key is properly formed [({})] properly closed.
-        if not self.validate_key_is_matched(key):
+        if not self._key_is_matched:
             result.add_missing_key(key)
-            result.add_output(self.template)            
+            result.add_text(self.template)
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -566,7 +879,7 @@ class FormattingPart:
             formatted_value = self.template.format(**fill_data)
             result.add_realy_used_value(key, formatted_value)
             result.add_used_value(existence_check, formatted_value)
-            result.add_output(formatted_value)
+            result.add_text(formatted_value)
             return result
 
         result.add_invalid_type(key, value)
@@ -587,6 +900,7 @@ class OptionalPart:
 
     def __init__(self, parts):
         self._parts = parts
+        self._compiled_parts = _compile_parts(parts)
 
     @property
     def parts(self):
@@ -600,11 +914,8 @@ class OptionalPart:
 
     def format(self, data, result):
         new_result = TemplatePartResult(True)
-        for part in self._parts:
-            if isinstance(part, str):
-                new_result.add_output(part)
-            else:
-                part.format(data, new_result)
+        for part in self._compiled_parts:
+            part.format(data, new_result)
 
         if new_result.solved:
             result.add_output(new_result)
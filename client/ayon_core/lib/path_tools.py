@@ -1,5 +1,8 @@
 import os
 import re
+import sys
+import errno
+import shutil
 import logging
 import platform
 
@@ -65,6 +68,166 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+# Linux 'FICLONE' ioctl request code
+_FICLONE = 0x40049409
+# Errors meaning that filesystems don't support clone or copy offload
+_REFLINK_UNSUPPORTED_ERRNOS = {
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EXDEV,
+    errno.ENOTTY,
+    errno.ENOSYS,
+}
+# Errors meaning that clone or copy offload failed for the file, method is
+#   tried again for next files
+_REFLINK_FILE_ERRNOS = {
+    errno.EINVAL,
+    errno.EBADF,
+}
+# Available copy method by source and destination device ids
+_COPY_METHOD_BY_DEVICES = {}
+
+
+def create_reflink(src_path, dst_path):
+    """Create copy-on-write clone (reflink) of a file.
+
+    Cloned file shares data blocks with source file until one of them is
+    modified. Supported on Linux ('FICLONE', e.g. Btrfs or XFS) and
+    macOS ('clonefile', APFS).
+
+    Args:
+        src_path (str): Full path to a file which is cloned.
+        dst_path (str): Full path to a file where the clone is created.
+
+    Raises:
+        OSError: Filesystem or platform does not support reflinks.
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        with open(src_path, "rb") as src_stream:
+            with open(dst_path, "wb") as dst_stream:
+                try:
+                    fcntl.ioctl(
+                        dst_stream.fileno(), _FICLONE, src_stream.fileno()
+                    )
+                except OSError:
+                    dst_stream.close()
+                    os.remove(dst_path)
+                    raise
+        return
+
+    if sys.platform == "darwin":
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        result = libc.clonefile(
+            os.fsencode(src_path), os.fsencode(dst_path), 0
+        )
+        if result != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), dst_path)
+        return
+
+    raise OSError(
+        errno.EOPNOTSUPP,
+        "Reflinks are not supported on current platform",
+        dst_path
+    )
+
+
+def _copy_file_range(src_path, dst_path):
+    """Copy file using 'copy_file_range' syscall.
+
+    Kernel can offload the copy to filesystem, e.g. NFS server-side copy
+    or reflink on filesystems supporting it.
+    """
+    with open(src_path, "rb") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            try:
+                src_fd = src_stream.fileno()
+                dst_fd = dst_stream.fileno()
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        # Source is not a regular file or filesystem
+                        #   stopped copying, regular copy must be used
+                        raise OSError(
+                            errno.ENOSYS,
+                            "copy_file_range did not copy whole file",
+                            dst_path
+                        )
+                    remaining -= copied
+            except OSError:
+                dst_stream.close()
+                os.remove(dst_path)
+                raise
+
+
+def copy_file_with_reflink(src_path, dst_path, copy_func=None):
+    """Copy file using reflink or copy offload if possible.
+
+    Tries copy-on-write clone first, then 'copy_file_range' where available
+    and falls back to regular copy. Methods which are not supported are
+    cached for pair of source and destination filesystems so they are not
+    tried again for next files. Methods which failed only for the file
+    (e.g. 'EINVAL') are tried again for next files.
+
+    Destination directory must exist.
+
+    Args:
+        src_path (str): Full path to source file.
+        dst_path (str): Full path to destination file.
+        copy_func (Optional[Callable[[str, str], Any]]): Function used
+            for regular copy. 'shutil.copyfile' is used if not passed.
+
+    Returns:
+        str: Used method 'reflink', 'copy_file_range' or 'copy'.
+    """
+    if copy_func is None:
+        copy_func = shutil.copyfile
+
+    devices_key = (
+        os.stat(src_path).st_dev,
+        os.stat(os.path.dirname(dst_path)).st_dev,
+    )
+    methods = _COPY_METHOD_BY_DEVICES.get(devices_key)
+    if methods is None:
+        methods = ["reflink"]
+        if hasattr(os, "copy_file_range"):
+            methods.append("copy_file_range")
+
+    # Methods which failed only for this file are kept for next files
+    available_methods = []
+    for method in methods:
+        func = create_reflink
+        if method == "copy_file_range":
+            func = _copy_file_range
+
+        try:
+            func(src_path, dst_path)
+        except OSError as exc:
+            if exc.errno in _REFLINK_FILE_ERRNOS:
+                available_methods.append(method)
+            elif exc.errno not in _REFLINK_UNSUPPORTED_ERRNOS:
+                raise
+            log.debug(
+                "Method '{}' failed for '{}' -> '{}': {}".format(
+                    method, src_path, dst_path, exc)
+            )
+            continue
+
+        available_methods.append(method)
+        _COPY_METHOD_BY_DEVICES[devices_key] = available_methods
+        return method
+
+    _COPY_METHOD_BY_DEVICES[devices_key] = available_methods
+    copy_func(src_path, dst_path)
+    return "copy"
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
@@ -1,8 +1,13 @@
 import re
 import logging
+import threading
+import collections
 
 log = logging.getLogger(__name__)
 
+# Characters which make a pattern a regex and not a plain string
+_REGEX_SPECIAL_CHARS = frozenset("\\.^$*+?{}[]|()")
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -116,6 +121,286 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+def _prepare_keys_order(key_values, keys_order):
+    if not keys_order:
+        return tuple(key_values.keys())
+
+    _keys_order = list(keys_order)
+    # Make all keys from `key_values` are passed
+    for key in key_values.keys():
+        if key not in _keys_order:
+            _keys_order.append(key)
+    return tuple(_keys_order)
+
+
+class _ProfileKeyFilter:
+    """Compiled filter of a single key in a profile.
+
+    Plain strings are compared with set lookup, regexes are compiled
+    only once.
+
+    Args:
+        in_list (Union[list[str], tuple[str], set[str]]): Profile value
+            of the key.
+    """
+
+    def __init__(self, in_list):
+        literals = set()
+        patterns = []
+        for item in in_list:
+            if isinstance(item, str) and not (
+                _REGEX_SPECIAL_CHARS.intersection(item)
+            ):
+                if item:
+                    literals.add(item)
+            else:
+                patterns.append(item)
+
+        self._literals = literals
+        self._regexes = compile_list_of_regexes(patterns)
+
+    def validate(self, value):
+        """Same as 'validate_value_by_regexes' with compiled filter.
+
+        Returns:
+            int: '1' when value matches and '-1' when does not.
+        """
+        if not value:
+            return -1
+
+        if value in self._literals:
+            return 1
+
+        for regex in self._regexes:
+            if regex.fullmatch(value):
+                return 1
+        return -1
+
+
+class ProfilesMatcher:
+    """Find most matching profile with precompiled profiles.
+
+    Logic is the same as in 'filter_profiles'. Filters of profiles are
+    compiled only once and results are memoized by passed values, so
+    querying the same profiles multiple times is cheap.
+
+    Profiles must not be modified after the matcher is created.
+
+    Args:
+        profiles_data (list[dict[str, Any]]): Profile definitions.
+        max_cache_size (int): Maximum number of memoized results.
+    """
+    _not_set = object()
+
+    def __init__(self, profiles_data, max_cache_size=1024):
+        self._profiles = list(profiles_data or [])
+        self._filters = [{} for _ in self._profiles]
+        self._results = {}
+        self._max_cache_size = max_cache_size
+        self._lock = threading.Lock()
+
+    @property
+    def profiles(self):
+        return self._profiles
+
+    def _get_filter(self, idx, key):
+        filters = self._filters[idx]
+        key_filter = filters.get(key, self._not_set)
+        if key_filter is self._not_set:
+            in_list = self._profiles[idx].get(key)
+            key_filter = None
+            if in_list:
+                if not isinstance(in_list, (list, tuple, set)):
+                    in_list = [in_list]
+                if "*" not in in_list:
+                    key_filter = _ProfileKeyFilter(in_list)
+            filters[key] = key_filter
+        return key_filter
+
+    def match(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for passed values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if
+                is available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            Union[dict[str, Any], None]: Most matching profile or None if
+                none of profiles match at least one criteria.
+        """
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        keys_order = _prepare_keys_order(key_values, keys_order)
+        try:
+            cache_key = (
+                keys_order,
+                tuple(key_values[key] for key in keys_order)
+            )
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None:
+            with self._lock:
+                idx = self._results.get(cache_key, self._not_set)
+            if idx is not self._not_set:
+                if idx is None:
+                    return None
+                profile = self._profiles[idx]
+                logger.debug("Profile selected: %s", profile)
+                return profile
+
+        idx = self._find_profile_idx(key_values, keys_order, logger)
+        if cache_key is not None:
+            with self._lock:
+                if len(self._results) >= self._max_cache_size:
+                    self._results.clear()
+                self._results[cache_key] = idx
+
+        if idx is None:
+            return None
+        return self._profiles[idx]
+
+    def _find_profile_idx(self, key_values, keys_order, logger):
+        log_parts = " | ".join([
+            "{}: \"{}\"".format(*item)
+            for item in key_values.items()
+        ])
+
+        logger.debug(
+            "Looking for matching profile for: {}".format(log_parts)
+        )
+
+        matching_profiles = None
+        highest_profile_points = -1
+        for idx, profile in enumerate(self._profiles):
+            profile_points = 0
+            profile_scores = []
+
+            for key in keys_order:
+                value = key_values[key]
+                key_filter = self._get_filter(idx, key)
+                match = 0
+                if key_filter is not None:
+                    match = key_filter.validate(value)
+
+                if match == -1:
+                    profile_value = profile.get(key) or []
+                    logger.debug(
+                        "\"{}\" not found in \"{}\": {}".format(
+                            value, key, profile_value
+                        )
+                    )
+                    profile_points = -1
+                    break
+
+                profile_points += match
+                profile_scores.append(bool(match))
+
+            if (
+                profile_points < 0
+                or profile_points < highest_profile_points
+            ):
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            if profile_points == highest_profile_points:
+                matching_profiles.append((idx, profile_scores))
+
+        if not matching_profiles:
+            logger.debug(
+                "None of profiles match your setup. {}".format(log_parts)
+            )
+            return None
+
+        if len(matching_profiles) > 1:
+            logger.debug(
+                "More than one profile match your setup. {}".format(
+                    log_parts
+                )
+            )
+
+        idx = _profile_exclusion(matching_profiles, logger)
+        logger.debug(
+            "Profile selected: {}".format(self._profiles[idx])
+        )
+        return idx
+
+
+class _ProfilesMatchersCache:
+    """Matchers of profiles lists used by 'filter_profiles'.
+
+    Matchers are cached by identity of profiles list. Cached matcher is
+    used only if profiles list contains the same profile objects.
+
+    Matcher is cached only when the same profiles list is used second
+    time. Lists which are used only once, e.g. from deep copied settings,
+    don't push out matchers of lists which are used repeatedly.
+    """
+    max_size = 128
+    max_seen_size = 1024
+    _matchers = collections.OrderedDict()
+    # Ids of profiles lists used once -> ids of their profiles
+    _seen = collections.OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_matcher(cls, profiles_data):
+        key = id(profiles_data)
+        profile_ids = tuple(id(profile) for profile in profiles_data)
+        with cls._lock:
+            item = cls._matchers.get(key)
+            if item is not None:
+                matcher, source, cached_ids = item
+                if source is profiles_data and cached_ids == profile_ids:
+                    cls._matchers.move_to_end(key)
+                    return matcher
+
+            # Id of a list can be reused by a different list after the
+            #   first one was garbage collected, that only leads to
+            #   caching of the matcher sooner
+            seen_ids = cls._seen.pop(key, None)
+            use_cache = seen_ids == profile_ids
+            if not use_cache:
+                cls._seen[key] = profile_ids
+                while len(cls._seen) > cls.max_seen_size:
+                    cls._seen.popitem(last=False)
+
+        matcher = ProfilesMatcher(profiles_data)
+        if not use_cache:
+            return matcher
+
+        with cls._lock:
+            # Source list is stored to keep its id from being reused
+            cls._matchers[key] = (matcher, profiles_data, profile_ids)
+            cls._matchers.move_to_end(key)
+            while len(cls._matchers) > cls.max_size:
+                cls._matchers.popitem(last=False)
+        return matcher
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._matchers.clear()
+            cls._seen.clear()
+
+
+def clear_profiles_matchers_cache():
+    """Clear matchers cached by 'filter_profiles'."""
+    _ProfilesMatchersCache.clear()
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -149,79 +434,8 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
-    if not logger:
-        logger = log
-
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
+    if isinstance(profiles_data, (list, tuple)):
+        matcher = _ProfilesMatchersCache.get_matcher(profiles_data)
     else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
-
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
-    )
-
-    matching_profiles = None
-    highest_profile_points = -1
-    # Each profile get 1 point for each matching filter. Profile with most
-    # points is returned. For cases when more than one profile will match
-    # are also stored ordered lists of matching values.
-    for profile in profiles_data:
-        profile_points = 0
-        profile_scores = []
-
-        for key in keys_order:
-            value = key_values[key]
-            match = validate_value_by_regexes(value, profile.get(key))
-            if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
-                profile_points = -1
-                break
-
-            profile_points += match
-            profile_scores.append(bool(match))
-
-        if (
-            profile_points < 0
-            or profile_points < highest_profile_points
-        ):
-            continue
-
-        if profile_points > highest_profile_points:
-            matching_profiles = []
-            highest_profile_points = profile_points
-
-        if profile_points == highest_profile_points:
-            matching_profiles.append((profile, profile_scores))
-
-    if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.debug(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
-        logger.debug(
-            "Profile selected: {}".format(profile)
-        )
-    return profile
+        matcher = ProfilesMatcher(profiles_data)
+    return matcher.match(key_values, keys_order, logger)
@@ -1,8 +1,29 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and startup profiling.
+
+Startup profiling is enabled with 'AYON_STARTUP_PROFILE' environment
+variable or '--profile-startup' argument of AYON CLI. Value of the
+environment variable can be '1', path to output directory or path to
+output file. Process id is added to filename of output file, or is
+filled to '{pid}' key if the path contains it, so child processes
+inheriting the environment don't overwrite the file. Import time of
+modules, addons initialization, plugins discovery and settings queries
+are stored to a Chrome trace json file which can be opened in
+'chrome://tracing' or 'https://ui.perfetto.dev'.
+"""
 import os
+import sys
+import copy
+import json
+import time
+import atexit
+import functools
+import threading
+import contextlib
 import cProfile
 
+STARTUP_PROFILE_ENV_KEY = "AYON_STARTUP_PROFILE"
+
 
 def do_profile(fn, to_file=None):
     """Wraps function in profiler run and print stat after it is done.
@@ -27,3 +48,308 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+class _StartupProfiler:
+    enabled = False
+    output_path = None
+    start_time = None
+    events = []
+    reports = []
+    lock = threading.Lock()
+    import_finder = None
+
+
+class _ProfiledLoader:
+    """Loader proxy measuring execution time of a module.
+
+    Proxy is created for each imported module so loaders shared by multiple
+    modules are never modified.
+
+    Args:
+        loader (importlib.abc.Loader): Loader found by other finders.
+        fullname (str): Full name of imported module.
+    """
+
+    def __init__(self, loader, fullname):
+        self._loader = loader
+        self._fullname = fullname
+
+    def __getattr__(self, attr_name):
+        return getattr(self._loader, attr_name)
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        if create_module is None:
+            return None
+        return create_module(spec)
+
+    def exec_module(self, module):
+        # Module should not know about the proxy
+        module.__loader__ = self._loader
+        module_spec = getattr(module, "__spec__", None)
+        if module_spec is not None:
+            module_spec.loader = self._loader
+
+        with profile_section(self._fullname, "import"):
+            self._loader.exec_module(module)
+
+
+class _ImportProfilerFinder:
+    """Meta path finder measuring execution time of imported modules.
+
+    Finder does not import anything. It finds spec using other finders and
+    returns copy of the spec with loader proxy.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "searching", False):
+            return None
+
+        self._local.searching = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                if finder is self:
+                    continue
+                find_spec = getattr(finder, "find_spec", None)
+                if find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.searching = False
+
+        loader = getattr(spec, "loader", None)
+        if loader is None or not hasattr(loader, "exec_module"):
+            return spec
+
+        spec = copy.copy(spec)
+        spec.loader = _ProfiledLoader(loader, fullname)
+        return spec
+
+
+def _get_default_output_filename():
+    return "ayon_startup_{}_{}.json".format(
+        time.strftime("%Y%m%d_%H%M%S"), os.getpid()
+    )
+
+
+def _get_output_path_from_env():
+    """Output path of current process based on environment variable.
+
+    Returns:
+        Union[str, None]: Path to output file or None if environment
+            variable does not contain a path.
+    """
+    value = os.getenv(STARTUP_PROFILE_ENV_KEY)
+    if not value or value == "1":
+        return None
+
+    if "{pid}" in value:
+        return value.format(pid=os.getpid())
+
+    base, ext = os.path.splitext(value)
+    if ext.lower() == ".json":
+        return "{}_{}{}".format(base, os.getpid(), ext)
+    return os.path.join(value, _get_default_output_filename())
+
+
+def is_startup_profiling_enabled():
+    """Is startup profiling running.
+
+    Returns:
+        bool: Startup profiling is enabled.
+    """
+    return _StartupProfiler.enabled
+
+
+def start_startup_profiling(output_path=None):
+    """Start startup profiling.
+
+    Profile is written to output path when process ends.
+
+    Args:
+        output_path (Optional[str]): Path to output json file. Path based
+            on 'AYON_STARTUP_PROFILE' environment variable is used if not
+            passed, or file in launcher local directory.
+
+    Returns:
+        str: Path to output file.
+    """
+    if _StartupProfiler.enabled:
+        return _StartupProfiler.output_path
+
+    if output_path is None:
+        output_path = _get_output_path_from_env()
+
+    if not output_path:
+        from .local_settings import get_launcher_local_dir
+
+        output_path = get_launcher_local_dir(
+            "startup_profiles", _get_default_output_filename()
+        )
+
+    _StartupProfiler.enabled = True
+    _StartupProfiler.output_path = output_path
+    _StartupProfiler.start_time = time.perf_counter()
+
+    finder = _ImportProfilerFinder()
+    _StartupProfiler.import_finder = finder
+    sys.meta_path.insert(0, finder)
+    atexit.register(write_startup_profile)
+    return output_path
+
+
+def stop_startup_profiling():
+    """Stop startup profiling and write profile to output file.
+
+    Returns:
+        Union[str, None]: Path to output file.
+    """
+    if not _StartupProfiler.enabled:
+        return None
+    output_path = write_startup_profile()
+    _StartupProfiler.enabled = False
+    finder = _StartupProfiler.import_finder
+    _StartupProfiler.import_finder = None
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
+    atexit.unregister(write_startup_profile)
+    return output_path
+
+
+def add_startup_profile_event(name, category, start, end, args=None):
+    """Add event to startup profile.
+
+    Args:
+        name (str): Event name.
+        category (str): Event category e.g. "import" or "addons".
+        start (float): Start time from 'time.perf_counter'.
+        end (float): End time from 'time.perf_counter'.
+        args (Optional[dict[str, Any]]): Additional data of event.
+    """
+    if not _StartupProfiler.enabled:
+        return
+
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": round(start * 1000000, 3),
+        "dur": round((end - start) * 1000000, 3),
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+    }
+    if args:
+        event["args"] = args
+    with _StartupProfiler.lock:
+        _StartupProfiler.events.append(event)
+
+
+@contextlib.contextmanager
+def profile_section(name, category="ayon", **kwargs):
+    """Measure duration of code block when startup profiling is enabled.
+
+    Args:
+        name (str): Section name.
+        category (str): Section category.
+        **kwargs: Additional data stored to event.
+    """
+    if not _StartupProfiler.enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_startup_profile_event(
+            name, category, start, time.perf_counter(), kwargs
+        )
+
+
+def profile_function(category="ayon"):
+    """Decorator measuring function duration in startup profile.
+
+    Args:
+        category (str): Category of events.
+    """
+    def decorator(func):
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _StartupProfiler.enabled:
+                return func(*args, **kwargs)
+            with profile_section(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def add_startup_profile_report(label, report):
+    """Add report data to startup profile.
+
+    Report is serialized when profile is written, so the object can be
+    changed until then.
+
+    Args:
+        label (str): Report label.
+        report (Any): Json serializable report data.
+    """
+    if not _StartupProfiler.enabled:
+        return
+    with _StartupProfiler.lock:
+        _StartupProfiler.reports.append((label, report))
+
+
+def write_startup_profile(output_path=None):
+    """Write collected startup profile to a json file.
+
+    Output is in Chrome trace format with additional "ayonReports" key.
+
+    Args:
+        output_path (Optional[str]): Path to output file. Path from
+            'start_startup_profiling' is used if not passed.
+
+    Returns:
+        Union[str, None]: Path to output file.
+    """
+    if output_path is None:
+        output_path = _StartupProfiler.output_path
+    if not output_path:
+        return None
+
+    with _StartupProfiler.lock:
+        events = list(_StartupProfiler.events)
+        reports = {}
+        for label, report in _StartupProfiler.reports:
+            if label in reports:
+                label = "{} ({})".format(label, len(reports))
+            reports[label] = report
+
+    total = 0.0
+    if _StartupProfiler.start_time is not None:
+        total = time.perf_counter() - _StartupProfiler.start_time
+
+    dirpath = os.path.dirname(output_path)
+    if dirpath:
+        os.makedirs(dirpath, exist_ok=True)
+
+    with open(output_path, "w") as stream:
+        json.dump(
+            {
+                "traceEvents": events,
+                "displayTimeUnit": "ms",
+                "ayonReports": reports,
+                "ayonTotalSeconds": total,
+            },
+            stream,
+            default=str
+        )
+    return output_path
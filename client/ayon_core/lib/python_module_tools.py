@@ -2,19 +2,243 @@ import os
 import sys
 import types
 import importlib
+import importlib.util
 import inspect
 import logging
+import platform
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 log = logging.getLogger(__name__)
 
+# Maximum number of threads used to pre-read python files
+PREREAD_MAX_WORKERS = 8
+# Minimum number of files to pre-read them in parallel
+PREREAD_MIN_FILES = 16
+# Force pre-read on ('1') or off ('0'), by default are pre-read only files
+#   on network filesystem
+PREREAD_ENV_KEY = "AYON_PREREAD_PYTHON_FILES"
+# Filesystem types (from '/proc/mounts') considered as network filesystems
+_NETWORK_FS_TYPES = {
+    "nfs",
+    "nfs4",
+    "cifs",
+    "smbfs",
+    "smb3",
+    "afs",
+    "ceph",
+    "glusterfs",
+    "lustre",
+    "gpfs",
+    "beegfs",
+    "9p",
+    "fuse.sshfs",
+}
+
+
+class PrereadFile:
+    """Content of python file and its cached bytecode read in advance.
 
-def import_filepath(filepath, module_name=None):
+    Args:
+        filepath (str): Path to python file.
+        path_stats (Union[dict[str, Any], None]): Source file stats in format
+            of 'importlib.abc.SourceLoader.path_stats'.
+        data (dict[str, bytes]): Content of files by path.
+        missing_paths (Optional[set[str]]): Paths which were not found.
+    """
+
+    def __init__(self, filepath, path_stats, data, missing_paths=None):
+        if missing_paths is None:
+            missing_paths = set()
+        self.filepath = filepath
+        self.path_stats = path_stats
+        self.data = data
+        self.missing_paths = missing_paths
+
+    @classmethod
+    def read(cls, filepath):
+        """Read python file and its cached bytecode.
+
+        Errors are not raised, the file will be read again on import.
+
+        Args:
+            filepath (str): Path to python file.
+
+        Returns:
+            PrereadFile: Object with read data.
+        """
+        path_stats = None
+        data = {}
+        missing_paths = set()
+        try:
+            stat = os.stat(filepath)
+            path_stats = {"mtime": stat.st_mtime, "size": stat.st_size}
+            with open(filepath, "rb") as stream:
+                data[filepath] = stream.read()
+        except OSError:
+            return cls(filepath, None, {})
+
+        try:
+            bytecode_path = importlib.util.cache_from_source(filepath)
+        except (NotImplementedError, ValueError):
+            bytecode_path = None
+
+        if bytecode_path:
+            try:
+                with open(bytecode_path, "rb") as stream:
+                    data[bytecode_path] = stream.read()
+            except FileNotFoundError:
+                missing_paths.add(bytecode_path)
+            except OSError:
+                pass
+        return cls(filepath, path_stats, data, missing_paths)
+
+
+class _PrereadSourceFileLoader(importlib.machinery.SourceFileLoader):
+    """Source file loader using data read in advance."""
+
+    def __init__(self, fullname, path, preread):
+        super().__init__(fullname, path)
+        self._preread = preread
+
+    def path_stats(self, path):
+        if path == self._preread.filepath and self._preread.path_stats:
+            return self._preread.path_stats
+        return super().path_stats(path)
+
+    def get_data(self, path):
+        data = self._preread.data.get(path)
+        if data is not None:
+            return data
+        if path in self._preread.missing_paths:
+            raise FileNotFoundError(path)
+        return super().get_data(path)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_linux_mounts():
+    mounts = []
+    try:
+        with open("/proc/mounts", "r") as stream:
+            for line in stream:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                # Spaces in mount point are escaped as octal
+                mount_point = parts[1].replace("\\040", " ")
+                mounts.append((mount_point, parts[2]))
+    except OSError:
+        pass
+    # Longest mount points first
+    mounts.sort(key=lambda item: len(item[0]), reverse=True)
+    return mounts
+
+
+@functools.lru_cache(maxsize=128)
+def _is_network_path(dirpath):
+    """Is directory on a network filesystem.
+
+    Detection is available on Windows (UNC paths and network drives) and
+    Linux (filesystem type of mount point). Returns False on other
+    platforms.
+
+    Args:
+        dirpath (str): Path to directory.
+
+    Returns:
+        bool: Directory is on a network filesystem.
+    """
+    platform_name = platform.system().lower()
+    if platform_name == "windows":
+        dirpath = os.path.abspath(dirpath)
+        if dirpath.startswith("\\\\"):
+            return True
+        drive = os.path.splitdrive(dirpath)[0]
+        if not drive:
+            return False
+        import ctypes
+
+        # DRIVE_REMOTE
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == 4
+
+    if platform_name == "linux":
+        dirpath = os.path.realpath(dirpath)
+        for mount_point, fs_type in _get_linux_mounts():
+            if (
+                dirpath == mount_point
+                or dirpath.startswith(mount_point.rstrip("/") + "/")
+            ):
+                return fs_type in _NETWORK_FS_TYPES
+    return False
+
+
+def _should_preread_files(filepaths):
+    env_value = os.getenv(PREREAD_ENV_KEY)
+    if env_value in ("0", "1"):
+        return env_value == "1"
+
+    if len(filepaths) < PREREAD_MIN_FILES:
+        return False
+
+    # Parallel reading is slower on local disk
+    dirpaths = {os.path.dirname(filepath) for filepath in filepaths}
+    return any(_is_network_path(dirpath) for dirpath in dirpaths)
+
+
+def preread_python_files(filepaths, max_workers=None, enabled=None):
+    """Read python files and their cached bytecode in multiple threads.
+
+    Reading files in parallel lowers time spent on waiting for filesystem,
+    which is noticeable on network drives. On local disk it is slower than
+    reading the files during import, so by default are files pre-read only
+    if there is at least 'PREREAD_MIN_FILES' files on network filesystem.
+    Behavior can be forced with 'AYON_PREREAD_PYTHON_FILES' environment
+    variable set to '1' or '0'. Output can be passed to 'import_filepath'.
+
+    Args:
+        filepaths (Iterable[str]): Paths to python files.
+        max_workers (Optional[int]): Maximum number of threads.
+        enabled (Optional[bool]): Pre-read files without checking
+            filesystem and environment variable.
+
+    Returns:
+        dict[str, PrereadFile]: Read data by filepath. Empty if files
+            are not pre-read.
+    """
+    filepaths = list(filepaths)
+    if not filepaths:
+        return {}
+
+    if enabled is None:
+        enabled = _should_preread_files(filepaths)
+
+    if not enabled:
+        return {}
+
+    if max_workers is None:
+        max_workers = PREREAD_MAX_WORKERS
+    max_workers = min(max_workers, len(filepaths))
+    if max_workers < 2:
+        return {
+            filepath: PrereadFile.read(filepath)
+            for filepath in filepaths
+        }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(
+            filepaths, executor.map(PrereadFile.read, filepaths)
+        ))
+
+
+def import_filepath(filepath, module_name=None, preread=None):
     """Import python file as python module.
 
     Args:
         filepath (str): Path to python file.
         module_name (str): Name of loaded module. Only for Python 3. By default
             is filled with filename of filepath.
+        preread (Optional[PrereadFile]): Content of file read in advance
+            using 'preread_python_files'.
 
     """
     if module_name is None:
@@ -25,9 +249,14 @@ def import_filepath(filepath, module_name=None):
     module.__file__ = filepath
 
     # Use loader so module has full specs
-    module_loader = importlib.machinery.SourceFileLoader(
-        module_name, filepath
-    )
+    if preread is not None:
+        module_loader = _PrereadSourceFileLoader(
+            module_name, filepath, preread
+        )
+    else:
+        module_loader = importlib.machinery.SourceFileLoader(
+            module_name, filepath
+        )
     module_loader.exec_module(module)
     return module
 
@@ -62,6 +291,7 @@ def modules_from_path(folder_path):
         log.warning("Not a directory path: {}".format(folder_path))
         return output
 
+    filepaths = []
     for filename in os.listdir(folder_path):
         # Ignore files which start with underscore
         if filename.startswith("_"):
@@ -74,9 +304,17 @@ def modules_from_path(folder_path):
         full_path = os.path.join(folder_path, filename)
         if not os.path.isfile(full_path):
             continue
+        filepaths.append((full_path, mod_name))
 
+    # Read files in parallel and import them in original order
+    preread_files = preread_python_files(
+        full_path for full_path, _ in filepaths
+    )
+    for full_path, mod_name in filepaths:
         try:
-            module = import_filepath(full_path, mod_name)
+            module = import_filepath(
+                full_path, mod_name, preread_files.get(full_path)
+            )
             modules.append((full_path, module))
 
         except Exception:
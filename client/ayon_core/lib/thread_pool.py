@@ -0,0 +1,79 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def run_in_thread_pool(
+    func, items, max_workers=None, logger=None, result_callback=None
+):
+    """Call function for each item using a pool of worker threads.
+
+    First failed call cancels all calls that did not start yet. Calls that
+    were already running are awaited, then the first error is re-raised.
+
+    Items are processed one by one in current thread when 'max_workers'
+    is lower than 2 or there is only one item.
+
+    Args:
+        func (Callable[[Any], Any]): Function called with each item.
+        items (Iterable[Any]): Items to process.
+        max_workers (Optional[int]): Maximum number of worker threads.
+            Number of CPUs is used if not passed.
+        logger (Optional[logging.Logger]): Logger used to log errors
+            which are not re-raised.
+        result_callback (Optional[Callable[[Any, Any], None]]): Called
+            with item and result of each successful call in order of
+            items. Is called also when other call failed.
+
+    Returns:
+        list[Any]: Results of calls in order of items.
+
+    Raises:
+        Exception: First error raised by 'func'.
+    """
+    items = list(items)
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+
+    results = []
+    if max_workers < 2 or len(items) < 2:
+        for item in items:
+            result = func(item)
+            if result_callback is not None:
+                result_callback(item, result)
+            results.append(result)
+        return results
+
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    first_exc = None
+    max_workers = min(max_workers, len(items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        for future in as_completed(futures):
+            exc = future.exception()
+            if exc is None:
+                continue
+            first_exc = exc
+            for other_future in futures:
+                other_future.cancel()
+            break
+
+    for item, future in zip(items, futures):
+        if future.cancelled():
+            continue
+        exc = future.exception()
+        if exc is None:
+            result = future.result()
+            if result_callback is not None:
+                result_callback(item, result)
+            results.append(result)
+        elif exc is not first_exc:
+            logger.error(
+                "Failed to process item: {}".format(item), exc_info=exc
+            )
+
+    if first_exc is not None:
+        raise first_exc
+    return results
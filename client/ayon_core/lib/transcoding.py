@@ -2,6 +2,9 @@ import os
 import re
 import logging
 import json
+import struct
+import hashlib
+import threading
 import collections
 import tempfile
 import subprocess
@@ -11,6 +14,8 @@ from typing import Optional
 import xml.etree.ElementTree
 
 from .execute import run_subprocess
+from .thread_pool import run_in_thread_pool
+from .local_settings import get_launcher_local_dir
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
     get_oiio_tool_args,
@@ -41,6 +46,37 @@ INT_TAGS = {
 
 XML_CHAR_REF_REGEX_HEX = re.compile(r"&#x?[0-9a-fA-F]+;")
 
+# OpenEXR header constants
+EXR_MAGIC_NUMBER = 20000630
+EXR_NON_IMAGE_FLAG = 0x800
+EXR_MULTIPART_FLAG = 0x1000
+EXR_COMPRESSION_NAMES = (
+    "none", "rle", "zips", "zip", "piz", "pxr24",
+    "b44", "b44a", "dwaa", "dwab", "htj2k",
+)
+EXR_PIXEL_TYPE_NAMES = ("uint", "half", "float")
+# Channel names ordered before other channels of a layer by OIIO
+EXR_SPECIAL_CHANNEL_NAMES = (
+    "r", "red", "g", "green", "b", "blue", "y", "real", "imag",
+    "a", "alpha", "ar", "ra", "ag", "ga", "ab", "ba",
+    "z", "depth", "zback",
+)
+# EXR attribute names renamed by OIIO
+EXR_OIIO_ATTRIB_NAMES = {
+    "cameraTransform": "worldtocamera",
+    "capDate": "DateTime",
+    "comments": "ImageDescription",
+    "owner": "Copyright",
+    "pixelAspectRatio": "PixelAspectRatio",
+    "xDensity": "XResolution",
+    "expTime": "ExposureTime",
+    "aperture": "FNumber",
+    "dwaCompressionLevel": "openexr:dwaCompressionLevel",
+    "lineOrder": "openexr:lineOrder",
+    "chunkCount": "openexr:chunkCount",
+    "name": "oiio:subimagename",
+}
+
 # Regex to parse array attributes
 ARRAY_TYPE_REGEX = re.compile(r"^(int|float|string)\[\d+\]$")
 
@@ -67,6 +103,136 @@ VIDEO_EXTENSIONS = {
 }
 
 
+class _MediaInfoCache:
+    """Cache of outputs of media probing tools.
+
+    Outputs are cached by file path, size and modification time so changed
+    file is probed again. Cache is stored in memory with limited number
+    of items. Outputs can be also stored on disk under launcher local
+    directory so unchanged files are not probed again in other processes.
+    Disk storage is enabled with 'AYON_MEDIA_INFO_DISK_CACHE' environment
+    variable set to '1'.
+
+    Args:
+        max_items (Optional[int]): Maximum number of items in memory.
+    """
+
+    disk_cache_env_key = "AYON_MEDIA_INFO_DISK_CACHE"
+
+    def __init__(self, max_items=512):
+        self._max_items = max_items
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_output(self, tool_name, filepath, args, func):
+        """Get cached output or call function to get the output.
+
+        Args:
+            tool_name (str): Name of tool which creates the output.
+            filepath (str): Path to probed file.
+            args (Iterable[str]): Additional arguments affecting the output.
+            func (Callable[[], str]): Function returning the output.
+
+        Returns:
+            str: Output of the tool.
+        """
+        key = self._get_key(tool_name, filepath, args)
+        if key is None:
+            return func()
+
+        with self._lock:
+            output = self._items.get(key)
+            if output is not None:
+                self._items.move_to_end(key)
+                return output
+
+        output = self._read_from_disk(key)
+        if output is None:
+            output = func()
+            # Don't cache empty output of failed probe
+            if not output:
+                return output
+            self._write_to_disk(key, output)
+
+        with self._lock:
+            self._items[key] = output
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+        return output
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def _get_key(self, tool_name, filepath, args):
+        try:
+            file_stat = os.stat(filepath)
+        except OSError:
+            return None
+        return (
+            tool_name,
+            os.path.normpath(os.path.abspath(filepath)),
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+            tuple(args),
+        )
+
+    def _is_disk_cache_enabled(self):
+        return os.getenv(self.disk_cache_env_key) == "1"
+
+    def _get_disk_path(self, key):
+        key_hash = hashlib.sha1(
+            json.dumps(key).encode("utf-8")
+        ).hexdigest()
+        return get_launcher_local_dir(
+            "media_info_cache", key[0], key_hash[:2], key_hash + ".json"
+        )
+
+    def _read_from_disk(self, key):
+        if not self._is_disk_cache_enabled():
+            return None
+        path = self._get_disk_path(key)
+        try:
+            with open(path, "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return None
+
+        # Compare full key in case of hash collision
+        if data.get("key") != json.loads(json.dumps(key)):
+            return None
+        return data.get("output")
+
+    def _write_to_disk(self, key, output):
+        if not self._is_disk_cache_enabled():
+            return
+        path = self._get_disk_path(key)
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump({"key": key, "output": output}, stream)
+            os.replace(tmp_path, path)
+        except OSError:
+            logging.getLogger(__name__).debug(
+                "Failed to store media info cache to \"{}\"".format(path),
+                exc_info=True
+            )
+
+
+_MEDIA_INFO_CACHE = _MediaInfoCache()
+
+
+def clear_media_info_cache():
+    """Clear in-memory cache of 'oiiotool' and 'ffprobe' outputs.
+
+    Cache is invalidated automatically when file size or modification time
+    changes, clearing is needed only if files are replaced without
+    changing those.
+    """
+    _MEDIA_INFO_CACHE.clear()
+
+
 def get_transcode_temp_directory():
     """Creates temporary folder for transcoding.
 
@@ -84,17 +250,22 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     Stdout should contain xml format string.
     """
-    args = get_oiio_tool_args(
-        "oiiotool",
-        "--info",
-        "-v"
-    )
-    if subimages:
-        args.append("-a")
+    cache_args = ["-a"] if subimages else []
 
-    args.extend(["-i:infoformat=xml", filepath])
+    def _get_output():
+        args = get_oiio_tool_args(
+            "oiiotool",
+            "--info",
+            "-v"
+        )
+        args.extend(cache_args)
+        args.extend(["-i:infoformat=xml", filepath])
+        return run_subprocess(args, logger=logger)
 
-    output = run_subprocess(args, logger=logger)
+    # Output is cached, the same file is probed only once
+    output = _MEDIA_INFO_CACHE.get_output(
+        "oiiotool", filepath, cache_args, _get_output
+    )
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -317,6 +488,308 @@ def parse_oiio_xml_output(xml_string, logger=None):
     return output
 
 
+class _EXRHeaderReader:
+    """Read OpenEXR header attributes from a file stream.
+
+    Only header bytes are read, pixel data are never touched.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def read(self, size):
+        data = self._stream.read(size)
+        if len(data) != size:
+            raise ValueError("Unexpected end of EXR header")
+        return data
+
+    def skip(self, size):
+        self._stream.seek(size, os.SEEK_CUR)
+
+    def read_int(self):
+        return struct.unpack("<i", self.read(4))[0]
+
+    def read_null_terminated(self):
+        chars = []
+        while True:
+            char = self.read(1)
+            if char == b"\0":
+                break
+            chars.append(char)
+            # Names are limited to 255 characters in EXR
+            if len(chars) > 255:
+                raise ValueError("Invalid EXR attribute name")
+        return b"".join(chars).decode("utf-8")
+
+    def read_header(self):
+        """Read attributes of single header.
+
+        Returns:
+            Union[dict[str, tuple[str, Any]], None]: Attribute type and
+                value by name. None if header list terminator was reached.
+        """
+        attributes = {}
+        while True:
+            name = self.read_null_terminated()
+            if not name:
+                break
+            attr_type = self.read_null_terminated()
+            size = self.read_int()
+            if attr_type == "preview":
+                self.skip(size)
+                continue
+            attributes[name] = (attr_type, self.read(size))
+
+        if not attributes:
+            return None
+        return attributes
+
+
+def _parse_exr_channels(data):
+    channels = []
+    offset = 0
+    while offset < len(data):
+        end = data.index(b"\0", offset)
+        name = data[offset:end].decode("utf-8")
+        offset = end + 1
+        if not name:
+            break
+        pixel_type = struct.unpack_from("<i", data, offset)[0]
+        # pixel type, pLinear, reserved, xSampling, ySampling
+        offset += 16
+        channels.append((name, pixel_type))
+    return channels
+
+
+def _sort_exr_channel_names(channel_names):
+    """Sort channels the same way as OIIO does.
+
+    Channels are grouped by layer and channels like R, G, B and A are
+    first in the layer.
+    """
+    def _sort_key(item):
+        idx, channel_name = item
+        layer_name = ""
+        suffix = channel_name
+        if "." in channel_name:
+            layer_name, suffix = channel_name.rsplit(".", 1)
+        suffix = suffix.lower()
+        special_idx = len(EXR_SPECIAL_CHANNEL_NAMES)
+        if suffix in EXR_SPECIAL_CHANNEL_NAMES:
+            special_idx = EXR_SPECIAL_CHANNEL_NAMES.index(suffix)
+        return layer_name, special_idx, idx
+
+    return [
+        channel_name
+        for _, channel_name in sorted(
+            enumerate(channel_names), key=_sort_key
+        )
+    ]
+
+
+_PLACEHOLDER = object()
+
+
+def _convert_exr_attribute(attr_type, data):
+    """Convert EXR attribute value to python value.
+
+    Returns:
+        Any: Converted value or '_PLACEHOLDER' for unsupported types.
+    """
+    if attr_type == "string":
+        return data.decode("utf-8")
+    if attr_type == "int":
+        return struct.unpack("<i", data)[0]
+    if attr_type == "float":
+        return struct.unpack("<f", data)[0]
+    if attr_type == "double":
+        return struct.unpack("<d", data)[0]
+    if attr_type == "compression":
+        idx = data[0]
+        if idx < len(EXR_COMPRESSION_NAMES):
+            return EXR_COMPRESSION_NAMES[idx]
+        return str(idx)
+    if attr_type in ("lineOrder", "envmap", "deepImageState"):
+        return data[0]
+    if attr_type in ("v2i", "v3i"):
+        return list(struct.unpack("<{}i".format(len(data) // 4), data))
+    if attr_type in ("v2f", "v3f", "chromaticities"):
+        return list(struct.unpack("<{}f".format(len(data) // 4), data))
+    if attr_type in ("v2d", "v3d"):
+        return list(struct.unpack("<{}d".format(len(data) // 8), data))
+    if attr_type in ("m33f", "m44f", "m33d", "m44d"):
+        size = 3 if attr_type.startswith("m33") else 4
+        value_type = "f" if attr_type.endswith("f") else "d"
+        values = struct.unpack("<{}{}".format(size * size, value_type), data)
+        return [
+            list(values[idx:idx + size])
+            for idx in range(0, len(values), size)
+        ]
+    if attr_type == "rational":
+        numerator, denominator = struct.unpack("<iI", data)
+        return RationalToInt("{}/{}".format(numerator, denominator))
+    if attr_type == "stringvector":
+        output = []
+        offset = 0
+        while offset < len(data):
+            size = struct.unpack_from("<i", data, offset)[0]
+            offset += 4
+            output.append(data[offset:offset + size].decode("utf-8"))
+            offset += size
+        return output
+    return _PLACEHOLDER
+
+
+def _exr_header_to_info(header, version_flags, subimages):
+    attrs_by_name = {
+        name: _convert_exr_attribute(attr_type, data)
+        for name, (attr_type, data) in header.items()
+        if attr_type not in ("chlist", "box2i", "box2f", "tiledesc")
+    }
+    channels = _parse_exr_channels(header["channels"][1])
+    channel_names = _sort_exr_channel_names(
+        [channel_name for channel_name, _ in channels]
+    )
+    pixel_types = {pixel_type for _, pixel_type in channels}
+    pixel_type = max(pixel_types) if pixel_types else 1
+
+    data_window = struct.unpack("<4i", header["dataWindow"][1])
+    display_window = struct.unpack("<4i", header["displayWindow"][1])
+    tile_width = tile_height = 0
+    if "tiles" in header:
+        tile_width, tile_height = struct.unpack(
+            "<2I", header["tiles"][1][:8]
+        )
+
+    alpha_channel = z_channel = -1
+    for idx, channel_name in enumerate(channel_names):
+        low_name = channel_name.lower()
+        if alpha_channel < 0 and low_name in ("a", "alpha"):
+            alpha_channel = idx
+        elif z_channel < 0 and low_name in ("z", "depth"):
+            z_channel = idx
+
+    deep = bool(version_flags & EXR_NON_IMAGE_FLAG)
+    if attrs_by_name.get("type") in ("deepscanline", "deeptile"):
+        deep = True
+
+    attribs = {}
+    for name, value in attrs_by_name.items():
+        if value is _PLACEHOLDER:
+            continue
+        if name == "type":
+            continue
+        name = EXR_OIIO_ATTRIB_NAMES.get(name, name)
+        attribs[name] = value
+
+    output = {
+        "x": data_window[0],
+        "y": data_window[1],
+        "z": 0,
+        "width": data_window[2] - data_window[0] + 1,
+        "height": data_window[3] - data_window[1] + 1,
+        "depth": 1,
+        "full_x": display_window[0],
+        "full_y": display_window[1],
+        "full_z": 0,
+        "full_width": display_window[2] - display_window[0] + 1,
+        "full_height": display_window[3] - display_window[1] + 1,
+        "full_depth": 1,
+        "tile_width": tile_width,
+        "tile_height": tile_height,
+        "tile_depth": 1 if tile_width else 0,
+        "format": EXR_PIXEL_TYPE_NAMES[pixel_type],
+        "nchannels": len(channel_names),
+        "channelnames": channel_names,
+        "alpha_channel": alpha_channel,
+        "z_channel": z_channel,
+        "deep": int(deep),
+        "attribs": attribs,
+    }
+    if subimages > 1:
+        output["subimages"] = subimages
+    return output
+
+
+def get_exr_header_info(filepath, subimages=False, logger=None):
+    """Read information about OpenEXR file from its header.
+
+    Pure python alternative of 'get_oiio_info_for_input' for exr files,
+    which does not need to launch 'oiiotool'. Only header bytes are read.
+    Output has the same structure as output of 'parse_oiio_xml_output',
+    with channels ordered and standard attributes renamed the way OIIO
+    does it.
+
+    Args:
+        filepath (str): Path to exr file.
+        subimages (Optional[bool]): Return information about all parts
+            of multipart exr.
+        logger (Optional[logging.Logger]): Logger used for logging.
+
+    Returns:
+        Union[dict[str, Any], list[dict[str, Any]], None]: Information about
+            input or list of information about each part if 'subimages'
+            is True. None is returned if file can't be parsed.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    try:
+        with open(filepath, "rb") as stream:
+            reader = _EXRHeaderReader(stream)
+            magic, version = struct.unpack("<2i", reader.read(8))
+            if magic != EXR_MAGIC_NUMBER:
+                return None
+
+            headers = []
+            while True:
+                header = reader.read_header()
+                if header is None:
+                    break
+                headers.append(header)
+                # Single part file has only one header
+                if not version & EXR_MULTIPART_FLAG:
+                    break
+
+        output = [
+            _exr_header_to_info(header, version, len(headers))
+            for header in headers
+        ]
+
+    except (OSError, ValueError, KeyError, IndexError, struct.error):
+        logger.debug(
+            "Failed to read exr header of \"{}\"".format(filepath),
+            exc_info=True
+        )
+        return None
+
+    if not output:
+        return None
+    if subimages:
+        return output
+    return output[0]
+
+
+def _get_image_metadata_info(filepath, logger=None):
+    """Get image information for metadata checks.
+
+    Exr header is read directly and 'oiiotool' is used only as fallback.
+
+    Returns:
+        Union[dict[str, Any], None]: Information about input or None if
+            information can't be received.
+    """
+    ext = os.path.splitext(filepath)[-1].lower()
+    if ext == ".exr":
+        input_info = get_exr_header_info(filepath, logger=logger)
+        if input_info is not None:
+            return input_info
+
+    if not is_oiio_supported():
+        return None
+    return get_oiio_info_for_input(filepath, logger=logger)
+
+
 def get_review_info_by_layer_name(channel_names):
     """Get channels info grouped by layer name.
 
@@ -461,8 +934,8 @@ def get_review_layer_name(src_filepath):
     if ext != ".exr":
         return None
 
-    # Load info about file from oiio tool
-    input_info = get_oiio_info_for_input(src_filepath)
+    # Load info about file from exr header or oiio tool
+    input_info = _get_image_metadata_info(src_filepath)
     if not input_info:
         return None
 
@@ -489,15 +962,19 @@ def should_convert_for_ffmpeg(src_filepath):
     if ext != ".exr":
         return False
 
-    # Can't determine if should convert or not without oiio_tool
-    if not is_oiio_supported():
+    # Load info about file from exr header or oiio tool
+    input_info = _get_image_metadata_info(src_filepath)
+    if not input_info:
         return None
 
-    # Load info about file from oiio tool
-    input_info = get_oiio_info_for_input(src_filepath)
-    if not input_info:
+    should_convert = _input_info_requires_conversion(input_info)
+    # Conversion can't be done without oiio_tool
+    if should_convert and not is_oiio_supported():
         return None
+    return should_convert
+
 
+def _input_info_requires_conversion(input_info):
     subimages = input_info.get("subimages")
     if subimages is not None and subimages > 1:
         return True
@@ -660,7 +1137,8 @@ def convert_for_ffmpeg(
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -673,12 +1151,19 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Files are converted by multiple 'oiiotool' processes running at the same
+    time. CPUs are split between the processes using 'oiiotool' argument
+    '--threads'. When conversion of any file fails the files waiting for
+    conversion are skipped and the error is raised.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of conversions running
+            at the same time. Number of CPUs is used if not passed.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -707,6 +1192,51 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
+    cpu_count = os.cpu_count() or 1
+    if not max_workers:
+        max_workers = cpu_count
+    max_workers = max(1, min(max_workers, len(input_paths)))
+    # Split CPUs between processes running at the same time
+    threads = max(1, cpu_count // max_workers)
+
+    # Prepare arguments that are same for all input paths
+    oiio_base_args = ["--threads", str(threads)]
+    # Add input compression if available
+    if compression:
+        oiio_base_args.extend(["--compression", compression])
+
+    erase_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_args.extend(["--eraseattrib", attr_name])
+
+    oiio_cmds = []
     for input_path in input_paths:
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
@@ -714,10 +1244,7 @@ def convert_input_paths_for_ffmpeg(
             # Don't add any additional attributes
             "--nosoftwareattrib",
         )
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
-
+        oiio_cmd.extend(oiio_base_args)
         oiio_cmd.extend([
             input_arg, input_path,
             # Tell oiiotool which channels should be put to top stack
@@ -726,36 +1253,7 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend(erase_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -763,9 +1261,27 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        oiio_cmds.append(oiio_cmd)
+
+    _run_conversion_commands(oiio_cmds, max_workers, logger)
+
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+def _run_conversion_commands(cmds, max_workers, logger):
+    """Run conversion subprocesses concurrently.
+
+    Commands waiting for execution are cancelled when any command fails.
+    The first error is re-raised when running commands finish.
+
+    Args:
+        cmds (list[list[str]]): Subprocess commands.
+        max_workers (int): Maximum number of running subprocesses.
+        logger (logging.Logger): Logger used for logging.
+    """
+    def _run(cmd):
+        logger.debug("Conversion command: {}".format(" ".join(cmd)))
+        run_subprocess(cmd, logger=logger)
+
+    run_in_thread_pool(_run, cmds, max_workers, logger)
 
 
 # FFMPEG functions
@@ -781,6 +1297,18 @@ def get_ffprobe_data(path_to_file, logger=None):
     logger.debug(
         "Getting information about input \"{}\".".format(path_to_file)
     )
+
+    # Output is cached, the same file is probed only once
+    output = _MEDIA_INFO_CACHE.get_output(
+        "ffprobe",
+        path_to_file,
+        [],
+        lambda: _run_ffprobe(path_to_file, logger)
+    )
+    return json.loads(output)
+
+
+def _run_ffprobe(path_to_file, logger):
     ffprobe_args = get_ffmpeg_tool_args("ffprobe")
     args = ffprobe_args + [
         "-hide_banner",
@@ -822,7 +1350,7 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    return popen_stdout.decode("utf-8")
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -1,8 +1,11 @@
 import os
 import re
 import copy
+import json
 import platform
+import threading
 import collections
+import collections.abc
 
 import ayon_api
 
@@ -22,6 +25,47 @@ from .templates import AnatomyTemplates
 log = Logger.get_logger(__name__)
 
 
+class ReadOnlyMapping(collections.abc.Mapping):
+    """Read-only view of nested anatomy data.
+
+    Nested dictionaries are returned as read-only views and lists
+    as tuples. Use 'copy.deepcopy' to get mutable copy of data.
+
+    Args:
+        data (dict[str, Any]): Data to wrap.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return _get_read_only_value(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._data)
+
+    def __copy__(self):
+        return dict(self.items())
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._data, memo)
+
+
+def _get_read_only_value(value):
+    if isinstance(value, dict):
+        return ReadOnlyMapping(value)
+    if isinstance(value, list):
+        return tuple(_get_read_only_value(item) for item in value)
+    return value
+
+
 class BaseAnatomy(object):
     """Anatomy module helps to keep project settings.
 
@@ -37,27 +81,44 @@ class BaseAnatomy(object):
         self._data = self._prepare_anatomy_data(
             project_entity, root_overrides
         )
+        self._read_only = False
         self._templates_obj = AnatomyTemplates(self)
         self._roots_obj = AnatomyRoots(self)
 
     # Anatomy used as dictionary
-    # - implemented only getters returning copy
+    # - implemented only getters returning copy, or read-only view
+    #   if anatomy is read-only
+    def _copy_value(self, value):
+        if self._read_only:
+            return _get_read_only_value(value)
+        return copy.deepcopy(value)
+
     def __getitem__(self, key):
-        return copy.deepcopy(self._data[key])
+        return self._copy_value(self._data[key])
 
     def get(self, key, default=None):
         if key not in self._data:
             return default
-        return copy.deepcopy(self._data[key])
+        return self._copy_value(self._data[key])
 
     def keys(self):
-        return copy.deepcopy(self._data).keys()
+        return self._copy_value(self._data).keys()
 
     def values(self):
-        return copy.deepcopy(self._data).values()
+        return self._copy_value(self._data).values()
 
     def items(self):
-        return copy.deepcopy(self._data).items()
+        return self._copy_value(self._data).items()
+
+    @property
+    def is_read_only(self):
+        """Anatomy data are returned as read-only views instead of copies.
+
+        Returns:
+            bool: Anatomy is read-only.
+
+        """
+        return self._read_only
 
     @property
     def project_name(self):
@@ -164,10 +225,20 @@ class BaseAnatomy(object):
         """Wrapper for AnatomyRoots `find_root_template_from_path`."""
         return self.roots_obj.find_root_template_from_path(*args, **kwargs)
 
+    def find_root_templates_from_paths(self, *args, **kwargs):
+        """Wrapper for AnatomyRoots `find_root_templates_from_paths`."""
+        return self.roots_obj.find_root_templates_from_paths(
+            *args, **kwargs
+        )
+
     def path_remapper(self, *args, **kwargs):
         """Wrapper for AnatomyRoots `path_remapper`."""
         return self.roots_obj.path_remapper(*args, **kwargs)
 
+    def remap_paths(self, *args, **kwargs):
+        """Wrapper for AnatomyRoots `remap_paths`."""
+        return self.roots_obj.remap_paths(*args, **kwargs)
+
     def all_root_paths(self):
         """Wrapper for AnatomyRoots `all_root_paths`."""
         return self.roots_obj.all_root_paths()
@@ -407,6 +478,10 @@ class Anatomy(BaseAnatomy):
     _sitesync_addon_cache = CacheItem(lifetime=60)
     _default_site_id_cache = NestedCacheItem(lifetime=60)
     _root_overrides_cache = NestedCacheItem(2, lifetime=60)
+    # Shared read-only anatomies by project name
+    #   - (site name, root overrides) -> (project entity, anatomy)
+    _shared_anatomies = collections.defaultdict(dict)
+    _shared_lock = threading.Lock()
 
     def __init__(
         self, project_name=None, site_name=None, project_entity=None
@@ -421,7 +496,7 @@ class Anatomy(BaseAnatomy):
             ))
 
         if not project_entity:
-            project_entity = self.get_project_entity_from_cache(project_name)
+            project_entity = self._get_cached_project_entity(project_name)
         root_overrides = self._get_site_root_overrides(
             project_name, site_name
         )
@@ -429,11 +504,106 @@ class Anatomy(BaseAnatomy):
         super(Anatomy, self).__init__(project_entity, root_overrides)
 
     @classmethod
-    def get_project_entity_from_cache(cls, project_name):
+    def _get_cached_project_entity(cls, project_name):
+        # Cached project entity without copy, must not be modified
         project_cache = cls._project_cache[project_name]
         if not project_cache.is_valid:
             project_cache.update_data(ayon_api.get_project(project_name))
-        return copy.deepcopy(project_cache.get_data())
+        return project_cache.get_data()
+
+    @classmethod
+    def get_project_entity_from_cache(cls, project_name):
+        return copy.deepcopy(cls._get_cached_project_entity(project_name))
+
+    @classmethod
+    def get_shared(
+        cls, project_name=None, site_name=None, project_entity=None
+    ):
+        """Get shared read-only anatomy of a project.
+
+        Anatomy is created only once per project, site and root overrides
+        and is shared by all callers. Data of shared anatomy are returned
+        as read-only views instead of deep copies. Anatomy is re-created
+        when project entity changes, either passed project entity or
+        project entity from server which is cached for a few seconds.
+
+        Args:
+            project_name (Optional[str]): Project name. Current project
+                from environment is used if not passed.
+            site_name (Optional[str]): Site name for root overrides.
+            project_entity (Optional[dict[str, Any]]): Project entity
+                already queried by caller. Cached project entity is used
+                if not passed.
+
+        Returns:
+            Anatomy: Shared read-only anatomy.
+
+        """
+        if not project_name:
+            project_name = os.environ.get("AYON_PROJECT_NAME")
+
+        if not project_name:
+            raise ProjectNotSet((
+                "Implementation bug: Project name is not set. Anatomy requires"
+                " to load data for specific project."
+            ))
+
+        if not project_entity:
+            project_entity = cls._get_cached_project_entity(project_name)
+        root_overrides = cls._get_site_root_overrides(
+            project_name, site_name
+        )
+        key = (
+            site_name,
+            json.dumps(root_overrides, sort_keys=True, default=str)
+        )
+        with cls._shared_lock:
+            item = cls._shared_anatomies[project_name].get(key)
+
+        if item is not None:
+            src_project_entity, anatomy = item
+            if (
+                src_project_entity is project_entity
+                or src_project_entity == project_entity
+            ):
+                return anatomy
+
+        anatomy = cls(
+            project_name, site_name, project_entity=project_entity
+        )
+        anatomy._read_only = True
+        with cls._shared_lock:
+            cls._shared_anatomies[project_name][key] = (
+                project_entity, anatomy
+            )
+        return anatomy
+
+    @classmethod
+    def invalidate_shared(cls, project_name=None):
+        """Invalidate shared anatomies and cached project data.
+
+        Shared anatomy follows changes of project entity once cached
+        project entity expires. Should be called by code which changed
+        project anatomy or root overrides and needs the change to be
+        used immediately, or on user triggered refresh of a tool.
+
+        Args:
+            project_name (Optional[str]): Invalidate only anatomies of the
+                project. All projects are invalidated if not passed.
+
+        """
+        with cls._shared_lock:
+            if project_name is None:
+                cls._shared_anatomies.clear()
+            else:
+                cls._shared_anatomies.pop(project_name, None)
+
+        if project_name is None:
+            cls._project_cache.reset()
+            cls._root_overrides_cache.reset()
+        else:
+            cls._project_cache.clear_key(project_name)
+            cls._root_overrides_cache.clear_key(project_name)
 
     @classmethod
     def get_sitesync_addon(cls):
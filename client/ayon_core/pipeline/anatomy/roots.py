@@ -5,6 +5,113 @@ import numbers
 from ayon_core.lib import Logger
 from ayon_core.lib.path_templates import FormatObject
 
+# Marker of path which already contains root of destination platform
+_DST_ROOT_MATCH = object()
+
+
+class _RootsPrefixTrie:
+    """Path component trie of root values used to find roots in paths.
+
+    All platform values of all root items are stored in the trie. Values of
+    windows roots are case-folded. Lookup walks path components only once
+    regardless of number of roots.
+
+    When multiple roots match a path, the first root in order wins and
+    within a root the first platform in order wins.
+
+    Args:
+        root_items (Optional[Iterable[RootItem]]): Root items in order
+            of priority.
+    """
+
+    def __init__(self, root_items=None):
+        self._trie = {}
+        self._casefold_trie = {}
+        self._max_depth = 0
+        if not root_items:
+            return
+
+        for root_idx, root_item in enumerate(root_items):
+            platform_items = enumerate(root_item.cleaned_data.items())
+            for platform_idx, (root_os, root_path) in platform_items:
+                self.add(
+                    root_path,
+                    root_os == "windows",
+                    (root_idx, platform_idx),
+                    root_item
+                )
+
+    def add(self, root_path, casefold, priority, value):
+        """Add root path to trie.
+
+        Args:
+            root_path (str): Cleaned root path.
+            casefold (bool): Match the path case-insensitive.
+            priority (tuple): Lower value wins if multiple paths match.
+            value (Any): Value returned by 'find' on match.
+        """
+        # Skip empty paths
+        if not root_path:
+            return
+
+        trie = self._trie
+        if casefold:
+            trie = self._casefold_trie
+            root_path = root_path.lower()
+
+        node = trie
+        parts = root_path.split("/")
+        self._max_depth = max(self._max_depth, len(parts))
+        for part in parts:
+            node = node.setdefault(part, {})
+
+        current = node.get(None)
+        if current is None or priority < current[0]:
+            node[None] = (priority, value)
+
+    @staticmethod
+    def _walk(trie, parts, best):
+        node = trie
+        for idx, part in enumerate(parts):
+            node = node.get(part)
+            if node is None:
+                break
+            value = node.get(None)
+            if value is not None and (best is None or value[0] < best[0]):
+                best = (value[0], value[1], idx + 1)
+        return best
+
+    def find(self, path):
+        """Find root in path.
+
+        Args:
+            path (str): Cleaned path with forward slashes.
+
+        Returns:
+            Union[tuple[Any, str], None]: Value of matching root (root item
+                by default) and rest of path after root or None if none
+                of roots match.
+        """
+        # Split only components which can be part of a root
+        parts = path.split("/", self._max_depth)
+        best = None
+        if self._trie:
+            best = self._walk(self._trie, parts, best)
+        if self._casefold_trie:
+            best = self._walk(
+                self._casefold_trie,
+                path.lower().split("/", self._max_depth),
+                best
+            )
+
+        if best is None:
+            return None
+        _, value, depth = best
+        subpath = ""
+        if depth < len(parts):
+            subpath = "/" + "/".join(parts[depth:])
+        return value, subpath
+
 
 class RootItem(FormatObject):
     """Represents one item or roots.
@@ -34,6 +141,7 @@ class RootItem(FormatObject):
         self.available_platforms = set(lowered_platform_keys.keys())
         self.value = lowered_platform_keys.get(platform.system().lower())
         self.clean_value = self._clean_root(self.value)
+        self._prefix_trie = None
 
     def __format__(self, *args, **kwargs):
         return self.value.__format__(*args, **kwargs)
@@ -200,27 +308,14 @@ class RootItem(FormatObject):
             If any of raw data value wouldn't match path's root output is::
                 (False, "C:/windows/path/root/projects/my_project/file.ext")
         """
-        result = False
-        output = str(path)
-
-        mod_path = self._clean_path(path)
-        for root_os, root_path in self.cleaned_data.items():
-            # Skip empty paths
-            if not root_path:
-                continue
-
-            _mod_path = mod_path  # reset to original cleaned value
-            if root_os == "windows":
-                root_path = root_path.lower()
-                _mod_path = _mod_path.lower()
-
-            if _mod_path.startswith(root_path):
-                result = True
-                replacement = "{" + self.full_key + "}"
-                output = replacement + mod_path[len(root_path):]
-                break
+        if self._prefix_trie is None:
+            self._prefix_trie = _RootsPrefixTrie([self])
 
-        return (result, output)
+        match = self._prefix_trie.find(self._clean_path(path))
+        if match is None:
+            return (False, str(path))
+        _, subpath = match
+        return (True, "{" + self.full_key + "}" + subpath)
 
 
 class AnatomyRoots:
@@ -237,6 +332,7 @@ class AnatomyRoots:
         self._anatomy = anatomy
         self._loaded_project = None
         self._roots = None
+        self._prefix_trie = None
 
     def __format__(self, *args, **kwargs):
         return self.roots.__format__(*args, **kwargs)
@@ -263,6 +359,7 @@ class AnatomyRoots:
     def reset(self):
         """Reset current roots value."""
         self._roots = None
+        self._prefix_trie = None
 
     def path_remapper(
         self, path, dst_platform=None, src_platform=None, roots=None
@@ -308,6 +405,109 @@ class AnatomyRoots:
             if result is not None:
                 return result
 
+    def remap_paths(
+        self, paths, dst_platform=None, src_platform=None, roots=None
+    ):
+        """Remap multiple paths for specific platform.
+
+        Same as 'path_remapper' but roots lookup is prepared only once for
+        all paths. Paths are processed lazily.
+
+        Args:
+            paths (Iterable[str]): Source paths which need to be remapped.
+            dst_platform (Optional[str]): Specify destination platform
+                for which remapping should happen.
+            src_platform (Optional[str]): Specify source platform.
+            roots (Optional[Union[dict, RootItem])): It is possible to remap
+                paths with different roots then instance where method was
+                called has.
+
+        Yields:
+            Union[str, None]: Remapped path for each path. None is yielded
+                when path does not contain known root.
+
+        """
+        if roots is None:
+            roots = self.roots
+
+        if roots is None:
+            raise ValueError("Roots are not set. Can't find path.")
+
+        if isinstance(roots, RootItem):
+            roots = {roots.name: roots}
+
+        trie = self._create_remap_trie(roots, dst_platform, src_platform)
+        for path in paths:
+            if "{root" in path:
+                path = path.format(**{"root": roots})
+                # If `dst_platform` is not specified then yield
+                #   else continue.
+                if not dst_platform:
+                    yield path
+                    continue
+
+            cleaned_path = RootItem._clean_path(path)
+            match = trie.find(cleaned_path)
+            if match is None:
+                yield None
+                continue
+
+            dst_root, subpath = match
+            if dst_root is _DST_ROOT_MATCH:
+                yield cleaned_path
+            else:
+                yield dst_root + subpath
+
+    def _create_remap_trie(self, roots, dst_platform, src_platform):
+        """Create lookup for 'remap_paths'.
+
+        Values stored in trie are destination root values, or marker when
+        path already contains root of destination platform. Priority
+        follows order of checks in 'RootItem.path_remapper'.
+        """
+        trie = _RootsPrefixTrie()
+        for root_idx, root_item in enumerate(roots.values()):
+            dst_root_clean = None
+            if dst_platform:
+                dst_root_clean = root_item.cleaned_data.get(dst_platform)
+                if not dst_root_clean:
+                    self.log.warning((
+                        "Root \"{}\" miss platform \"{}\" definition."
+                    ).format(root_item.full_key, dst_platform))
+                    continue
+                trie.add(
+                    dst_root_clean, False, (root_idx, 0, 0), _DST_ROOT_MATCH
+                )
+
+            if src_platform:
+                src_root_clean = root_item.cleaned_data.get(src_platform)
+                if src_root_clean is None:
+                    self.log.warning((
+                        "Root \"{}\" miss platform \"{}\" definition."
+                    ).format(root_item.full_key, src_platform))
+                    continue
+
+                dst_value = dst_root_clean
+                if not dst_platform:
+                    dst_value = root_item.clean_value
+                trie.add(src_root_clean, False, (root_idx, 1, 0), dst_value)
+                continue
+
+            dst_value = dst_root_clean
+            if not dst_platform:
+                dst_value = root_item.value
+            if dst_value is None:
+                continue
+            platform_items = enumerate(root_item.cleaned_data.items())
+            for platform_idx, (root_os, root_path) in platform_items:
+                trie.add(
+                    root_path,
+                    root_os == "windows",
+                    (root_idx, 1, platform_idx),
+                    dst_value
+                )
+        return trie
+
     def find_root_template_from_path(self, path, roots=None):
         """Find root value in entered path and replace it with formatting key.
 
@@ -336,16 +536,65 @@ class AnatomyRoots:
         if isinstance(roots, RootItem):
             return roots.find_root_template_from_path(path)
 
-        for root_name, _root in roots.items():
-            success, result = self.find_root_template_from_path(path, _root)
-            if success:
-                self.log.debug(
-                    "Found match in root \"{}\".".format(root_name)
-                )
-                return success, result
+        match = self._get_prefix_trie(roots).find(
+            RootItem._clean_path(path)
+        )
+        if match is None:
+            self.log.warning(
+                "No matching root was found in current setting."
+            )
+            return (False, path)
+
+        root_item, subpath = match
+        self.log.debug(
+            "Found match in root \"{}\".".format(root_item.name)
+        )
+        return (True, "{" + root_item.full_key + "}" + subpath)
+
+    def find_root_templates_from_paths(self, paths, roots=None):
+        """Find root values in multiple paths at once.
 
-        self.log.warning("No matching root was found in current setting.")
-        return (False, path)
+        Same as 'find_root_template_from_path' but roots lookup is prepared
+        only once for all paths.
+
+        Args:
+            paths (Iterable[str]): Source paths where root will be searched.
+            roots (Optional[Union[AnatomyRoots, dict]): It is possible to use
+                different roots than instance where method was triggered has.
+
+        Returns:
+            list[tuple[bool, str]]: Output for each path in the same order.
+                Each item contains bool representing success as first value
+                and path with or without replaced root with formatting key
+                as second value.
+
+        Raises:
+            ValueError: When roots are not entered and can't be loaded.
+        """
+        if roots is None:
+            roots = self.roots
+
+        if roots is None:
+            raise ValueError("Roots are not set. Can't find path.")
+
+        trie = self._get_prefix_trie(roots)
+        output = []
+        not_found = 0
+        for path in paths:
+            match = trie.find(RootItem._clean_path(path))
+            if match is None:
+                not_found += 1
+                output.append((False, path))
+                continue
+            root_item, subpath = match
+            output.append((True, "{" + root_item.full_key + "}" + subpath))
+
+        if not_found:
+            self.log.warning((
+                "No matching root was found in current setting"
+                " for {} of {} paths."
+            ).format(not_found, len(output)))
+        return output
 
     def set_root_environments(self):
         """Set root environments for current project."""
@@ -484,9 +733,21 @@ class AnatomyRoots:
 
         if self._roots is None:
             self._roots = self._discover()
+            self._prefix_trie = None
             self._loaded_project = self.project_name
         return self._roots
 
+    def _get_prefix_trie(self, roots):
+        if isinstance(roots, RootItem):
+            roots = {roots.name: roots}
+
+        if roots is not self._roots:
+            return _RootsPrefixTrie(roots.values())
+
+        if self._prefix_trie is None:
+            self._prefix_trie = _RootsPrefixTrie(roots.values())
+        return self._prefix_trie
+
     def _discover(self):
         """ Loads current project's roots or default.
 
@@ -5,6 +5,7 @@ import collections
 import numbers
 
 from ayon_core.lib.path_templates import (
+    TemplateUnsolved,
     TemplateResult,
     StringTemplate,
 )
@@ -99,6 +100,34 @@ class AnatomyStringTemplate(StringTemplate):
         )
         return AnatomyTemplateResult(result, rootless_path)
 
+    def compile_frame_formatter(self, data, frame_key="frame", strict=True):
+        """Prepare formatter for paths where only single key changes.
+
+        Same as 'StringTemplate.compile_frame_formatter' but 'root' key
+            is added to data if not available.
+
+        Args:
+            data (dict[str, Any]): Formatting data. Value of 'frame_key'
+                is ignored.
+            frame_key (Optional[str]): Key which changes for each path.
+            strict (Optional[bool]): Raise 'AnatomyTemplateUnsolved' if
+                template can't be solved with the data.
+
+        Returns:
+            TemplateFrameFormatter: Formatter filling the frame key.
+        """
+        if not data.get("root"):
+            data = dict(data)
+            data["root"] = self.anatomy_templates.anatomy.roots
+        try:
+            return super(AnatomyStringTemplate, self).compile_frame_formatter(
+                data, frame_key, strict
+            )
+        except TemplateUnsolved as exc:
+            raise AnatomyTemplateUnsolved(
+                self.template, exc.missing_keys, exc.invalid_types
+            )
+
 
 def _merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
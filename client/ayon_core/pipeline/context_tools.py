@@ -20,7 +20,10 @@ from ayon_core.lib import (
 from ayon_core.addon import load_addons, AddonsManager
 from ayon_core.settings import get_project_settings
 
-from .publish.lib import filter_pyblish_plugins
+from .publish.lib import (
+    filter_pyblish_plugins,
+    clear_publish_plugins_discover_cache,
+)
 from .anatomy import Anatomy
 from .template_data import get_template_data_with_names
 from .workfile import (
@@ -124,6 +127,9 @@ def install_host(host):
 
     log.info("Activating {}..".format(project_name))
 
+    # Host reload may reload modules used by publish plugins
+    clear_publish_plugins_discover_cache()
+
     # Optional host install function
     if hasattr(host, "install"):
         host.install()
@@ -259,6 +265,7 @@ def uninstall_host():
     deregister_loader_plugin_path(LOAD_PATH)
     deregister_inventory_action_path(INVENTORY_PATH)
     log.info("Global plug-ins unregistred")
+    clear_publish_plugins_discover_cache()
 
     deregister_host()
 
@@ -607,7 +614,7 @@ def version_up_current_workfile():
         task_name,
         host_name,
     )
-    anatomy = Anatomy(project_name)
+    anatomy = Anatomy.get_shared(project_name)
 
     data = get_template_data_with_names(
         project_name, folder_path, task_name, host_name
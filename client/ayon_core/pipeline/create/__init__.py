@@ -29,6 +29,7 @@ from .structures import (
     PublishAttributes,
 )
 from .utils import (
+    get_last_versions_by_product_keys,
     get_last_versions_for_instances,
     get_next_versions_for_instances,
 )
@@ -92,6 +93,7 @@ __all__ = (
     "PublishAttributeValues",
     "PublishAttributes",
 
+    "get_last_versions_by_product_keys",
     "get_last_versions_for_instances",
     "get_next_versions_for_instances",
 
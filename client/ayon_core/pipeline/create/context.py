@@ -38,6 +38,11 @@ from .creator_plugins import (
     discover_creator_plugins,
     discover_convertor_plugins,
 )
+from .utils import (
+    get_last_versions_by_product_keys,
+    get_last_versions_for_instances,
+    get_next_versions_for_instances,
+)
 
 # Import of functions and classes that were moved to different file
 # TODO Should be removed in future release - Added 24/08/28, 0.4.3-dev.1
@@ -168,6 +173,8 @@ class CreateContext:
         self.convertor_items_by_id = {}
 
         self.publish_discover_result: Optional[DiscoverResult] = None
+        # Project name of last publish plugins discovery
+        self._publish_plugins_project_name = None
         self.publish_plugins_mismatch_targets = []
         self.publish_plugins = []
         self.plugins_with_defs = []
@@ -180,6 +187,12 @@ class CreateContext:
         self._bulk_counter = 0
         self._bulk_instances_to_process = []
 
+        # Last versions by folder path and product name
+        #   - keys of instances added in bulk are queried together with
+        #       first requested last versions
+        self._last_versions_by_product_key = {}
+        self._last_versions_pending_keys = set()
+
         # Shared data across creators during collection phase
         self._collection_shared_data = None
 
@@ -561,7 +574,8 @@ class CreateContext:
     def _reset_publish_plugins(self, discover_publish_plugins):
         from ayon_core.pipeline import AYONPyblishPluginMixin
         from ayon_core.pipeline.publish import (
-            publish_plugins_discover
+            publish_plugins_discover,
+            clear_publish_plugins_discover_cache,
         )
 
         # Reset publish plugins
@@ -572,6 +586,14 @@ class CreateContext:
         plugins_by_targets = []
         plugins_mismatch_targets = []
         if discover_publish_plugins:
+            # Don't reuse plugin modules imported for other project
+            project_name = self.get_current_project_name()
+            if (
+                self._publish_plugins_project_name is not None
+                and self._publish_plugins_project_name != project_name
+            ):
+                clear_publish_plugins_discover_cache()
+            self._publish_plugins_project_name = project_name
             discover_result = publish_plugins_discover()
             publish_plugins = discover_result.plugins
 
@@ -991,10 +1013,12 @@ class CreateContext:
                 self._bulk_instances_to_process
             )
             self.validate_instances_context(instances_to_validate)
+            self._add_last_versions_pending_keys(instances_to_validate)
 
     def reset_instances(self):
         """Reload instances"""
         self._instances_by_id = collections.OrderedDict()
+        self.clear_last_versions_cache()
 
         # Collect instances
         error_message = "Collection of instances for creator {} failed. {}"
@@ -1168,6 +1192,108 @@ class CreateContext:
             if task_name not in task_names_by_folder_path[folder_path]:
                 instance.set_task_invalid(True)
 
+    def get_last_versions_for_instances(
+        self, instances, use_value_for_missing=False
+    ):
+        """Get last versions for instances.
+
+        Last versions are cached by folder path and product name until
+        instances are reset. Last versions of all instances collected in
+        bulk are queried at once on first call.
+
+        Args:
+            instances (list[CreatedInstance]): Instances to get last
+                versions for.
+            use_value_for_missing (Optional[bool]): Missing values are
+                replaced with negative value if True. Otherwise None is used.
+                -2 is used for instances without filled folder or product
+                name. -1 is used for missing entities.
+
+        Returns:
+            dict[str, Union[int, None]]: Last versions by instance id.
+        """
+        return get_last_versions_for_instances(
+            self.project_name,
+            instances,
+            use_value_for_missing,
+            self._get_last_versions(instances),
+        )
+
+    def get_next_versions_for_instances(self, instances):
+        """Get next versions for instances.
+
+        Uses cached last versions, see 'get_last_versions_for_instances'.
+
+        Args:
+            instances (list[CreatedInstance]): Instances to get next
+                versions for.
+
+        Returns:
+            dict[str, Union[int, None]]: Next versions by instance id.
+                Version is 'None' if instance has no folder path or product
+                name.
+        """
+        return get_next_versions_for_instances(
+            self.project_name,
+            instances,
+            self._get_last_versions(instances),
+        )
+
+    def clear_last_versions_cache(self):
+        """Clear cached last versions of products.
+
+        Should be called when versions were published outside of
+        the context reset.
+        """
+        self._last_versions_by_product_key = {}
+        self._last_versions_pending_keys = set()
+
+    def _get_instances_product_keys(self, instances):
+        product_keys = set()
+        for instance in instances:
+            folder_path = instance.get("folderPath")
+            product_name = instance.product_name
+            if folder_path and product_name:
+                product_keys.add((folder_path, product_name))
+        return product_keys
+
+    def _add_last_versions_pending_keys(self, instances):
+        for product_key in self._get_instances_product_keys(instances):
+            if product_key not in self._last_versions_by_product_key:
+                self._last_versions_pending_keys.add(product_key)
+
+    def _get_last_versions(self, instances):
+        """Last versions of instances using cache.
+
+        Missing and pending last versions are queried in one batch.
+
+        Args:
+            instances (list[CreatedInstance]): Instances.
+
+        Returns:
+            dict[tuple[str, str], Union[int, None]]: Last versions by
+                folder path and product name.
+        """
+        product_keys = self._get_instances_product_keys(instances)
+        missing_keys = {
+            product_key
+            for product_key in product_keys
+            if product_key not in self._last_versions_by_product_key
+        }
+        if missing_keys:
+            missing_keys |= self._last_versions_pending_keys
+            self._last_versions_pending_keys = set()
+            self._last_versions_by_product_key.update(
+                get_last_versions_by_product_keys(
+                    self.project_name, missing_keys
+                )
+            )
+
+        return {
+            product_key: self._last_versions_by_product_key[product_key]
+            for product_key in product_keys
+        }
+
     def save_changes(self):
         """Save changes. Update all changed values."""
         if not self.host_is_valid:
@@ -17,7 +17,6 @@ from ayon_core.pipeline.plugin_discover import (
 
 from .constants import DEFAULT_VARIANT_VALUE
 from .product_name import get_product_name
-from .utils import get_next_versions_for_instances
 from .legacy_create import LegacyCreator
 
 if TYPE_CHECKING:
@@ -588,8 +587,8 @@ class BaseCreator(ABC):
             dict[str, int]: Next versions by instance id.
         """
 
-        return get_next_versions_for_instances(
-            self.create_context.project_name, instances
+        return self.create_context.get_next_versions_for_instances(
+            instances
         )
 
 
@@ -3,43 +3,27 @@ import collections
 import ayon_api
 
 
-def get_last_versions_for_instances(
-    project_name, instances, use_value_for_missing=False
-):
-    """Get last versions for instances by their folder path and product name.
+def get_last_versions_by_product_keys(project_name, product_keys):
+    """Get last versions of products by folder path and product name.
+
+    All last versions are received with one query of folders, products
+    and versions.
 
     Args:
         project_name (str): Project name.
-        instances (list[CreatedInstance]): Instances to get next versions for.
-        use_value_for_missing (Optional[bool]): Missing values are replaced
-            with negative value if True. Otherwise None is used. -2 is used
-            for instances without filled folder or product name. -1 is used
-            for missing entities.
+        product_keys (Iterable[tuple[str, str]]): Pairs of folder path and
+            product name.
 
     Returns:
-        dict[str, Union[int, None]]: Last versions by instance id.
+        dict[tuple[str, str], Union[int, None]]: Last versions by folder
+            path and product name. Version is 'None' if folder, product or
+            version does not exist.
     """
-
-    output = {
-        instance.id: -1 if use_value_for_missing else None
-        for instance in instances
-    }
+    output = {}
     product_names_by_folder_path = collections.defaultdict(set)
-    instances_by_hierarchy = {}
-    for instance in instances:
-        folder_path = instance.data.get("folderPath")
-        product_name = instance.product_name
-        if not folder_path or not product_name:
-            if use_value_for_missing:
-                output[instance.id] = -2
-            continue
-
-        (
-            instances_by_hierarchy
-            .setdefault(folder_path, {})
-            .setdefault(product_name, [])
-            .append(instance)
-        )
+    for product_key in product_keys:
+        folder_path, product_name = product_key
+        output[product_key] = None
         product_names_by_folder_path[folder_path].add(product_name)
 
     product_names = set()
@@ -67,7 +51,7 @@ def get_last_versions_for_instances(
         product_names=product_names,
         fields={"id", "name", "folderId"}
     )
-    product_entities_by_id = {}
+    product_keys_by_id = {}
     for product_entity in product_entities:
         # Filter product entities by names under parent
         folder_id = product_entity["folderId"]
@@ -75,45 +59,94 @@ def get_last_versions_for_instances(
         folder_path = folder_paths_by_id[folder_id]
         if product_name not in product_names_by_folder_path[folder_path]:
             continue
-        product_entities_by_id[product_entity["id"]] = product_entity
+        product_keys_by_id[product_entity["id"]] = (folder_path, product_name)
 
-    if not product_entities_by_id:
+    if not product_keys_by_id:
         return output
 
     last_versions_by_product_id = ayon_api.get_last_versions(
         project_name,
-        product_entities_by_id.keys(),
+        product_keys_by_id.keys(),
         fields={"version", "productId"}
     )
     for product_id, version_entity in last_versions_by_product_id.items():
-        product_entity = product_entities_by_id[product_id]
-        product_name = product_entity["name"]
-        folder_id = product_entity["folderId"]
-        folder_path = folder_paths_by_id[folder_id]
-        _instances = instances_by_hierarchy[folder_path][product_name]
-        for instance in _instances:
-            output[instance.id] = version_entity["version"]
+        product_key = product_keys_by_id[product_id]
+        output[product_key] = version_entity["version"]
 
     return output
 
 
-def get_next_versions_for_instances(project_name, instances):
+def get_last_versions_for_instances(
+    project_name,
+    instances,
+    use_value_for_missing=False,
+    last_versions=None,
+):
+    """Get last versions for instances by their folder path and product name.
+
+    Args:
+        project_name (str): Project name.
+        instances (list[CreatedInstance]): Instances to get next versions for.
+        use_value_for_missing (Optional[bool]): Missing values are replaced
+            with negative value if True. Otherwise None is used. -2 is used
+            for instances without filled folder or product name. -1 is used
+            for missing entities.
+        last_versions (Optional[dict[tuple[str, str], Optional[int]]]):
+            Already known last versions by folder path and product name.
+            Last versions are queried if not passed.
+
+    Returns:
+        dict[str, Union[int, None]]: Last versions by instance id.
+    """
+    missing_value = -1 if use_value_for_missing else None
+    output = {}
+    product_keys_by_instance_id = {}
+    for instance in instances:
+        output[instance.id] = missing_value
+        folder_path = instance.data.get("folderPath")
+        product_name = instance.product_name
+        if not folder_path or not product_name:
+            if use_value_for_missing:
+                output[instance.id] = -2
+            continue
+        product_keys_by_instance_id[instance.id] = (folder_path, product_name)
+
+    if last_versions is None:
+        last_versions = get_last_versions_by_product_keys(
+            project_name, set(product_keys_by_instance_id.values())
+        )
+
+    for instance_id, product_key in product_keys_by_instance_id.items():
+        version = last_versions.get(product_key)
+        if version is not None:
+            output[instance_id] = version
+
+    return output
+
+
+def get_next_versions_for_instances(
+    project_name, instances, last_versions=None
+):
     """Get next versions for instances by their folder path and product name.
 
     Args:
         project_name (str): Project name.
         instances (list[CreatedInstance]): Instances to get next versions for.
+        last_versions (Optional[dict[tuple[str, str], Optional[int]]]):
+            Already known last versions by folder path and product name.
+            Last versions are queried if not passed.
 
     Returns:
         dict[str, Union[int, None]]: Next versions by instance id. Version is
             'None' if instance has no folder path or product name.
     """
 
-    last_versions = get_last_versions_for_instances(
-        project_name, instances, True)
+    last_versions_by_id = get_last_versions_for_instances(
+        project_name, instances, True, last_versions
+    )
 
     output = {}
-    for instance_id, version in last_versions.items():
+    for instance_id, version in last_versions_by_id.items():
         if version == -2:
             output[instance_id] = None
         elif version == -1:
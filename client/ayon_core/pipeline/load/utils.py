@@ -613,7 +613,7 @@ def get_representation_path_from_context(context):
         project_entity
         and project_entity["name"] != get_current_project_name()
     ):
-        anatomy = Anatomy(project_entity["name"])
+        anatomy = Anatomy.get_shared(project_entity["name"])
         root = anatomy.roots
 
     return get_representation_path(representation, root)
@@ -785,7 +785,7 @@ def get_representation_path_by_names(
         return
 
     if not anatomy:
-        anatomy = Anatomy(project_name)
+        anatomy = Anatomy.get_shared(project_name)
 
     if representation:
         path = get_representation_path_with_anatomy(representation, anatomy)
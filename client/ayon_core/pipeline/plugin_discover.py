@@ -2,7 +2,7 @@ import os
 import inspect
 import traceback
 
-from ayon_core.lib import Logger
+from ayon_core.lib import Logger, profile_section
 from ayon_core.lib.python_module_tools import (
     modules_from_path,
     classes_from_module,
@@ -291,12 +291,13 @@ def discover(
     """
 
     context = _GlobalDiscover.get_context()
-    return context.discover(
-        superclass,
-        allow_duplicates,
-        ignore_classes,
-        return_report
-    )
+    with profile_section(superclass.__name__, "discover"):
+        return context.discover(
+            superclass,
+            allow_duplicates,
+            ignore_classes,
+            return_report
+        )
 
 
 def get_last_discovered_plugins(superclass):
@@ -27,6 +27,7 @@ from .lib import (
     get_publish_template_name,
 
     publish_plugins_discover,
+    clear_publish_plugins_discover_cache,
     load_help_content_from_plugin,
     load_help_content_from_filepath,
 
@@ -46,6 +47,10 @@ from .lib import (
     main_cli_publish,
 )
 
+from .entities_cache import (
+    PublishEntitiesCache,
+    get_publish_entities_cache,
+)
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -78,6 +83,7 @@ __all__ = (
     "get_publish_template_name",
 
     "publish_plugins_discover",
+    "clear_publish_plugins_discover_cache",
     "load_help_content_from_plugin",
     "load_help_content_from_filepath",
 
@@ -96,6 +102,9 @@ __all__ = (
 
     "main_cli_publish",
 
+    "PublishEntitiesCache",
+    "get_publish_entities_cache",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -0,0 +1,385 @@
+"""Cache of entities queried from AYON server during publishing.
+
+Publish plugins query the same products, versions and representations
+for each instance. Cache stored on publish context allows to query them
+for all instances at once and share the results between plugins.
+"""
+import threading
+import collections
+
+import ayon_api
+
+CONTEXT_DATA_KEY = "ayonEntitiesCache"
+
+
+class PublishEntitiesCache:
+    """Publish scoped cache of products, versions and representations.
+
+    Lookups which are not cached are queried one by one. Use 'prefetch_*'
+    methods to query entities of multiple instances in one request.
+
+    Only existing entities are cached. Lookup of an entity which was not
+    found is queried again, so entity created by other process in meantime
+    is not missed.
+
+    Concurrent lookups of the same entity type are processed one after
+    another, so the same entity is not queried multiple times.
+
+    Cached entities must not be modified. Cache should be invalidated
+    using 'invalidate_by_operations' after commit of operations
+    changing the entities.
+
+    Args:
+        project_name (str): Project name.
+    """
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        # (folder id, product name) -> product entity
+        self._products_by_name = {}
+        # (product id, version) -> version entity
+        self._versions_by_name = {}
+        # version id -> version entity
+        self._versions_by_id = {}
+        # product id -> hero version entity
+        self._hero_versions_by_product_id = {}
+        # version id -> list of representation entities
+        self._repres_by_version_id = {}
+        self._locks = collections.defaultdict(threading.RLock)
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    def prefetch_products(self, items):
+        """Query products in one request.
+
+        Args:
+            items (Iterable[tuple[str, str]]): Pairs of folder id and
+                product name.
+
+        Returns:
+            dict[tuple[str, str], dict[str, Any]]: Existing product entities
+                by folder id and product name.
+        """
+        with self._locks["product"]:
+            items = set(items)
+            keys = {
+                key
+                for key in items
+                if key not in self._products_by_name
+            }
+            if keys:
+                self._query_products(keys)
+            return {
+                key: self._products_by_name[key]
+                for key in items
+                if key in self._products_by_name
+            }
+
+    def _query_products(self, keys):
+        folder_ids = {folder_id for folder_id, _ in keys}
+        product_names = {product_name for _, product_name in keys}
+        for product_entity in ayon_api.get_products(
+            self._project_name,
+            folder_ids=folder_ids,
+            product_names=product_names,
+        ):
+            key = (product_entity["folderId"], product_entity["name"])
+            if key in keys:
+                self._products_by_name[key] = product_entity
+
+    def get_product_by_name(self, folder_id, product_name):
+        """Product entity by name.
+
+        Args:
+            folder_id (str): Folder id.
+            product_name (str): Product name.
+
+        Returns:
+            Union[dict[str, Any], None]: Product entity or None if product
+                does not exist.
+        """
+        key = (folder_id, product_name)
+        with self._locks["product"]:
+            product_entity = self._products_by_name.get(key)
+            if product_entity is None:
+                product_entity = ayon_api.get_product_by_name(
+                    self._project_name, product_name, folder_id
+                )
+                if product_entity is not None:
+                    self._products_by_name[key] = product_entity
+            return product_entity
+
+    def prefetch_versions(self, items):
+        """Query versions in one request.
+
+        Args:
+            items (Iterable[tuple[str, int]]): Pairs of product id and
+                version.
+
+        Returns:
+            dict[tuple[str, int], dict[str, Any]]: Existing version entities
+                by product id and version.
+        """
+        with self._locks["version"]:
+            items = set(items)
+            keys = {
+                key
+                for key in items
+                if key not in self._versions_by_name
+            }
+            if keys:
+                self._query_versions(keys)
+            return {
+                key: self._versions_by_name[key]
+                for key in items
+                if key in self._versions_by_name
+            }
+
+    def _query_versions(self, keys):
+        product_ids = {product_id for product_id, _ in keys}
+        versions = {version for _, version in keys}
+        for version_entity in ayon_api.get_versions(
+            self._project_name,
+            product_ids=product_ids,
+            versions=versions,
+            hero=False,
+        ):
+            key = (version_entity["productId"], version_entity["version"])
+            self._versions_by_id[version_entity["id"]] = version_entity
+            if key in keys:
+                self._versions_by_name[key] = version_entity
+
+    def get_version_by_name(self, product_id, version):
+        """Version entity by version number.
+
+        Args:
+            product_id (str): Product id.
+            version (int): Version number.
+
+        Returns:
+            Union[dict[str, Any], None]: Version entity or None if version
+                does not exist.
+        """
+        key = (product_id, version)
+        with self._locks["version"]:
+            version_entity = self._versions_by_name.get(key)
+            if version_entity is None:
+                version_entity = ayon_api.get_version_by_name(
+                    self._project_name, version, product_id
+                )
+                if version_entity is not None:
+                    self._versions_by_name[key] = version_entity
+                    self._versions_by_id[version_entity["id"]] = (
+                        version_entity
+                    )
+            return version_entity
+
+    def prefetch_versions_by_ids(self, version_ids):
+        """Query versions by ids in one request.
+
+        Hero versions are included.
+
+        Args:
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Existing version entities by id.
+        """
+        with self._locks["version"]:
+            version_ids = set(version_ids)
+            missing_ids = version_ids - set(self._versions_by_id)
+            if missing_ids:
+                for version_entity in ayon_api.get_versions(
+                    self._project_name,
+                    version_ids=missing_ids,
+                    hero=True,
+                ):
+                    self._versions_by_id[version_entity["id"]] = (
+                        version_entity
+                    )
+            return {
+                version_id: self._versions_by_id[version_id]
+                for version_id in version_ids
+                if version_id in self._versions_by_id
+            }
+
+    def get_version_by_id(self, version_id):
+        """Version entity by id.
+
+        Args:
+            version_id (str): Version id.
+
+        Returns:
+            Union[dict[str, Any], None]: Version entity or None if version
+                does not exist.
+        """
+        with self._locks["version"]:
+            version_entity = self._versions_by_id.get(version_id)
+            if version_entity is None:
+                version_entity = ayon_api.get_version_by_id(
+                    self._project_name, version_id
+                )
+                if version_entity is not None:
+                    self._versions_by_id[version_id] = version_entity
+            return version_entity
+
+    def get_hero_version_by_product_id(self, product_id):
+        """Hero version entity of a product.
+
+        Args:
+            product_id (str): Product id.
+
+        Returns:
+            Union[dict[str, Any], None]: Hero version entity or None if
+                hero version does not exist.
+        """
+        with self._locks["version"]:
+            hero_version = self._hero_versions_by_product_id.get(product_id)
+            if hero_version is None:
+                hero_version = ayon_api.get_hero_version_by_product_id(
+                    self._project_name, product_id
+                )
+                if hero_version is not None:
+                    self._hero_versions_by_product_id[product_id] = (
+                        hero_version
+                    )
+            return hero_version
+
+    def prefetch_representations(self, version_ids):
+        """Query representations of versions in one request.
+
+        Args:
+            version_ids (Iterable[str]): Version ids.
+        """
+        with self._locks["representation"]:
+            version_ids = {
+                version_id
+                for version_id in version_ids
+                if version_id not in self._repres_by_version_id
+            }
+            if not version_ids:
+                return
+
+            repres_by_version_id = {
+                version_id: []
+                for version_id in version_ids
+            }
+            for repre_entity in ayon_api.get_representations(
+                self._project_name, version_ids=version_ids
+            ):
+                repres_by_version_id[repre_entity["versionId"]].append(
+                    repre_entity
+                )
+            self._repres_by_version_id.update(repres_by_version_id)
+
+    def get_representations(self, version_id):
+        """Representation entities of a version.
+
+        Args:
+            version_id (str): Version id.
+
+        Returns:
+            list[dict[str, Any]]: Representation entities.
+        """
+        self.prefetch_representations([version_id])
+        with self._locks["representation"]:
+            return list(self._repres_by_version_id[version_id])
+
+    def invalidate_by_operations(self, operations_data):
+        """Remove cached entities affected by operations.
+
+        Args:
+            operations_data (list[dict[str, Any]]): Operations data from
+                'OperationsSession.to_data'.
+        """
+        for operation in operations_data:
+            entity_type = operation.get("entity_type")
+            # Create operation has the entity data, update operation has
+            #   only changes and delete operation has only entity id
+            data = (
+                operation.get("data")
+                or operation.get("changes")
+                or {}
+            )
+            entity_id = operation.get("entity_id") or data.get("id")
+            if entity_type == "product":
+                self._invalidate_product(entity_id, data)
+            elif entity_type == "version":
+                self._invalidate_version(entity_id, data)
+            elif entity_type == "representation":
+                self._invalidate_representation(entity_id, data)
+
+    def invalidate(self):
+        """Remove all cached entities."""
+        with self._locks["product"]:
+            self._products_by_name.clear()
+        with self._locks["version"]:
+            self._versions_by_name.clear()
+            self._versions_by_id.clear()
+            self._hero_versions_by_product_id.clear()
+        with self._locks["representation"]:
+            self._repres_by_version_id.clear()
+
+    def _invalidate_product(self, product_id, data):
+        with self._locks["product"]:
+            self._products_by_name.pop(
+                (data.get("folderId"), data.get("name")), None
+            )
+            for key, entity in tuple(self._products_by_name.items()):
+                if entity["id"] == product_id:
+                    self._products_by_name.pop(key)
+
+    def _invalidate_version(self, version_id, data):
+        with self._locks["version"]:
+            self._versions_by_id.pop(version_id, None)
+            self._versions_by_name.pop(
+                (data.get("productId"), data.get("version")), None
+            )
+            for key, entity in tuple(self._versions_by_name.items()):
+                if entity["id"] == version_id:
+                    self._versions_by_name.pop(key)
+
+            # Version can be hero version
+            self._hero_versions_by_product_id.pop(
+                data.get("productId"), None
+            )
+            for key, entity in tuple(
+                self._hero_versions_by_product_id.items()
+            ):
+                if entity["id"] == version_id:
+                    self._hero_versions_by_product_id.pop(key)
+
+        with self._locks["representation"]:
+            self._repres_by_version_id.pop(version_id, None)
+
+    def _invalidate_representation(self, repre_id, data):
+        with self._locks["representation"]:
+            self._repres_by_version_id.pop(data.get("versionId"), None)
+            for version_id, repre_entities in tuple(
+                self._repres_by_version_id.items()
+            ):
+                if any(
+                    repre_entity["id"] == repre_id
+                    for repre_entity in repre_entities
+                ):
+                    self._repres_by_version_id.pop(version_id)
+
+
+def get_publish_entities_cache(context):
+    """Get entities cache stored on publish context.
+
+    Cache is created on first call.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        PublishEntitiesCache: Entities cache of the publishing.
+    """
+    cache = context.data.get(CONTEXT_DATA_KEY)
+    if cache is None:
+        cache = PublishEntitiesCache(context.data["projectName"])
+        context.data[CONTEXT_DATA_KEY] = cache
+    return cache
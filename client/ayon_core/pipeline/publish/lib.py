@@ -14,7 +14,9 @@ import pyblish.api
 from ayon_core.lib import (
     Logger,
     import_filepath,
+    preread_python_files,
     filter_profiles,
+    profile_function,
 )
 from ayon_core.settings import get_project_settings
 from ayon_core.addon import AddonsManager
@@ -212,15 +214,204 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+class _PluginsDiscoverCache:
+    """Cache of publish plugin modules imported during discovery.
+
+    Modules are reused when file modification time and size did not change,
+    so the files are not executed again on each publisher reset. Class
+    attributes of plugins are restored to values from import time on reuse,
+    because settings are applied directly to plugin classes.
+    """
+    # Directory path -> (mtime, python filenames)
+    dirs_index = {}
+    # File path -> (mtime, size, module, class attributes snapshot)
+    modules = {}
+
+    @classmethod
+    def get_filenames(cls, dirpath):
+        """Python filenames in directory that can contain plugins.
+
+        Args:
+            dirpath (str): Directory path.
+
+        Returns:
+            list[str]: Filenames.
+        """
+        try:
+            mtime = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = cls.dirs_index.get(dirpath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        filenames = _get_plugin_filenames(dirpath)
+        cls.dirs_index[dirpath] = (mtime, filenames)
+        return filenames
+
+    @classmethod
+    def get_module(cls, filepath):
+        """Cached module of a file if the file did not change.
+
+        Args:
+            filepath (str): Path to python file.
+
+        Returns:
+            Union[types.ModuleType, None]: Module or None if module is not
+                cached or is outdated.
+        """
+        cached = cls.modules.get(filepath)
+        if cached is None:
+            return None
+
+        mtime, size, module, snapshot = cached
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            stat = None
+
+        if stat is None or (stat.st_mtime_ns, stat.st_size) != (mtime, size):
+            cls.modules.pop(filepath, None)
+            return None
+
+        for plugin, attributes in snapshot:
+            _restore_class_attributes(plugin, attributes)
+        return module
+
+    @classmethod
+    def set_module(cls, filepath, module):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return
+
+        snapshot = []
+        try:
+            for item in module.__dict__.values():
+                if (
+                    inspect.isclass(item)
+                    and issubclass(item, pyblish.api.Plugin)
+                    and item.__module__ == module.__name__
+                ):
+                    snapshot.append((item, _get_class_attributes(item)))
+
+        except Exception:
+            # Module is imported again on next discovery if attributes
+            #   can't be copied
+            return
+
+        cls.modules[filepath] = (
+            stat.st_mtime_ns, stat.st_size, module, snapshot
+        )
+
+    @classmethod
+    def is_cached(cls, filepath):
+        return filepath in cls.modules
+
+    @classmethod
+    def clear(cls):
+        cls.dirs_index.clear()
+        cls.modules.clear()
+
+
+def _get_plugin_filenames(dirpath):
+    return [
+        fname
+        for fname in os.listdir(dirpath)
+        if (
+            not fname.startswith("_")
+            and fname.endswith(".py")
+            and os.path.isfile(os.path.join(dirpath, fname))
+        )
+    ]
+
+
+_IMMUTABLE_TYPES = (
+    str, bytes, int, float, complex, bool, type(None), frozenset, range
+)
+
+
+def _is_immutable_class_attribute(value):
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, tuple):
+        return all(_is_immutable_class_attribute(item) for item in value)
+    return (
+        inspect.isroutine(value)
+        or inspect.isclass(value)
+        or inspect.ismodule(value)
+        or isinstance(value, (staticmethod, classmethod, property))
+    )
+
+
+def _copy_class_attribute(value):
+    # Mutable values can be changed in place e.g. 'families.append(...)'
+    if _is_immutable_class_attribute(value):
+        return value
+    return copy.deepcopy(value)
+
+
+def _get_class_attributes(cls):
+    return {
+        key: _copy_class_attribute(value)
+        for key, value in cls.__dict__.items()
+        if not key.startswith("__")
+    }
+
+
+def _restore_class_attributes(cls, attributes):
+    for key in tuple(cls.__dict__.keys()):
+        if not key.startswith("__") and key not in attributes:
+            delattr(cls, key)
+
+    for key, value in attributes.items():
+        if not _is_immutable_class_attribute(value):
+            # Keep snapshot untouched for next restore
+            setattr(cls, key, copy.deepcopy(value))
+        elif cls.__dict__.get(key) is not value:
+            setattr(cls, key, value)
+
+
+def clear_publish_plugins_discover_cache():
+    """Clear cache of modules imported by 'publish_plugins_discover'.
+
+    Next discovery will import all plugin files again. Is called on host
+    install and uninstall, and by 'CreateContext' when current project
+    changes.
+    """
+    _PluginsDiscoverCache.clear()
+
+
+def _import_publish_plugins_module(
+    filepath, mod_name, use_cache, preread=None
+):
+    if use_cache:
+        module = _PluginsDiscoverCache.get_module(filepath)
+        if module is not None:
+            return module
+
+    module = import_filepath(filepath, mod_name, preread)
+    if use_cache:
+        _PluginsDiscoverCache.set_module(filepath, module)
+    return module
+
+
+@profile_function("discover")
+def publish_plugins_discover(paths=None, use_cache=True):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able to collect
         crashed files and reason of their crash.
 
+    Plugin files which did not change since previous discovery are not
+        imported again. Their modules and plugins are reused.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        use_cache (bool): Reuse modules imported by previous discovery
+            if files did not change.
     """
 
     # The only difference with `pyblish.api.discover`
@@ -241,22 +432,35 @@ def publish_plugins_discover(paths=None):
         if not os.path.isdir(path):
             continue
 
-        for fname in os.listdir(path):
-            if fname.startswith("_"):
-                continue
-
+        if use_cache:
+            filenames = _PluginsDiscoverCache.get_filenames(path)
+        else:
+            filenames = _get_plugin_filenames(path)
+
+        # Read files which will be imported in parallel
+        preread_paths = [
+            os.path.join(path, fname)
+            for fname in filenames
+        ]
+        if use_cache:
+            preread_paths = [
+                abspath
+                for abspath in preread_paths
+                if not _PluginsDiscoverCache.is_cached(abspath)
+            ]
+        preread_files = preread_python_files(preread_paths)
+
+        for fname in filenames:
             abspath = os.path.join(path, fname)
-
-            if not os.path.isfile(abspath):
-                continue
-
-            mod_name, mod_ext = os.path.splitext(fname)
-
-            if mod_ext != ".py":
-                continue
+            mod_name = os.path.splitext(fname)[0]
 
             try:
-                module = import_filepath(abspath, mod_name)
+                module = _import_publish_plugins_module(
+                    abspath,
+                    mod_name,
+                    use_cache,
+                    preread_files.get(abspath)
+                )
 
                 # Store reference to original module, to avoid
                 # garbage collection from collecting it's global
@@ -740,7 +944,7 @@ def get_custom_staging_dir_info(
         return None, None
 
     if not anatomy:
-        anatomy = Anatomy(project_name)
+        anatomy = Anatomy.get_shared(project_name)
 
     template_name = profile["template_name"] or TRANSIENT_DIR_TEMPLATE
 
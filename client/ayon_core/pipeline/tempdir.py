@@ -36,7 +36,7 @@ def create_custom_tempdir(project_name, anatomy=None):
     custom_tempdir = None
     if "{" in env_tmpdir:
         if anatomy is None:
-            anatomy = Anatomy(project_name)
+            anatomy = Anatomy.get_shared(project_name)
         # create base formate data
         data = {
             "root": anatomy.roots,
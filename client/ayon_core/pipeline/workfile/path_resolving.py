@@ -125,7 +125,7 @@ def get_workdir_with_workdir_data(
     """
 
     if not anatomy:
-        anatomy = Anatomy(project_name)
+        anatomy = Anatomy.get_shared(project_name)
 
     if not template_key:
         template_key = get_workfile_template_key(
@@ -420,7 +420,7 @@ def get_custom_workfile_template(
         return
 
     if anatomy is None:
-        anatomy = Anatomy(project_name)
+        anatomy = Anatomy.get_shared(project_name)
 
     # get project, folder, task anatomy context data
     anatomy_context_data = get_template_data(
@@ -74,6 +74,9 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Number of oiiotool conversions running at the same time, 0 to use
+    #   number of CPUs
+    conversion_max_workers = 0
 
     def process(self, instance):
         if not self.profiles:
@@ -256,7 +259,8 @@ class ExtractBurnin(publish.Extractor):
                 convert_input_paths_for_ffmpeg(
                     src_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    max_workers=self.conversion_max_workers or None
                 )
 
             # Add anatomy keys to burnin_data.
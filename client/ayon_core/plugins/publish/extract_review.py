@@ -13,8 +13,10 @@ import pyblish.api
 from ayon_core.lib import (
     get_ffmpeg_tool_args,
     filter_profiles,
+    create_hard_link,
     path_to_subprocess_arg,
     run_subprocess,
+    run_in_thread_pool,
 )
 from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -103,6 +105,15 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = []
+    # Number of ffmpeg processes running at the same time
+    concurrent_jobs = 1
+    # Value of ffmpeg '-threads' argument, 0 to use ffmpeg default
+    ffmpeg_threads = 0
+    # Number of oiiotool conversions running at the same time, 0 to use
+    #   number of CPUs
+    conversion_max_workers = 0
+    # How missing frames are filled, "link" or "copy"
+    fill_gaps_method = "link"
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -255,88 +266,191 @@ class ExtractReview(pyblish.api.InstancePlugin):
             instance, profile_outputs
         )
 
-        for repre, output_defs in outputs_per_repres:
-            # Check if input should be preconverted before processing
-            # Store original staging dir (it's value may change)
-            src_repre_staging_dir = repre["stagingDir"]
-            # Receive filepath to first file in representation
-            first_input_path = None
-            input_filepaths = []
-            if not self.input_is_sequence(repre):
-                first_input_path = os.path.join(
-                    src_repre_staging_dir, repre["files"]
+        # Render jobs of all representations are prepared first and executed
+        #   together when concurrent jobs are enabled
+        concurrent = self.concurrent_jobs > 1
+        render_jobs = []
+        gap_files = set()
+        converted_repres = []
+        try:
+            for repre, output_defs in outputs_per_repres:
+                render_jobs.extend(self._prepare_representation(
+                    instance,
+                    repre,
+                    output_defs,
+                    gap_files,
+                    converted_repres
+                ))
+                if not concurrent:
+                    self._run_render_jobs(instance, render_jobs)
+                    render_jobs = []
+                    self._cleanup_render_files(gap_files, converted_repres)
+
+            self._run_render_jobs(instance, render_jobs)
+
+        finally:
+            self._cleanup_render_files(gap_files, converted_repres)
+
+    def _prepare_representation(
+        self, instance, repre, output_defs, gap_files, converted_repres
+    ):
+        """Prepare render jobs of output definitions for representation.
+
+        Args:
+            instance (Instance): Currently processed instance.
+            repre (dict): Source representation.
+            output_defs (list[dict]): Output definitions for representation.
+            gap_files (set[str]): Files created to fill gaps in sequence.
+                New files are added to the set.
+            converted_repres (list[tuple[dict, str, str]]): Representations
+                with staging dir changed by conversion. Converted
+                representation is added to the list.
+
+        Returns:
+            list[dict]: Render jobs of output definitions.
+        """
+        # Check if input should be preconverted before processing
+        # Store original staging dir (it's value may change)
+        src_repre_staging_dir = repre["stagingDir"]
+        # Receive filepath to first file in representation
+        first_input_path = None
+        input_filepaths = []
+        if not self.input_is_sequence(repre):
+            first_input_path = os.path.join(
+                src_repre_staging_dir, repre["files"]
+            )
+            input_filepaths.append(first_input_path)
+        else:
+            for filename in repre["files"]:
+                filepath = os.path.join(
+                    src_repre_staging_dir, filename
                 )
-                input_filepaths.append(first_input_path)
-            else:
-                for filename in repre["files"]:
-                    filepath = os.path.join(
-                        src_repre_staging_dir, filename
-                    )
-                    input_filepaths.append(filepath)
-                    if first_input_path is None:
-                        first_input_path = filepath
+                input_filepaths.append(filepath)
+                if first_input_path is None:
+                    first_input_path = filepath
 
-            filtered_output_defs = self._single_frame_filter(
-                input_filepaths, output_defs
+        filtered_output_defs = self._single_frame_filter(
+            input_filepaths, output_defs
+        )
+        if not filtered_output_defs:
+            self.log.debug((
+                "Repre: {} - All output definitions were filtered"
+                " out by single frame filter. Skipping"
+            ).format(repre["name"]))
+            return []
+
+        # Skip if file is not set
+        if first_input_path is None:
+            self.log.warning((
+                "Representation \"{}\" have empty files. Skipped."
+            ).format(repre["name"]))
+            return []
+
+        # Determine if representation requires pre conversion for ffmpeg
+        do_convert = should_convert_for_ffmpeg(first_input_path)
+        # If result is None the requirement of conversion can't be
+        #   determined
+        if do_convert is None:
+            self.log.info((
+                "Can't determine if representation requires conversion."
+                " Skipped."
+            ))
+            return []
+
+        layer_name = get_review_layer_name(first_input_path)
+
+        # Do conversion if needed
+        #   - change staging dir of source representation
+        #   - must be set back after render jobs are finished
+        if do_convert:
+            new_staging_dir = get_transcode_temp_directory()
+            repre["stagingDir"] = new_staging_dir
+            converted_repres.append(
+                (repre, src_repre_staging_dir, new_staging_dir)
             )
-            if not filtered_output_defs:
-                self.log.debug((
-                    "Repre: {} - All output definitions were filtered"
-                    " out by single frame filter. Skipping"
-                ).format(repre["name"]))
-                continue
 
-            # Skip if file is not set
-            if first_input_path is None:
-                self.log.warning((
-                    "Representation \"{}\" have empty files. Skipped."
-                ).format(repre["name"]))
-                continue
+            convert_input_paths_for_ffmpeg(
+                input_filepaths,
+                new_staging_dir,
+                self.log,
+                max_workers=self.conversion_max_workers or None
+            )
 
-            # Determine if representation requires pre conversion for ffmpeg
-            do_convert = should_convert_for_ffmpeg(first_input_path)
-            # If result is None the requirement of conversion can't be
-            #   determined
-            if do_convert is None:
-                self.log.info((
-                    "Can't determine if representation requires conversion."
-                    " Skipped."
-                ))
-                continue
+        return self._render_output_definitions(
+            instance,
+            repre,
+            src_repre_staging_dir,
+            filtered_output_defs,
+            layer_name,
+            gap_files
+        )
 
-            layer_name = get_review_layer_name(first_input_path)
+    def _cleanup_render_files(self, gap_files, converted_repres):
+        """Remove temporary files created for render jobs.
 
-            # Do conversion if needed
-            #   - change staging dir of source representation
-            #   - must be set back after output definitions processing
-            if do_convert:
-                new_staging_dir = get_transcode_temp_directory()
-                repre["stagingDir"] = new_staging_dir
+        Args:
+            gap_files (set[str]): Files created to fill gaps in sequence.
+            converted_repres (list[tuple[dict, str, str]]): Representations
+                with staging dir changed by conversion.
+        """
+        # Delete files added to fill gaps
+        for path in gap_files:
+            if os.path.lexists(path):
+                os.unlink(path)
+        gap_files.clear()
+
+        # Make sure temporary staging is cleaned up and representation
+        #   has set origin stagingDir
+        for repre, src_staging_dir, new_staging_dir in converted_repres:
+            # Set staging dir of source representation back to previous
+            #   value
+            repre["stagingDir"] = src_staging_dir
+            if os.path.exists(new_staging_dir):
+                shutil.rmtree(new_staging_dir)
+        converted_repres.clear()
+
+    def _run_render_jobs(self, instance, render_jobs):
+        """Execute prepared render jobs and add created representations.
+
+        Jobs are executed concurrently when 'concurrent_jobs' is higher
+        than 1. Representations are always added in order of jobs.
 
-                convert_input_paths_for_ffmpeg(
-                    input_filepaths,
-                    new_staging_dir,
-                    self.log
-                )
+        Args:
+            instance (Instance): Currently processed instance.
+            render_jobs (list[dict]): Prepared render jobs.
+        """
+        if not render_jobs:
+            return
 
-            try:
-                self._render_output_definitions(
-                    instance,
-                    repre,
-                    src_repre_staging_dir,
-                    filtered_output_defs,
-                    layer_name
-                )
+        max_workers = min(self.concurrent_jobs, len(render_jobs))
+        if max_workers <= 1:
+            for render_job in render_jobs:
+                self._run_render_job(render_job)
 
-            finally:
-                # Make sure temporary staging is cleaned up and representation
-                #   has set origin stagingDir
-                if do_convert:
-                    # Set staging dir of source representation back to previous
-                    #   value
-                    repre["stagingDir"] = src_repre_staging_dir
-                    if os.path.exists(new_staging_dir):
-                        shutil.rmtree(new_staging_dir)
+        else:
+            self.log.debug("Running {} render jobs in {} workers".format(
+                len(render_jobs), max_workers
+            ))
+            run_in_thread_pool(
+                self._run_render_job, render_jobs, max_workers, self.log
+            )
+
+        for render_job in render_jobs:
+            new_repre = render_job["representation"]
+            # adding representation
+            self.log.debug(
+                "Adding new representation: {}".format(new_repre)
+            )
+            instance.data["representations"].append(new_repre)
+
+            add_repre_files_for_cleanup(instance, new_repre)
+
+    def _run_render_job(self, render_job):
+        subprcs_cmd = render_job["command"]
+        # run subprocess
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+
+        run_subprocess(subprcs_cmd, shell=True, logger=self.log)
 
     def _render_output_definitions(
         self,
@@ -344,8 +458,25 @@ class ExtractReview(pyblish.api.InstancePlugin):
         repre,
         src_repre_staging_dir,
         output_definitions,
-        layer_name
+        layer_name,
+        gap_files
     ):
+        """Prepare render jobs for output definitions of representation.
+
+        Args:
+            instance (Instance): Currently processed instance.
+            repre (dict): Source representation.
+            src_repre_staging_dir (str): Original staging dir of source
+                representation.
+            output_definitions (list[dict]): Output definitions to render.
+            layer_name (Union[str, None]): Layer used as input.
+            gap_files (set[str]): Files created to fill gaps in sequence.
+
+        Returns:
+            list[dict]: Render jobs with ffmpeg command and new
+                representation.
+        """
+        render_jobs = []
         fill_data = copy.deepcopy(instance.data["anatomyData"])
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
@@ -396,15 +527,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
             if temp_data["input_is_sequence"]:
                 self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
+                gap_files.update(self.fill_sequence_gaps(
                     files=temp_data["origin_repre"]["files"],
                     staging_dir=new_repre["stagingDir"],
                     start_frame=temp_data["frame_start"],
                     end_frame=temp_data["frame_end"]
-                )
+                ))
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -450,21 +580,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    return render_jobs
                 raise NotImplementedError
 
             subprcs_cmd = " ".join(ffmpeg_args)
 
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
-
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
-
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
             new_repre.update({
                 "fps": temp_data["fps"],
                 "name": "{}_{}".format(output_name, output_ext),
@@ -480,13 +600,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
             if "clean_name" in new_repre.get("tags", []):
                 new_repre.pop("outputName")
 
-            # adding representation
-            self.log.debug(
-                "Adding new representation: {}".format(new_repre)
-            )
-            instance.data["representations"].append(new_repre)
-
-            add_repre_files_for_cleanup(instance, new_repre)
+            render_jobs.append({
+                "command": subprcs_cmd,
+                "representation": new_repre,
+            })
+        return render_jobs
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -788,6 +906,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 for arg in reversed(color_args):
                     ffmpeg_video_filters.insert(0, arg)
 
+        # Limit threads used by ffmpeg if not set by output definition
+        if self.ffmpeg_threads > 0 and not any(
+            arg.startswith("-threads") for arg in ffmpeg_output_args
+        ):
+            ffmpeg_output_args.extend(
+                ["-threads", str(self.ffmpeg_threads)]
+            )
+
         # Add argument to override output file
         ffmpeg_output_args.append("-y")
 
@@ -881,8 +1007,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
+        This will take nearest frame file and link or copy it with so as to
+        fill gaps in sequence. Last existing file there is is used to for the
         hole ahead.
 
         Args:
@@ -927,11 +1053,48 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            self._fill_gap_file(src_fpath, hole_fpath)
             added_files.append(hole_fpath)
 
         return added_files
 
+    def _fill_gap_file(self, src_fpath, hole_fpath):
+        """Create file filling a hole in sequence.
+
+        Hardlink is used if possible, then symlink and copy of the file
+        as the last option. Copy is always used if 'fill_gaps_method'
+        is set to "copy".
+
+        Args:
+            src_fpath (str): Path to existing frame.
+            hole_fpath (str): Path to missing frame.
+        """
+        # Hole may be already filled by previous output definition
+        if os.path.lexists(hole_fpath):
+            os.remove(hole_fpath)
+
+        if self.fill_gaps_method == "link":
+            try:
+                create_hard_link(src_fpath, hole_fpath)
+                return
+            except (OSError, NotImplementedError):
+                pass
+
+            try:
+                os.symlink(
+                    os.path.basename(src_fpath),
+                    hole_fpath
+                )
+                return
+            except (OSError, NotImplementedError):
+                pass
+
+            self.log.debug(
+                "Links are not supported. Copying \"{}\"".format(src_fpath)
+            )
+
+        speedcopy.copyfile(src_fpath, hole_fpath)
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
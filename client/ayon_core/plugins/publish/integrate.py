@@ -5,12 +5,7 @@ import copy
 
 import clique
 import pyblish.api
-from ayon_api import (
-    get_attributes_for_type,
-    get_product_by_name,
-    get_version_by_name,
-    get_representations,
-)
+from ayon_api import get_attributes_for_type
 from ayon_api.operations import (
     OperationsSession,
     new_product_entity,
@@ -27,6 +22,7 @@ from ayon_core.lib.file_transaction import (
 from ayon_core.pipeline.publish import (
     KnownPublishError,
     get_publish_template_name,
+    get_publish_entities_cache,
 )
 
 log = logging.getLogger(__name__)
@@ -129,6 +125,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "family",  # product[type]
     ]
 
+    # Number of files transferred concurrently (modified using settings)
+    transfer_max_workers = 1
+    # 'hashlib' algorithm used to calculate content hash of published files
+    #   during transfer, 'op3' hash based on file stat is used if empty
+    content_hash_algorithm = ""
+    # Use copy-on-write clones instead of copies where filesystem allows it
+    use_reflinks = False
+
     def process(self, instance):
         # Instance should be integrated on a farm
         if instance.data.get("farm"):
@@ -151,9 +155,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["productType"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            hash_algorithm=self.content_hash_algorithm or None
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -219,6 +227,8 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         template_name = self.get_template_name(instance)
 
+        self._prefetch_entities(instance.context)
+
         op_session = OperationsSession()
         product_entity = self.prepare_product(
             instance, op_session, project_name
@@ -231,14 +241,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         anatomy = instance.context.data["anatomy"]
 
         # Get existing representations (if any)
+        entities_cache = get_publish_entities_cache(instance.context)
         existing_repres_by_name = {
             repre_entity["name"].lower(): repre_entity
-            for repre_entity in get_representations(
-                project_name,
-                version_ids=[version_entity["id"]]
+            for repre_entity in entities_cache.get_representations(
+                version_entity["id"]
             )
         }
 
+        copy_mode = FileTransaction.MODE_COPY
+        if self.use_reflinks:
+            copy_mode = FileTransaction.MODE_REFLINK
+
         # Prepare all representations
         prepared_representations = []
         for repre in filtered_repres:
@@ -253,7 +267,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             for src, dst in prepared["transfers"]:
                 # todo: add support for hardlink transfers
-                file_transactions.add(src, dst)
+                file_transactions.add(src, dst, mode=copy_mode)
 
             prepared_representations.append(prepared)
 
@@ -264,7 +278,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         resource_destinations = set()
 
         file_copy_modes = [
-            ("transfers", FileTransaction.MODE_COPY),
+            ("transfers", copy_mode),
             ("hardlinks", FileTransaction.MODE_HARDLINK)
         ]
         for files_type, copy_mode in file_copy_modes:
@@ -279,7 +293,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Transaction to reduce the chances of another publish trying to
         # publish to the same version number since that chance can greatly
         # increase if the file transaction takes a long time.
-        op_session.commit()
+        self._commit_operations(op_session, instance.context)
 
         self.log.info((
             "Product '{}' version {} written to database.."
@@ -298,7 +312,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # version instance instead of an individual representation) so
         # we can reuse those file infos per representation
         resource_file_infos = self.get_files_info(
-            resource_destinations, anatomy
+            resource_destinations, anatomy, file_transactions
         )
 
         # Finalize the representations now the published files are integrated
@@ -310,7 +324,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_files = self.get_files_info(
-                destinations, anatomy
+                destinations, anatomy, file_transactions
             )
             # Add the version resource file infos to each representation
             repre_files += resource_file_infos
@@ -346,8 +360,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                         project_name, "representation", existing_repres["id"]
                     )
 
-        self.log.debug("{}".format(op_session.to_data()))
-        op_session.commit()
+        self._commit_operations(op_session, instance.context)
 
         # Backwards compatibility used in hero integration.
         # todo: can we avoid the need to store this?
@@ -371,8 +384,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         self.log.debug("Product: {}".format(product_name))
 
         # Get existing product if it exists
-        existing_product_entity = get_product_by_name(
-            project_name, product_name, folder_entity["id"]
+        entities_cache = get_publish_entities_cache(instance.context)
+        existing_product_entity = entities_cache.get_product_by_name(
+            folder_entity["id"], product_name
         )
 
         # Define product data
@@ -439,10 +453,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         if task_entity:
             task_id = task_entity["id"]
 
-        existing_version = get_version_by_name(
-            project_name,
-            version_number,
-            product_entity["id"]
+        entities_cache = get_publish_entities_cache(instance.context)
+        existing_version = entities_cache.get_version_by_name(
+            product_entity["id"], version_number
         )
         version_id = None
         if existing_version:
@@ -664,17 +677,25 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_sequence_representation:
                 files = [files]
 
-            repre_context = None
-            transfers = []
-            for src_file_name in files:
-                template_data["originalBasename"], _ = os.path.splitext(
-                    src_file_name)
+            # Solve template only once and fill only 'originalBasename'
+            #   for each file
+            formatter = path_template_obj.compile_frame_formatter(
+                template_data, "originalBasename"
+            )
+            basenames = [
+                os.path.splitext(src_file_name)[0]
+                for src_file_name in files
+            ]
+            first_filled = formatter.format_result(basenames[0])
+            repre_context = first_filled.used_values
+            dst_filepaths = [first_filled]
+            dst_filepaths.extend(formatter.format_many(basenames[1:]))
+            template_data["originalBasename"] = basenames[-1]
 
-                dst = path_template_obj.format_strict(template_data)
+            transfers = []
+            for src_file_name, dst in zip(files, dst_filepaths):
                 src = os.path.join(stagingdir, src_file_name)
                 transfers.append((src, dst))
-                if repre_context is None:
-                    repre_context = dst.used_values
 
             if not is_udim and first_index_padded is not None:
                 repre_context["frame"] = first_index_padded
@@ -721,22 +742,22 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            # - template is solved once and only frame (or udim) is filled
+            #   for each index
+            frame_key = "udim" if is_udim else "frame"
+            formatter = path_template_obj.compile_frame_formatter(
+                template_data, frame_key
+            )
+            template_filled = formatter.format_result(destination_indexes[0])
+            self.log.debug(
+                "Template filled: {}".format(str(template_filled))
+            )
+            repre_context = template_filled.used_values
+            dst_filepaths = [template_filled]
+            dst_filepaths.extend(
+                formatter.format_many(destination_indexes[1:])
+            )
+            template_data[frame_key] = destination_indexes[-1]
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -953,41 +974,100 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, filepaths, anatomy):
+    def get_rootless_paths(self, anatomy, paths):
+        """Returns paths without absolute portion from root.
+
+        Same as 'get_rootless_path' but for multiple paths at once.
+
+        Args:
+            anatomy (Anatomy): Project anatomy.
+            paths (list[str]): Absolute paths.
+
+        Returns:
+            list[str]: Paths where root path is replaced by formatting
+                string.
+
+        """
+        output = []
+        results = anatomy.find_root_templates_from_paths(paths)
+        for path, (success, rootless_path) in zip(paths, results):
+            if success:
+                path = rootless_path
+            else:
+                self.log.warning((
+                    "Could not find root path for remapping \"{}\"."
+                    " This may cause issues on farm."
+                ).format(path))
+            output.append(path)
+        return output
+
+    def get_files_info(self, filepaths, anatomy, file_transactions=None):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             filepaths (Iterable[str]): List of transferred file paths.
             anatomy (Anatomy): Project anatomy.
+            file_transactions (Optional[FileTransaction]): Processed file
+                transaction with information about transferred files.
 
         Returns:
             list[dict[str, Any]]: Representation 'files' information.
 
         """
+        filepaths = list(filepaths)
+        rootless_paths = self.get_rootless_paths(anatomy, filepaths)
         file_infos = []
-        for filepath in filepaths:
-            file_info = self.prepare_file_info(filepath, anatomy)
+        for filepath, rootless_path in zip(filepaths, rootless_paths):
+            transfer_info = None
+            if file_transactions is not None:
+                transfer_info = file_transactions.get_file_info(filepath)
+            file_info = self.prepare_file_info(
+                filepath, anatomy, transfer_info, rootless_path
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy):
+    def prepare_file_info(
+        self, path, anatomy, transfer_info=None, rootless_path=None
+    ):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
             path (str): Destination url of published file.
             anatomy (Anatomy): Project anatomy part from instance.
+            transfer_info (Optional[dict[str, Any]]): Information about
+                the file collected during transfer.
+            rootless_path (Optional[str]): Path with root replaced by
+                formatting key. Calculated if not passed.
 
         Returns:
             dict[str, Any]: Representation file info dictionary.
 
         """
+        if transfer_info is None:
+            file_stat = os.stat(path)
+            content_hash = None
+        else:
+            file_stat = transfer_info["stat"]
+            content_hash = transfer_info["hash"]
+
+        if content_hash is not None:
+            file_hash = content_hash
+            hash_type = transfer_info["hash_type"]
+        else:
+            file_hash = source_hash(path, file_stat=file_stat)
+            hash_type = "op3"
+
+        if rootless_path is None:
+            rootless_path = self.get_rootless_path(anatomy, path)
+
         return {
             "id": create_entity_id(),
             "name": os.path.basename(path),
-            "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
-            "hash_type": "op3",
+            "path": rootless_path,
+            "size": file_stat.st_size,
+            "hash": file_hash,
+            "hash_type": hash_type,
         }
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
@@ -1009,6 +1089,72 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 "must be in project dir"
             ))
 
+    def _prefetch_entities(self, context):
+        """Query existing entities of all instances at once.
+
+        Products, versions and representations of instances are stored
+        to publish entities cache so each instance does not have to query
+        them on its own. Only existing entities are cached, missing product
+        or version is queried again right before it would be created.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+        """
+        if context.data.get("ayonEntitiesPrefetched"):
+            return
+        context.data["ayonEntitiesPrefetched"] = True
+
+        entities_cache = get_publish_entities_cache(context)
+        instances = [
+            instance
+            for instance in context
+            if (
+                instance.data.get("folderEntity")
+                and instance.data.get("productName")
+                and instance.data.get("publish", True)
+            )
+        ]
+        products_by_key = entities_cache.prefetch_products(
+            (instance.data["folderEntity"]["id"], instance.data["productName"])
+            for instance in instances
+        )
+
+        version_keys = set()
+        for instance in instances:
+            version = instance.data.get("version")
+            if version is None:
+                continue
+            product_entity = products_by_key.get((
+                instance.data["folderEntity"]["id"],
+                instance.data["productName"]
+            ))
+            if product_entity:
+                version_keys.add((product_entity["id"], version))
+
+        if not version_keys:
+            return
+
+        versions_by_key = entities_cache.prefetch_versions(version_keys)
+        version_ids = {
+            version_entity["id"]
+            for version_entity in versions_by_key.values()
+        }
+        entities_cache.prefetch_representations(version_ids)
+
+    def _commit_operations(self, op_session, context):
+        """Commit operations and invalidate changed cached entities.
+
+        Args:
+            op_session (OperationsSession): Operations session to commit.
+            context (pyblish.api.Context): Publish context.
+        """
+        operations_data = op_session.to_data()
+        self.log.debug("{}".format(operations_data))
+        op_session.commit()
+        get_publish_entities_cache(context).invalidate_by_operations(
+            operations_data
+        )
+
     def _get_attributes_for_type(self, context, entity_type):
         return self._get_attributes_by_type(context)[entity_type]
 
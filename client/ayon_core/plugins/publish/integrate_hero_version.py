@@ -12,9 +12,15 @@ from ayon_api.operations import (
 )
 from ayon_api.utils import create_entity_id
 
-from ayon_core.lib import create_hard_link, source_hash
+from ayon_core.lib import (
+    create_hard_link,
+    copy_file_with_reflink,
+    source_hash,
+    run_in_thread_pool,
+)
 from ayon_core.pipeline.publish import (
     get_publish_template_name,
+    get_publish_entities_cache,
     OptionalPyblishPluginMixin,
 )
 
@@ -90,6 +96,10 @@ class IntegrateHeroVersion(
     # *but all other plugins must be successfully completed
 
     use_hardlinks = False
+    # Use copy-on-write clones instead of copies where filesystem allows it
+    use_reflinks = False
+    # Number of files transferred concurrently (modified using settings)
+    transfer_max_workers = 1
 
     def process(self, instance):
         if not self.is_active(instance.data):
@@ -136,6 +146,7 @@ class IntegrateHeroVersion(
         anatomy = instance.context.data["anatomy"]
         published_repres = instance.data["published_representations"]
         hero_publish_dir = self.get_publish_dir(instance, template_key)
+        entities_cache = get_publish_entities_cache(instance.context)
 
         src_version_entity = instance.data.get("versionEntity")
         filtered_repre_ids = []
@@ -164,7 +175,7 @@ class IntegrateHeroVersion(
                 " Querying entity from database."
             ))
             src_version_entity = self.version_from_representations(
-                project_name, published_repres
+                project_name, published_repres, entities_cache
             )
 
         if not src_version_entity:
@@ -222,7 +233,7 @@ class IntegrateHeroVersion(
 
         # Current version
         old_version, old_repres = self.current_hero_ents(
-            project_name, src_version_entity
+            project_name, src_version_entity, entities_cache
         )
         inactive_old_repres_by_name = {}
         old_repres_by_name = {}
@@ -415,11 +426,9 @@ class IntegrateHeroVersion(
             # Copy(hardlink) paths of source and destination files
             # TODO should we *only* create hardlinks?
             # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            self.copy_files(
+                src_to_dst_file_paths + other_file_paths_mapping
+            )
 
             # Update prepared representation etity data with files
             #   and integrate it to server.
@@ -477,7 +486,9 @@ class IntegrateHeroVersion(
                     {"active": False}
                 )
 
+            operations_data = op_session.to_data()
             op_session.commit()
+            entities_cache.invalidate_by_operations(operations_data)
 
             # Remove backuped previous hero
             if (
@@ -535,12 +546,13 @@ class IntegrateHeroVersion(
             dict[str, Any]: Representation file info dictionary.
 
         """
+        file_stat = os.stat(path)
         return {
             "id": create_entity_id(),
             "name": os.path.basename(path),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "size": file_stat.st_size,
+            "hash": source_hash(path, file_stat=file_stat),
             "hash_type": "op3",
         }
 
@@ -608,6 +620,34 @@ class IntegrateHeroVersion(
             ).format(path))
         return path
 
+    def copy_files(self, src_to_dst_file_paths):
+        """Copy (hardlink) files, concurrently if enabled by settings.
+
+        Args:
+            src_to_dst_file_paths (list[tuple[str, str]]): Source and
+                destination paths.
+        """
+        max_workers = self.transfer_max_workers or 1
+        if max_workers < 2 or len(src_to_dst_file_paths) < 2:
+            for src_path, dst_path in src_to_dst_file_paths:
+                self.copy_file(src_path, dst_path)
+            return
+
+        # Create destination folders before the files are copied
+        dirnames = {
+            os.path.dirname(dst_path)
+            for _, dst_path in src_to_dst_file_paths
+        }
+        for dirname in dirnames:
+            os.makedirs(dirname, exist_ok=True)
+
+        run_in_thread_pool(
+            lambda paths: self.copy_file(*paths),
+            src_to_dst_file_paths,
+            max_workers,
+            self.log
+        )
+
     def copy_file(self, src_path, dst_path):
         # TODO check drives if are the same to check if cas hardlink
         dirname = os.path.dirname(dst_path)
@@ -644,31 +684,55 @@ class IntegrateHeroVersion(
             self.log.debug(
                 "Hardlinking failed, falling back to regular copy...")
 
+        if self.use_reflinks:
+            self.log.debug("Reflinking file \"{}\" to \"{}\"".format(
+                src_path, dst_path
+            ))
+            copy_file_with_reflink(src_path, dst_path, shutil.copy)
+            return
+
         self.log.debug("Copying file \"{}\" to \"{}\"".format(
             src_path, dst_path
         ))
 
         shutil.copy(src_path, dst_path)
 
-    def version_from_representations(self, project_name, repres):
+    def version_from_representations(
+        self, project_name, repres, entities_cache=None
+    ):
         for repre in repres:
-            version = ayon_api.get_version_by_id(
-                project_name, repre["versionId"]
-            )
+            if entities_cache is not None:
+                version = entities_cache.get_version_by_id(
+                    repre["versionId"]
+                )
+            else:
+                version = ayon_api.get_version_by_id(
+                    project_name, repre["versionId"]
+                )
             if version:
                 return version
 
-    def current_hero_ents(self, project_name, version):
-        hero_version = ayon_api.get_hero_version_by_product_id(
-            project_name, version["productId"]
-        )
+    def current_hero_ents(self, project_name, version, entities_cache=None):
+        if entities_cache is not None:
+            hero_version = entities_cache.get_hero_version_by_product_id(
+                version["productId"]
+            )
+        else:
+            hero_version = ayon_api.get_hero_version_by_product_id(
+                project_name, version["productId"]
+            )
 
         if not hero_version:
             return (None, [])
 
-        hero_repres = list(ayon_api.get_representations(
-            project_name, version_ids={hero_version["id"]}
-        ))
+        if entities_cache is not None:
+            hero_repres = entities_cache.get_representations(
+                hero_version["id"]
+            )
+        else:
+            hero_repres = list(ayon_api.get_representations(
+                project_name, version_ids={hero_version["id"]}
+            ))
         return (hero_version, hero_repres)
 
     def _get_name_without_ext(self, value):
@@ -29,6 +29,8 @@ import pyblish.api
 import ayon_api
 from ayon_api.operations import OperationsSession
 
+from ayon_core.pipeline.publish import get_publish_entities_cache
+
 InstanceFilterResult = collections.namedtuple(
     "InstanceFilterResult",
     ["instance", "thumbnail_path", "version_id"]
@@ -58,21 +60,15 @@ class IntegrateThumbnailsAYON(pyblish.api.ContextPlugin):
             for instance_items in filtered_instance_items
         }
         # Query versions
-        version_entities = ayon_api.get_versions(
-            project_name,
-            version_ids=version_ids,
-            hero=True,
-            fields={"id", "version"}
+        entities_cache = get_publish_entities_cache(context)
+        version_entities_by_id = entities_cache.prefetch_versions_by_ids(
+            version_ids
         )
-        # Store version by their id (converted to string)
-        version_entities_by_id = {
-            version_entity["id"]: version_entity
-            for version_entity in version_entities
-        }
         self._integrate_thumbnails(
             filtered_instance_items,
             version_entities_by_id,
-            project_name
+            project_name,
+            entities_cache
         )
 
     def _prepare_instances(self, context):
@@ -165,7 +161,8 @@ class IntegrateThumbnailsAYON(pyblish.api.ContextPlugin):
         self,
         filtered_instance_items,
         version_entities_by_id,
-        project_name
+        project_name,
+        entities_cache=None
     ):
         # Make sure each entity id has defined only one thumbnail id
         thumbnail_info_by_entity_id = {}
@@ -214,7 +211,10 @@ class IntegrateThumbnailsAYON(pyblish.api.ContextPlugin):
                 entity_id,
                 {"thumbnailId": thumbnail_id}
             )
+        operations_data = op_session.to_data()
         op_session.commit()
+        if entities_cache is not None:
+            entities_cache.invalidate_by_operations(operations_data)
 
     def _get_instance_label(self, instance):
         return (
@@ -4,6 +4,8 @@ from .lib import (
     get_project_settings,
     get_general_environments,
     get_current_project_settings,
+    invalidate_settings_cache,
+    prefetch_project_settings,
 )
 
 
@@ -13,4 +15,6 @@ __all__ = (
     "get_general_environments",
     "get_project_settings",
     "get_current_project_settings",
+    "invalidate_settings_cache",
+    "prefetch_project_settings",
 )
@@ -1,14 +1,24 @@
 import os
 import json
+import hashlib
 import logging
 import collections
 import copy
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import ayon_api
 
 log = logging.getLogger(__name__)
 
+# Environment variable with lifetime of settings cached on disk in seconds
+#   - disk cache is disabled if not set or is '0'
+SETTINGS_CACHE_TTL_ENV_KEY = "AYON_SETTINGS_CACHE_TTL"
+# Default number of concurrent requests of 'prefetch_project_settings'
+PREFETCH_MAX_WORKERS = 8
+# Default lifetime of prefetched project settings in seconds
+PREFETCH_LIFETIME = 120
+
 
 class CacheItem:
     lifetime = 10
@@ -26,15 +36,155 @@ class CacheItem:
     def get_value(self):
         return copy.deepcopy(self._value)
 
-    def update_value(self, value):
+    def update_value(self, value, lifetime=None):
+        if lifetime is None:
+            lifetime = self.lifetime
         self._value = value
-        self._outdate_time = time.time() + self.lifetime
+        self._outdate_time = time.time() + lifetime
 
     @property
     def is_outdated(self):
         return time.time() > self._outdate_time
 
 
+class _SettingsDiskCache:
+    """Settings stored on disk to be shared across processes.
+
+    Cache is keyed by server url, bundle, variant, site id and project
+    name. Cached values are used until they are older than lifetime
+    defined by 'AYON_SETTINGS_CACHE_TTL' environment variable. Changed
+    bundle or variant will always lead to new cache files.
+    """
+    dirname = "settings_cache"
+
+    @classmethod
+    def get_lifetime(cls):
+        """Lifetime of cached values in seconds.
+
+        Returns:
+            int: Lifetime in seconds. Cache is disabled if is '0'.
+        """
+        value = os.getenv(SETTINGS_CACHE_TTL_ENV_KEY)
+        if not value:
+            return 0
+        try:
+            return max(0, int(value))
+        except ValueError:
+            log.warning(
+                "Invalid value of {} \"{}\"".format(
+                    SETTINGS_CACHE_TTL_ENV_KEY, value
+                )
+            )
+        return 0
+
+    @classmethod
+    def is_enabled(cls):
+        return cls.get_lifetime() > 0
+
+    @classmethod
+    def get_cache_dir(cls):
+        from ayon_core.lib import get_launcher_local_dir
+
+        return get_launcher_local_dir(cls.dirname)
+
+    @classmethod
+    def _get_filepath(cls, key):
+        key_hash = hashlib.sha256(
+            json.dumps(key).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(cls.get_cache_dir(), "{}.json".format(key_hash))
+
+    @classmethod
+    def get_value(cls, key):
+        """Get cached value if is not outdated.
+
+        Args:
+            key (list[str]): Key of value.
+
+        Returns:
+            Union[Any, None]: Cached value or None.
+        """
+        lifetime = cls.get_lifetime()
+        if lifetime <= 0:
+            return None
+
+        filepath = cls._get_filepath(key)
+        try:
+            with open(filepath, "r") as stream:
+                data = json.load(stream)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            log.debug(
+                "Failed to read settings cache {}".format(filepath),
+                exc_info=True
+            )
+            return None
+
+        if (
+            data.get("key") != key
+            or time.time() - data.get("created", 0) > lifetime
+        ):
+            return None
+        return data.get("value")
+
+    @classmethod
+    def set_value(cls, key, value):
+        """Store value to disk cache.
+
+        Args:
+            key (list[str]): Key of value.
+            value (Any): Json serializable value.
+        """
+        if not cls.is_enabled():
+            return
+
+        filepath = cls._get_filepath(key)
+        tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(
+                    {"key": key, "created": time.time(), "value": value},
+                    stream
+                )
+            # Replace is atomic so other processes never read partial file
+            os.replace(tmp_path, filepath)
+
+        except Exception:
+            log.debug(
+                "Failed to write settings cache {}".format(filepath),
+                exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @classmethod
+    def clear(cls):
+        """Remove all cached files.
+
+        Returns:
+            int: Number of removed files.
+        """
+        cache_dir = cls.get_cache_dir()
+        if not os.path.isdir(cache_dir):
+            return 0
+
+        count = 0
+        for filename in os.listdir(cache_dir):
+            if not filename.endswith((".json", ".tmp")):
+                continue
+            try:
+                os.remove(os.path.join(cache_dir, filename))
+                count += 1
+            except OSError:
+                log.warning(
+                    "Failed to remove settings cache {}".format(filename),
+                    exc_info=True
+                )
+        return count
+
+
 class _AyonSettingsCache:
     use_bundles = None
     variant = None
@@ -76,9 +226,34 @@ class _AyonSettingsCache:
         return os.environ["AYON_BUNDLE_NAME"]
 
     @classmethod
-    def get_value_by_project(cls, project_name):
-        cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
-        if cache_item.is_outdated:
+    def _get_disk_cache_key(cls, *parts):
+        bundle_name = None
+        if cls._use_bundles():
+            bundle_name = cls._get_bundle_name()
+        return [
+            ayon_api.get_base_url(),
+            ayon_api.get_site_id(),
+            bundle_name,
+            cls._get_variant(),
+            *parts
+        ]
+
+    @classmethod
+    def _query_value_by_project(cls, project_name):
+        disk_cache_key = None
+        if _SettingsDiskCache.is_enabled():
+            disk_cache_key = cls._get_disk_cache_key(
+                "settings", project_name
+            )
+            value = _SettingsDiskCache.get_value(disk_cache_key)
+            if value is not None:
+                return value
+
+        from ayon_core.lib import profile_section
+
+        with profile_section(
+            "settings", "settings", project_name=project_name
+        ):
             if cls._use_bundles():
                 value = ayon_api.get_addons_settings(
                     bundle_name=cls._get_bundle_name(),
@@ -87,9 +262,63 @@ class _AyonSettingsCache:
                 )
             else:
                 value = ayon_api.get_addons_settings(project_name)
+        if disk_cache_key is not None:
+            _SettingsDiskCache.set_value(disk_cache_key, value)
+        return value
+
+    @classmethod
+    def get_value_by_project(cls, project_name):
+        cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
+        if cache_item.is_outdated:
+            value = cls._query_value_by_project(project_name)
             cache_item.update_value(value)
         return cache_item.get_value()
 
+    @classmethod
+    def prefetch_projects(
+        cls, project_names, max_workers=None, lifetime=None
+    ):
+        project_names = {
+            project_name
+            for project_name in project_names
+            if _AyonSettingsCache.cache_by_project_name[
+                project_name
+            ].is_outdated
+        }
+        if not project_names:
+            return
+
+        # Resolve shared values before threads are started
+        cls._use_bundles()
+        cls._get_variant()
+
+        if max_workers is None:
+            max_workers = PREFETCH_MAX_WORKERS
+        if lifetime is None:
+            lifetime = PREFETCH_LIFETIME
+        max_workers = max(1, min(max_workers, len(project_names)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(cls._query_value_by_project, project_name):
+                    project_name
+                for project_name in project_names
+            }
+            for future in as_completed(futures):
+                project_name = futures[future]
+                try:
+                    value = future.result()
+                except Exception:
+                    log.warning(
+                        (
+                            "Failed to prefetch settings of project \"{}\""
+                        ).format(project_name),
+                        exc_info=True
+                    )
+                    continue
+                _AyonSettingsCache.cache_by_project_name[
+                    project_name
+                ].update_value(value, lifetime)
+
     @classmethod
     def _get_addon_versions_from_bundle(cls):
         expected_bundle = cls._get_bundle_name()
@@ -106,22 +335,43 @@ class _AyonSettingsCache:
             return bundle["addons"]
         return {}
 
+    @classmethod
+    def _query_addon_versions(cls):
+        if cls._use_bundles():
+            return cls._get_addon_versions_from_bundle()
+        settings_data = ayon_api.get_addons_settings(
+            only_values=False,
+            variant=cls._get_variant()
+        )
+        return settings_data["versions"]
+
     @classmethod
     def get_addon_versions(cls):
         cache_item = _AyonSettingsCache.addon_versions
         if cache_item.is_outdated:
-            if cls._use_bundles():
-                addons = cls._get_addon_versions_from_bundle()
-            else:
-                settings_data = ayon_api.get_addons_settings(
-                    only_values=False,
-                    variant=cls._get_variant()
-                )
-                addons = settings_data["versions"]
+            disk_cache_key = None
+            addons = None
+            if _SettingsDiskCache.is_enabled():
+                disk_cache_key = cls._get_disk_cache_key("addon_versions")
+                addons = _SettingsDiskCache.get_value(disk_cache_key)
+
+            if addons is None:
+                from ayon_core.lib import profile_section
+
+                with profile_section("addon_versions", "settings"):
+                    addons = cls._query_addon_versions()
+                if disk_cache_key is not None:
+                    _SettingsDiskCache.set_value(disk_cache_key, addons)
             cache_item.update_value(addons)
 
         return cache_item.get_value()
 
+    @classmethod
+    def invalidate(cls):
+        _AyonSettingsCache.addon_versions = CacheItem.create_outdated()
+        _AyonSettingsCache.studio_settings = CacheItem.create_outdated()
+        _AyonSettingsCache.cache_by_project_name.clear()
+
 
 def get_ayon_settings(project_name=None):
     """AYON studio settings.
@@ -138,6 +388,19 @@ def get_ayon_settings(project_name=None):
     return _AyonSettingsCache.get_value_by_project(project_name)
 
 
+def invalidate_settings_cache():
+    """Invalidate cached settings in memory and on disk.
+
+    Settings are queried from server on next request.
+
+    Returns:
+        int: Number of removed files from disk cache.
+    """
+
+    _AyonSettingsCache.invalidate()
+    return _SettingsDiskCache.clear()
+
+
 def get_studio_settings(*args, **kwargs):
     return _AyonSettingsCache.get_value_by_project(None)
 
@@ -146,6 +409,32 @@ def get_project_settings(project_name, *args, **kwargs):
     return _AyonSettingsCache.get_value_by_project(project_name)
 
 
+def prefetch_project_settings(
+    project_names, max_workers=None, lifetime=None
+):
+    """Query settings of multiple projects at once.
+
+    Settings of projects are queried concurrently and stored to cache,
+    so following 'get_project_settings' calls are not querying server.
+    Projects with valid cached settings are skipped.
+
+    Prefetched settings are cached longer than settings queried by
+    'get_project_settings', so they are still valid when used. Use
+    'invalidate_settings_cache' to query them again sooner.
+
+    Args:
+        project_names (Iterable[str]): Project names.
+        max_workers (Optional[int]): Maximum number of concurrent
+            requests. Default is 'PREFETCH_MAX_WORKERS'.
+        lifetime (Optional[int]): Lifetime of prefetched settings in
+            seconds. Default is 'PREFETCH_LIFETIME'.
+    """
+
+    _AyonSettingsCache.prefetch_projects(
+        project_names, max_workers, lifetime
+    )
+
+
 def get_general_environments(studio_settings=None):
     """General studio environment variables.
 
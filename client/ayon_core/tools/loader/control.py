@@ -147,6 +147,7 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         folder_ids = self.get_selected_folder_ids()
 
         self._project_anatomy_cache.reset()
+        Anatomy.invalidate_shared()
         self._loaded_products_cache.reset()
 
         self._products_model.reset()
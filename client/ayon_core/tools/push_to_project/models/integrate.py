@@ -591,7 +591,7 @@ class ProjectPushItemProcess:
             ))
             raise PushToProjectError(self._status.fail_reason)
 
-        anatomy = Anatomy(src_project_name)
+        anatomy = Anatomy.get_shared(src_project_name)
 
         repre_entities = ayon_api.get_representations(
             src_project_name,
@@ -632,9 +632,8 @@ class ProjectPushItemProcess:
             f"Destination project '{dst_project_name}' found"
         )
         self._project_entity = dst_project_entity
-        self._anatomy = Anatomy(
-            dst_project_name,
-            project_entity=dst_project_entity
+        self._anatomy = Anatomy.get_shared(
+            dst_project_name, project_entity=dst_project_entity
         )
         self._project_settings = get_project_settings(
             self._item.dst_project_name
@@ -1076,12 +1075,17 @@ class ProjectPushItemProcess:
             }
             new_repre_files = []
             for (path, rootless_path) in repre_filepaths:
+                file_info = self._file_transaction.get_file_info(path)
+                if file_info is not None:
+                    file_stat = file_info["stat"]
+                else:
+                    file_stat = os.stat(path)
                 new_repre_files.append({
                     "id": create_entity_id(),
                     "name": os.path.basename(rootless_path),
                     "path": rootless_path,
-                    "size": os.path.getsize(path),
-                    "hash": source_hash(path),
+                    "size": file_stat.st_size,
+                    "hash": source_hash(path, file_stat=file_stat),
                     "hash_type": "op3",
                 })
 
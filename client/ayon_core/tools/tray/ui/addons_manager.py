@@ -22,7 +22,7 @@ class TrayAddonsManager(AddonsManager):
     )
 
     def __init__(self, tray_manager):
-        super().__init__(initialize=False)
+        super().__init__(initialize=False, lazy=False)
 
         self._tray_manager = tray_manager
 
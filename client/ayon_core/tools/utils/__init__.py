@@ -35,6 +35,7 @@ from .lib import (
     get_warning_pixmap,
     set_style_property,
     DynamicQThread,
+    QtMainThreadDispatcher,
     qt_app_context,
     get_qt_app,
     get_ayon_qt_app,
@@ -119,6 +120,7 @@ __all__ = (
     "get_warning_pixmap",
     "set_style_property",
     "DynamicQThread",
+    "QtMainThreadDispatcher",
     "qt_app_context",
     "get_qt_app",
     "get_ayon_qt_app",
@@ -341,6 +341,36 @@ class DynamicQThread(QtCore.QThread):
         self._func(*self._args, **self._kwargs)
 
 
+class QtMainThreadDispatcher(QtCore.QObject):
+    """Call functions on thread where the object was created.
+
+    Object is callable and can be used as dispatcher of
+    'ThreadSafeEventSystem'. The object must be created on the thread
+    where functions should be called, usually the main thread.
+
+    Args:
+        parent (Optional[QtCore.QObject]): Parent object.
+    """
+    _call_requested = QtCore.Signal(object)
+
+    def __init__(self, parent=None):
+        super(QtMainThreadDispatcher, self).__init__(parent)
+        self._call_requested.connect(
+            self._on_call_request, QtCore.Qt.QueuedConnection
+        )
+
+    def __call__(self, func):
+        """Schedule function call. Can be called from any thread.
+
+        Args:
+            func (Callable[[], Any]): Function to call.
+        """
+        self._call_requested.emit(func)
+
+    def _on_call_request(self, func):
+        func()
+
+
 class WrappedCallbackItem:
     """Structure to store information about callback and args/kwargs for it.
 
@@ -528,9 +528,56 @@ class ExtractReviewProfileModel(BaseSettingsModel):
         return value
 
 
+_fill_gaps_methods_enum = [
+    {"value": "link", "label": "Hardlink or symlink"},
+    {"value": "copy", "label": "Copy"},
+]
+
+
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    concurrent_jobs: int = SettingsField(
+        1,
+        ge=1,
+        le=32,
+        title="Concurrent ffmpeg jobs",
+        description=(
+            "Number of output definitions rendered at the same time."
+            " Representations are added in the same order as with"
+            " a single job."
+        )
+    )
+    ffmpeg_threads: int = SettingsField(
+        0,
+        ge=0,
+        le=256,
+        title="Threads per ffmpeg job",
+        description=(
+            "Value passed to ffmpeg '-threads' argument. Zero keeps"
+            " ffmpeg default."
+        )
+    )
+    conversion_max_workers: int = SettingsField(
+        0,
+        ge=0,
+        le=256,
+        title="Concurrent oiiotool conversions",
+        description=(
+            "Number of input files converted for ffmpeg at the same time."
+            " Zero uses number of CPUs."
+        )
+    )
+    fill_gaps_method: str = SettingsField(
+        "link",
+        title="Fill sequence gaps with",
+        enum_resolver=lambda: _fill_gaps_methods_enum,
+        description=(
+            "Missing frames of input sequence are filled with nearest"
+            " previous frame. Links are created without copying the"
+            " frame, copy is used if links are not supported."
+        )
+    )
     profiles: list[ExtractReviewProfileModel] = SettingsField(
         default_factory=list,
         title="Profiles"
@@ -628,6 +675,16 @@ class ExtractBurninProfile(BaseSettingsModel):
 class ExtractBurninModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    conversion_max_workers: int = SettingsField(
+        0,
+        ge=0,
+        le=256,
+        title="Concurrent oiiotool conversions",
+        description=(
+            "Number of input files converted for ffmpeg at the same time."
+            " Zero uses number of CPUs."
+        )
+    )
     options: ExtractBurninOptionsModel = SettingsField(
         default_factory=ExtractBurninOptionsModel,
         title="Burnin formatting options"
@@ -773,6 +830,47 @@ class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = SettingsField("", title="Template name")
 
 
+_content_hash_algorithms_enum = [
+    {"value": "", "label": "Disabled (file stat based hash)"},
+    {"value": "md5", "label": "MD5"},
+    {"value": "sha256", "label": "SHA-256"},
+    {"value": "blake2b", "label": "BLAKE2b"},
+]
+
+
+class IntegrateAssetModel(BaseSettingsModel):
+    _isGroup = True
+    transfer_max_workers: int = SettingsField(
+        1,
+        ge=1,
+        le=64,
+        title="Concurrent file transfers",
+        description=(
+            "Number of published files copied at the same time. Higher"
+            " values can speed up publishing of large sequences"
+            " to network storage."
+        )
+    )
+    content_hash_algorithm: str = SettingsField(
+        "",
+        title="Content hash",
+        enum_resolver=lambda: _content_hash_algorithms_enum,
+        description=(
+            "Calculate content hash of published files while they are"
+            " copied. Hash of file stat is stored when disabled."
+        )
+    )
+    use_reflinks: bool = SettingsField(
+        False,
+        title="Use Reflinks",
+        description=(
+            "Create copy-on-write clones (reflinks) or use server-side copy"
+            " of published files when filesystem supports it. Falls back"
+            " to regular copy."
+        )
+    )
+
+
 class IntegrateHeroVersionModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
@@ -787,6 +885,22 @@ class IntegrateHeroVersionModel(BaseSettingsModel):
                     "Windows being unable to delete any of the hardlinks if "
                     "any of the links is in use creating issues with updating "
                     "hero versions.")
+    use_reflinks: bool = SettingsField(
+        False,
+        title="Use Reflinks",
+        description=(
+            "Create copy-on-write clones (reflinks) or use server-side copy"
+            " of hero files when filesystem supports it. Used if hardlinks"
+            " are disabled or failed. Falls back to regular copy."
+        )
+    )
+    transfer_max_workers: int = SettingsField(
+        1,
+        ge=1,
+        le=64,
+        title="Concurrent file transfers",
+        description="Number of hero files copied at the same time."
+    )
 
 
 class CleanUpModel(BaseSettingsModel):
@@ -884,6 +998,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateAssetModel = SettingsField(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = SettingsField(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -1021,6 +1139,10 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractReview": {
         "enabled": True,
+        "concurrent_jobs": 1,
+        "ffmpeg_threads": 0,
+        "conversion_max_workers": 0,
+        "fill_gaps_method": "link",
         "profiles": [
             {
                 "product_types": [],
@@ -1122,6 +1244,7 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractBurnin": {
         "enabled": True,
+        "conversion_max_workers": 0,
         "options": {
             "font_size": 42,
             "font_color": [255, 255, 255, 1.0],
@@ -1207,6 +1330,11 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "transfer_max_workers": 1,
+        "content_hash_algorithm": "",
+        "use_reflinks": False
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
@@ -1222,7 +1350,9 @@ DEFAULT_PUBLISH_VALUES = {
             "mayaScene",
             "simpleUnrealTexture"
         ],
-        "use_hardlinks": False
+        "use_hardlinks": False,
+        "use_reflinks": False,
+        "transfer_max_workers": 1
     },
     "CleanUp": {
         "paterns": [],